@@ -2,36 +2,25 @@
 from __future__ import annotations
 
 from datetime import date
-from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Path
 from pydantic import BaseModel, Field
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, load_only
 
 from app.db import get_session
 from app.models import Course, CourseModel, Enrollment, Notification, Student
-from app.rules.engine import RuleSet
+from app.rules.engine import RuleSet, get_default_ruleset
 from app.services import enrollments as enrollment_service
 
 router = APIRouter(prefix="/courses", tags=["courses"])
 
-_RULESET_CACHE: RuleSet | None = None
-
 
 def get_ruleset() -> RuleSet:
-    """Return cached enrollment rule set for course summaries."""
-
-    global _RULESET_CACHE
-    if _RULESET_CACHE is None:
-        _RULESET_CACHE = RuleSet.from_yaml(
-            Path(__file__).resolve().parents[1]
-            / "rules"
-            / "rulesets"
-            / "enrollments.yaml"
-        )
-    return _RULESET_CACHE
+    """Return the shared enrollment rule set for course summaries."""
+
+    return get_default_ruleset()
 
 
 class CourseUpdatePayload(BaseModel):
@@ -54,53 +43,34 @@ def list_courses(session: Session = Depends(get_session)) -> dict[str, Any]:
 
     ruleset = get_ruleset()
     courses = session.query(Course).order_by(Course.deadline_date.asc()).all()
-
-    enrollment_rows = (
-        session.query(Enrollment, Student, Course)
-        .join(Student, Enrollment.student_id == Student.id)
-        .join(Course, Enrollment.course_id == Course.id)
-        .all()
+    non_compliant_by_course = enrollment_service.count_non_compliant_by_course(
+        session, courses, ruleset
     )
 
-    enrollments_by_course: dict[int, list[tuple[Enrollment, Student, Course]]] = {}
-    for enrollment, student, course in enrollment_rows:
-        if course.id is None:
-            continue
-        enrollments_by_course.setdefault(course.id, []).append((enrollment, student, course))
+    enrollment_counts_by_course = _enrollment_counts_by_course(session)
+    notification_counts_by_course, notification_totals_by_course = (
+        _notifications_by_course(session)
+    )
 
-    notification_counts_by_course = _notifications_by_course(session)
+    course_payloads = CourseModel.dump_many(CourseModel.validate_many(courses))
 
     items: list[dict[str, Any]] = []
-    for course in courses:
-        course_payload = CourseModel.model_validate(course).model_dump()
-        enrolled = enrollments_by_course.get(course.id or 0, [])
-        evaluations = [
-            enrollment_service.evaluate_enrollment(
-                enrollment=enrollment,
-                student=student,
-                course=course,
-                ruleset=ruleset,
-            )
-            for enrollment, student, _ in enrolled
-        ]
-
-        non_compliant = sum(1 for ev in evaluations if ev.violations)
-        zero_hours = sum(
-            1
-            for ev in evaluations
-            if (ev.payload.get("progress_hours") or 0) <= 0
+    for course, course_payload in zip(courses, course_payloads):
+        non_compliant = non_compliant_by_course.get(course.id or 0, 0)
+        total_enrollments, zero_hours = enrollment_counts_by_course.get(
+            course.id or 0, (0, 0)
         )
 
         items.append(
             {
                 "course": course_payload,
                 "metrics": {
-                    "total_enrollments": len(enrolled),
+                    "total_enrollments": total_enrollments,
                     "non_compliant_enrollments": non_compliant,
                     "zero_hours_enrollments": zero_hours,
                 },
                 "notifications": {
-                    "total": sum(notification_counts_by_course.get(course.id or 0, {}).values()),
+                    "total": notification_totals_by_course.get(course.id or 0, 0),
                     "by_channel": notification_counts_by_course.get(course.id or 0, {}),
                 },
             }
@@ -126,6 +96,10 @@ def course_detail(
     rows = (
         session.query(Enrollment, Student)
         .join(Student, Enrollment.student_id == Student.id)
+        .options(
+            load_only(*enrollment_service.SERIALIZED_ENROLLMENT_COLUMNS),
+            load_only(*enrollment_service.SERIALIZED_STUDENT_COLUMNS),
+        )
         .filter(Enrollment.course_id == course_id)
         .all()
     )
@@ -186,16 +160,41 @@ def update_course(
         course.hours_required = payload.hours_required
         updated = True
 
+    # Serialize before committing: every column is already loaded and Course has
+    # no server-side onupdate values, so re-reading it after commit is wasted.
+    course_payload = CourseModel.model_validate(course).model_dump()
     if updated:
-        session.add(course)
         session.commit()
-        session.refresh(course)
 
-    return CourseModel.model_validate(course).model_dump()
+    return course_payload
+
+
+def _enrollment_counts_by_course(session: Session) -> dict[int, tuple[int, int]]:
+    """Count enrollments and enrollments without logged hours per course."""
+
+    rows = (
+        session.query(
+            Enrollment.course_id,
+            func.count(Enrollment.id),
+            func.sum(
+                case((func.coalesce(Enrollment.progress_hours, 0) <= 0, 1), else_=0)
+            ),
+        )
+        .join(Student, Enrollment.student_id == Student.id)
+        .filter(Enrollment.course_id.is_not(None))
+        .group_by(Enrollment.course_id)
+        .all()
+    )
+    return {
+        int(course_id): (int(total), int(zero_hours or 0))
+        for course_id, total, zero_hours in rows
+    }
 
 
-def _notifications_by_course(session: Session) -> dict[int, dict[str, int]]:
-    """Aggregate notification counts per course for summaries."""
+def _notifications_by_course(
+    session: Session,
+) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
+    """Aggregate notification counts per course and channel, plus per-course totals."""
 
     rows = (
         session.query(Course.id, Notification.channel, func.count(Notification.id))
@@ -211,7 +210,16 @@ def _notifications_by_course(session: Session) -> dict[int, dict[str, int]]:
             continue
         channel_counts = summary.setdefault(int(course_id), {})
         channel_counts[str(channel)] = int(count)
-    return summary
+
+    total_rows = (
+        session.query(Enrollment.course_id, func.count(Notification.id))
+        .join(Notification, Notification.enrollment_id == Enrollment.id)
+        .filter(Enrollment.course_id.is_not(None))
+        .group_by(Enrollment.course_id)
+        .all()
+    )
+    totals = {int(course_id): int(count) for course_id, count in total_rows}
+    return summary, totals
 
 
 __all__ = [
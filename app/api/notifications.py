@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import base64
+import time
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, event, literal, or_, select, union_all
 from sqlalchemy.orm import Session
 
 from app.db import get_session
@@ -14,6 +16,31 @@ from app.models import Notification, NotificationModel
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+METADATA_CACHE_TTL = 30.0  # seconds
+_METADATA_CACHE: tuple[float, dict[str, list[str]]] | None = None
+
+
+def clear_metadata_cache(*_args: Any) -> None:
+    """Forget cached filter metadata so the next request rescans the table."""
+
+    global _METADATA_CACHE
+    _METADATA_CACHE = None
+
+
+def _clear_on_bulk_insert(orm_execute_state: Any) -> None:
+    """Invalidate on ORM ``insert(Notification)``, which skips flush events."""
+
+    if (
+        orm_execute_state.is_insert
+        and orm_execute_state.bind_mapper is Notification.__mapper__
+    ):
+        clear_metadata_cache()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Notification, _event_name, clear_metadata_cache)
+event.listen(Session, "do_orm_execute", _clear_on_bulk_insert)
+
 
 @router.get("/", summary="Listado paginado de notificaciones")
 def list_notifications(
@@ -31,9 +58,18 @@ def list_notifications(
     date_to: str | None = Query(None, description="Fecha/hora máxima en ISO-8601"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None, description="Cursor opaco devuelto como next_cursor por la página previa"
+    ),
     session: Session = Depends(get_session),
 ) -> dict[str, Any]:
-    """Return a page of notification audits using the provided filters."""
+    """Return a page of notification audits using the provided filters.
+
+    Pages are ordered by ``(created_at, id)`` descending. Passing the previous
+    ``next_cursor`` seeks directly past the last row instead of scanning
+    ``offset`` rows; such follow-up pages skip the ``COUNT`` and return
+    ``total`` as ``None``.
+    """
 
     status = _unwrap_query(status)
     channel = _unwrap_query(channel)
@@ -46,6 +82,7 @@ def list_notifications(
     date_to = _unwrap_query(date_to)
     limit = _unwrap_int(limit, 50)
     offset = _unwrap_int(offset, 0)
+    cursor = _unwrap_query(cursor)
 
     query = session.query(Notification)
 
@@ -76,44 +113,84 @@ def list_notifications(
         if parsed:
             query = query.filter(Notification.created_at <= parsed)
 
-    total = query.count()
-    items = (
-        query.order_by(Notification.created_at.desc()).offset(offset).limit(limit).all()
-    )
+    query = query.order_by(Notification.created_at.desc(), Notification.id.desc())
 
-    payload = [NotificationModel.model_validate(item).model_dump() for item in items]
-    return {"total": total, "items": payload}
+    total: int | None = None
+    if cursor:
+        last_created_at, last_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                Notification.created_at < last_created_at,
+                and_(
+                    Notification.created_at == last_created_at,
+                    Notification.id < last_id,
+                ),
+            )
+        )
+    else:
+        total = query.order_by(None).count()
+        query = query.offset(offset)
+
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    items = rows[:limit]
+
+    payload = NotificationModel.dump_many(NotificationModel.validate_many(items))
+    return {
+        "total": total,
+        "items": payload,
+        "has_more": has_more,
+        "next_cursor": _encode_cursor(items[-1]) if has_more else None,
+    }
 
 
 @router.get("/metadata", summary="Valores disponibles para los filtros")
 def metadata(session: Session = Depends(get_session)) -> dict[str, list[str]]:
     """Return distinct values used by the audit listings for UI helpers."""
 
-    channels = [
-        row[0] for row in session.query(Notification.channel).distinct().all() if row[0]
-    ]
-    statuses = [
-        row[0] for row in session.query(Notification.status).distinct().all() if row[0]
-    ]
-    adapters = [
-        row[0] for row in session.query(Notification.adapter).distinct().all() if row[0]
-    ]
-    playbooks = [
-        row[0]
-        for row in session.query(Notification.playbook).distinct().all()
-        if row[0]
-    ]
-    job_ids = [
-        row[0] for row in session.query(Notification.job_id).distinct().all() if row[0]
-    ]
-
-    return {
-        "channels": sorted(channels),
-        "statuses": sorted(statuses),
-        "adapters": sorted(adapters),
-        "playbooks": sorted(playbooks),
-        "jobs": sorted(job_ids),
+    global _METADATA_CACHE
+    cached = _METADATA_CACHE
+    if cached is not None and time.monotonic() - cached[0] < METADATA_CACHE_TTL:
+        return cached[1]
+
+    fields = {
+        "channels": Notification.channel,
+        "statuses": Notification.status,
+        "adapters": Notification.adapter,
+        "playbooks": Notification.playbook,
+        "jobs": Notification.job_id,
     }
+    statement = union_all(
+        *(
+            select(literal(name).label("field"), column.label("value")).distinct()
+            for name, column in fields.items()
+        )
+    )
+
+    values: dict[str, list[str]] = {name: [] for name in fields}
+    for field, value in session.execute(statement):
+        if value:
+            values[field].append(value)
+
+    result = {name: sorted(items) for name, items in values.items()}
+    _METADATA_CACHE = (time.monotonic(), result)
+    return result
+
+
+def _encode_cursor(notification: Notification) -> str:
+    raw = f"{notification.created_at.isoformat()}|{notification.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, identifier = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(identifier)
+    except (ValueError, UnicodeError) as exc:
+        raise HTTPException(
+            status_code=400, detail="Cursor de paginación no válido"
+        ) from exc
 
 
 def _parse_datetime(value: str) -> datetime | None:
@@ -136,4 +213,4 @@ def _unwrap_int(value: Any, default: int) -> int:
         return default
 
 
-__all__ = ["router"]
+__all__ = ["router", "clear_metadata_cache"]
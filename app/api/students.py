@@ -2,30 +2,32 @@
 from __future__ import annotations
 
 from datetime import date
-from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, load_only
 
 from app.db import get_session
 from app.models import Course, Enrollment, Student
-from app.rules.engine import RuleSet
+from app.rules.engine import RuleSet, get_default_ruleset
 from app.services import enrollments as enrollment_service
 
 router = APIRouter(prefix="/students", tags=["students"])
 
-_RULESET_CACHE: RuleSet | None = None
-_RULESET_PATH = Path(__file__).resolve().parents[1] / "rules" / "rulesets" / "enrollments.yaml"
+_RULE_COLUMNS = {
+    "certificate_expires_at": Student.certificate_expires_at,
+    "deadline_date": Course.deadline_date,
+    "progress_hours": Enrollment.progress_hours,
+    "hours_required": Course.hours_required,
+    "status": Enrollment.status,
+}
 
 
 def get_ruleset() -> RuleSet:
-    """Carga perezosa del conjunto de reglas de vencimiento."""
+    """Devuelve el conjunto de reglas de vencimiento compartido."""
 
-    global _RULESET_CACHE
-    if _RULESET_CACHE is None:
-        _RULESET_CACHE = RuleSet.from_yaml(_RULESET_PATH)
-    return _RULESET_CACHE
+    return get_default_ruleset()
 
 
 @router.get(
@@ -78,6 +80,11 @@ def list_non_compliant_students(
         session.query(Enrollment, Student, Course)
         .join(Student, Enrollment.student_id == Student.id)
         .join(Course, Enrollment.course_id == Course.id, isouter=True)
+        .options(
+            load_only(*enrollment_service.SERIALIZED_ENROLLMENT_COLUMNS),
+            load_only(*enrollment_service.SERIALIZED_STUDENT_COLUMNS),
+            load_only(*enrollment_service.SERIALIZED_COURSE_COLUMNS),
+        )
     )
 
     if course:
@@ -94,30 +101,38 @@ def list_non_compliant_students(
     if max_hours is not None:
         query = query.filter(Enrollment.progress_hours <= max_hours)
 
-    query = query.order_by(Course.deadline_date.asc())
-
     ruleset = get_ruleset()
-    non_compliant_rows: list[dict[str, Any]] = []
-
-    for enrollment, student, course_obj in query.all():
-        evaluation = enrollment_service.evaluate_enrollment(
-            enrollment=enrollment,
-            student=student,
-            course=course_obj,
-            ruleset=ruleset,
+    rule_filter = _rule_sql_filter(ruleset, rule)
+
+    if rule_filter is not None:
+        # The lowered rules match exactly the rows Python would flag, so the
+        # database can count and paginate; only the page is evaluated.
+        query = query.filter(rule_filter)
+        total = (
+            query.with_entities(func.count(Enrollment.id)).order_by(None).scalar() or 0
         )
+        page = (
+            query.order_by(Course.deadline_date.asc(), Enrollment.id.asc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        items = [
+            _non_compliant_payload(evaluation)
+            for evaluation in _evaluate_rows(page, ruleset)
+        ]
+        return {"total": total, "items": items}
+
+    query = query.order_by(Course.deadline_date.asc(), Enrollment.id.asc())
+
+    non_compliant_rows: list[dict[str, Any]] = []
 
+    for evaluation in _evaluate_rows(query.all(), ruleset):
         if rule and not evaluation.rule_results.get(rule):
             continue
         if not evaluation.violations:
             continue
-
-        payload = dict(evaluation.payload)
-        payload.update({
-            "rule_results": evaluation.rule_results,
-            "violations": evaluation.violations,
-        })
-        non_compliant_rows.append(payload)
+        non_compliant_rows.append(_non_compliant_payload(evaluation))
 
     total = len(non_compliant_rows)
     paginated = non_compliant_rows[offset : offset + limit]
@@ -125,6 +140,46 @@ def list_non_compliant_students(
     return {"total": total, "items": paginated}
 
 
+def _evaluate_rows(
+    rows: list[tuple[Enrollment, Student, Course | None]], ruleset: Any
+) -> list[enrollment_service.EnrollmentEvaluation]:
+    return [
+        enrollment_service.evaluate_enrollment(
+            enrollment=enrollment,
+            student=student,
+            course=course_obj,
+            ruleset=ruleset,
+        )
+        for enrollment, student, course_obj in rows
+    ]
+
+
+def _non_compliant_payload(
+    evaluation: enrollment_service.EnrollmentEvaluation,
+) -> dict[str, Any]:
+    payload = dict(evaluation.payload)
+    payload.update({
+        "rule_results": evaluation.rule_results,
+        "violations": evaluation.violations,
+    })
+    return payload
+
+
+def _rule_sql_filter(ruleset: Any, rule: str | None) -> Any | None:
+    """Return a SQL pre-filter matching every row the rules would flag, if any."""
+
+    to_sql_filters = getattr(ruleset, "to_sql_filters", None)
+    if to_sql_filters is None:
+        return None
+
+    lowered = to_sql_filters(_RULE_COLUMNS)
+    if rule:
+        return lowered.get(rule)
+    if not lowered or any(clause is None for clause in lowered.values()):
+        return None
+    return or_(*lowered.values())
+
+
 def _parse_date(value: str | None) -> date | None:
     if not value:
         return None
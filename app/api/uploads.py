@@ -7,18 +7,21 @@ from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from ..db import get_session
+from ..jobs.ingest import ingest_upload, serialize_loader_result
 from ..logging import get_logger
 from ..models import UploadedFile
 from ..modules.ingest import course_loader
+from ..queue import ingest_queue
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 UPLOADS_DIR = PROJECT_ROOT / "uploads"
 ALLOWED_EXTENSIONS = {".xlsx"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5 MiB
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
 
 router = APIRouter(prefix="/uploads", tags=["uploads"])
@@ -44,12 +47,55 @@ def _validate_extension(filename: str | None) -> str:
     return extension
 
 
-@router.post("", summary="Subir fichero XLSX con matrículas Moodle")
+async def _stream_to_disk(file: UploadFile, destination: Path) -> int:
+    """Copy *file* to *destination* chunk by chunk, enforcing the size limits."""
+
+    file_size = 0
+    with destination.open("wb") as output:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_FILE_SIZE:
+                logger.warning(
+                    "uploads.xlsx.rejected",
+                    filename=file.filename,
+                    reason="file_too_large",
+                    size=file_size,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="El fichero supera el tamaño máximo permitido de 5MB.",
+                )
+            output.write(chunk)
+
+    if file_size == 0:
+        logger.warning(
+            "uploads.xlsx.rejected",
+            filename=file.filename,
+            reason="empty_file",
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El fichero está vacío.",
+        )
+
+    return file_size
+
+
+@router.post(
+    "",
+    summary="Subir fichero XLSX con matrículas Moodle",
+    response_model=None,
+)
 async def upload_file(
     file: UploadFile,
+    background: bool = False,
     db: Session = Depends(get_session),
-) -> dict[str, Any]:
-    """Validate, persist and parse a Moodle PRL spreadsheet upload."""
+) -> dict[str, Any] | JSONResponse:
+    """Validate, persist and parse a Moodle PRL spreadsheet upload.
+
+    With ``background=true`` the workbook is ingested by an RQ worker and the
+    endpoint answers ``202`` with the job id; poll ``GET /uploads/{id}``.
+    """
 
     logger.info(
         "uploads.xlsx.received",
@@ -67,40 +113,17 @@ async def upload_file(
         )
         raise
 
-    contents = await file.read()
-    file_size = len(contents)
-    logger.info(
-        "uploads.xlsx.buffered",
-        filename=file.filename,
-        size=file_size,
-    )
-    if file_size == 0:
-        logger.warning(
-            "uploads.xlsx.rejected",
-            filename=file.filename,
-            reason="empty_file",
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El fichero está vacío.",
-        )
-    if file_size > MAX_FILE_SIZE:
-        logger.warning(
-            "uploads.xlsx.rejected",
-            filename=file.filename,
-            reason="file_too_large",
-            size=file_size,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El fichero supera el tamaño máximo permitido de 5MB.",
-        )
-
     UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
     stored_name = f"{uuid4().hex}{extension}"
     stored_path = UPLOADS_DIR / stored_name
-    stored_path.write_bytes(contents)
-    await file.close()
+
+    try:
+        file_size = await _stream_to_disk(file, stored_path)
+    except HTTPException:
+        stored_path.unlink(missing_ok=True)
+        raise
+    finally:
+        await file.close()
 
     logger.info(
         "uploads.xlsx.saved",
@@ -121,11 +144,51 @@ async def upload_file(
     db.commit()
     db.refresh(upload)
 
+    if background:
+        # Commit "queued" before the worker can pick the job up, so its own
+        # status updates are never overwritten by this request.
+        upload.status = "queued"
+        db.commit()
+        payload = _serialize_upload(upload)
+        try:
+            job = ingest_queue.enqueue(
+                ingest_upload, upload.id, str(stored_path), file.filename
+            )
+        except Exception as exc:
+            upload.status = "failed"
+            upload.error = str(exc)
+            db.commit()
+            logger.exception(
+                "uploads.xlsx.enqueue_failed",
+                filename=file.filename,
+                stored_path=str(stored_path),
+                error=str(exc),
+            )
+            raise
+        logger.info(
+            "uploads.xlsx.ingest_queued",
+            filename=file.filename,
+            stored_path=str(stored_path),
+            job_id=job.id,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "file": payload,
+                "job_id": job.id,
+                "status": "queued",
+            },
+        )
+
     try:
         result = course_loader.ingest_workbook(
             stored_path, db=db, workbook_label=file.filename
         )
     except Exception as exc:
+        db.rollback()
+        upload.status = "failed"
+        upload.error = str(exc)
+        db.commit()
         logger.exception(
             "uploads.xlsx.ingest_failed",
             filename=file.filename,
@@ -134,6 +197,10 @@ async def upload_file(
         )
         raise
 
+    upload.status = "ingested"
+    upload.result = serialize_loader_result(result)
+    db.commit()
+
     summary = result.summary
     logger.info(
         "uploads.xlsx.ingest_completed",
@@ -145,14 +212,33 @@ async def upload_file(
         stats=asdict(result.stats),
     )
 
+    return {"file": _serialize_upload(upload), **upload.result}
+
+
+@router.get("/{upload_id}", summary="Estado de la ingesta de un fichero subido")
+def upload_status(upload_id: int, db: Session = Depends(get_session)) -> dict[str, Any]:
+    """Return the ingestion status and, once finished, its summary."""
+
+    upload = db.get(UploadedFile, upload_id)
+    if upload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Fichero no encontrado",
+        )
+
+    return {
+        "file": _serialize_upload(upload),
+        "status": upload.status,
+        "error": upload.error,
+        **(upload.result or {}),
+    }
+
+
+def _serialize_upload(upload: UploadedFile) -> dict[str, Any]:
     return {
-        "file": {
-            "id": upload.id,
-            "original_name": upload.original_name,
-            "stored_path": upload.stored_path,
-            "mime": upload.mime,
-            "size": upload.size,
-        },
-        "summary": jsonable_encoder(asdict(result.summary)),
-        "ingest": jsonable_encoder(asdict(result.stats)),
+        "id": upload.id,
+        "original_name": upload.original_name,
+        "stored_path": upload.stored_path,
+        "mime": upload.mime,
+        "size": upload.size,
     }
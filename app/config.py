@@ -1,7 +1,15 @@
 """Application configuration module."""
+import os
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _default_pool_size() -> int:
+    # Scheduler jobs fan out concurrently, each holding a session while it runs.
+    return max(10, 2 * (os.cpu_count() or 1))
+
+
 class Settings(BaseSettings):
     """Centralised application settings sourced from environment variables."""
 
@@ -11,11 +19,17 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./data/prl_notifier.db"
+    db_pool_size: int = Field(default_factory=_default_pool_size)
+    db_max_overflow: int = 20
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
 
     # External SQL bridge (optional)
     external_sql_enabled: bool = False
     external_sql_database_url: str | None = None
     external_sql_echo: bool = False
+    external_sql_pool_size: int = Field(default_factory=_default_pool_size)
+    external_sql_max_overflow: int = 20
 
     # Redis / Queue
     redis_url: str = "redis://localhost:6379/0"
@@ -1,10 +1,11 @@
 """Moodle connectors exposed for reuse across the application."""
 from .rest import MoodleRESTClient
-from .soap import MoodleSOAPClient
+from .soap import MoodleSOAPAsyncClient, MoodleSOAPClient
 from .exceptions import MoodleAPIError
 
 __all__ = [
     "MoodleAPIError",
     "MoodleRESTClient",
+    "MoodleSOAPAsyncClient",
     "MoodleSOAPClient",
 ]
@@ -1,6 +1,7 @@
 """Minimal SOAP connector to reach Moodle's legacy services."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -16,14 +17,72 @@ _SOAP_ENVELOPE_TEMPLATE = """
   <soapenv:Body>
     <core:{function}>
       <core:token>{token}</core:token>
-      {parameters}
-    </core:{function}>
+{parameters}    </core:{function}>
   </soapenv:Body>
 </soapenv:Envelope>
 """.strip()
 
+# Split once around the parameters slot; only the head and tail depend on the
+# function name, so they are rendered once per function and reused.
+_ENVELOPE_HEAD, _, _ENVELOPE_TAIL = _SOAP_ENVELOPE_TEMPLATE.partition("{parameters}")
 
-class MoodleSOAPClient:
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+_SOAP_HEADERS = {"Content-Type": "text/xml; charset=utf-8"}
+
+SOAP_TIMEOUT = 10.0
+SOAP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+
+
+@lru_cache(maxsize=None)
+def _shared_transport() -> httpx.Client:
+    """Return the process-wide keep-alive client shared by SOAP connectors.
+
+    Responses are tied to the connection that carried the request (httpx does
+    not pipeline), so concurrent ``call`` invocations can reuse the pool.
+    """
+
+    return httpx.Client(timeout=SOAP_TIMEOUT, limits=SOAP_POOL_LIMITS)
+
+
+class _SOAPEnvelopeBuilder:
+    """Envelope rendering and feature-flag checks shared by the SOAP clients."""
+
+    def __init__(self, wsdl_url: str, token: str, *, enabled: bool | None) -> None:
+        self.wsdl_url = wsdl_url
+        self.token = token
+        self._envelope_parts: dict[str, tuple[bytes, bytes]] = {}
+        self.enabled = settings.moodle_api_enabled if enabled is None else enabled
+
+    def _build_envelope(self, function: str, params: dict[str, Any]) -> bytes:
+        parts = self._envelope_parts.get(function)
+        if parts is None:
+            parts = (
+                _ENVELOPE_HEAD.format(
+                    function=function, token=str(self.token).translate(_XML_ESCAPE)
+                ).encode("utf-8"),
+                _ENVELOPE_TAIL.format(function=function).encode("utf-8"),
+            )
+            self._envelope_parts[function] = parts
+
+        head, tail = parts
+        serialized_parameters = "".join(
+            f"      <core:{key}>{str(value).translate(_XML_ESCAPE)}</core:{key}>\n"
+            for key, value in params.items()
+        )
+        # Only the parameters are encoded per call; head and tail are cached bytes.
+        return b"".join((head, serialized_parameters.encode("utf-8"), tail))
+
+    def _ensure_enabled(self) -> None:
+        if not self.enabled:
+            raise MoodleAPIError("El conector SOAP de Moodle está deshabilitado por feature flag")
+
+
+class MoodleSOAPClient(_SOAPEnvelopeBuilder):
     """Call Moodle SOAP endpoints with token authentication."""
 
     def __init__(
@@ -34,39 +93,70 @@ class MoodleSOAPClient:
         enabled: bool | None = None,
         transport: httpx.Client | None = None,
     ) -> None:
-        self.wsdl_url = wsdl_url
-        self.token = token
-        self.enabled = settings.moodle_api_enabled if enabled is None else enabled
-        self._transport = transport or httpx.Client(timeout=10.0)
+        super().__init__(wsdl_url, token, enabled=enabled)
+        # Injected transports are handed over to this client; the shared pool is not.
+        self._owns_transport = transport is not None
+        self._transport = transport or _shared_transport()
 
     def close(self) -> None:
-        """Dispose the underlying HTTP transport."""
+        """Dispose the HTTP transport unless it is shared with other clients."""
 
-        self._transport.close()
+        if self._owns_transport:
+            self._transport.close()
 
     def call(self, function: str, **params: Any) -> httpx.Response:
         """Invoke a SOAP function returning the raw :class:`httpx.Response`."""
 
         self._ensure_enabled()
         body = self._build_envelope(function, params)
-        headers = {"Content-Type": "text/xml; charset=utf-8"}
-        response = self._transport.post(self.wsdl_url, content=body, headers=headers)
+        response = self._transport.post(
+            self.wsdl_url, content=body, headers=_SOAP_HEADERS
+        )
         response.raise_for_status()
         return response
 
-    def _build_envelope(self, function: str, params: dict[str, Any]) -> str:
-        serialized_parameters = "\n".join(
-            f"      <core:{key}>{value}</core:{key}>" for key, value in params.items()
+
+class MoodleSOAPAsyncClient(_SOAPEnvelopeBuilder):
+    """Asynchronous variant of :class:`MoodleSOAPClient` for concurrent calls.
+
+    Async clients are bound to an event loop, so each instance owns its pool
+    (with the same limits as the shared sync transport) unless one is injected.
+    """
+
+    def __init__(
+        self,
+        wsdl_url: str,
+        token: str,
+        *,
+        enabled: bool | None = None,
+        transport: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(wsdl_url, token, enabled=enabled)
+        self._transport = transport or httpx.AsyncClient(
+            timeout=SOAP_TIMEOUT, limits=SOAP_POOL_LIMITS
         )
-        return _SOAP_ENVELOPE_TEMPLATE.format(
-            function=function,
-            token=self.token,
-            parameters=serialized_parameters,
+
+    async def aclose(self) -> None:
+        """Dispose the underlying HTTP transport."""
+
+        await self._transport.aclose()
+
+    async def call(self, function: str, **params: Any) -> httpx.Response:
+        """Invoke a SOAP function returning the raw :class:`httpx.Response`."""
+
+        self._ensure_enabled()
+        body = self._build_envelope(function, params)
+        response = await self._transport.post(
+            self.wsdl_url, content=body, headers=_SOAP_HEADERS
         )
+        response.raise_for_status()
+        return response
 
-    def _ensure_enabled(self) -> None:
-        if not self.enabled:
-            raise MoodleAPIError("El conector SOAP de Moodle está deshabilitado por feature flag")
+    async def __aenter__(self) -> "MoodleSOAPAsyncClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
 
 
-__all__ = ["MoodleSOAPClient"]
+__all__ = ["MoodleSOAPAsyncClient", "MoodleSOAPClient"]
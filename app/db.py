@@ -1,20 +1,77 @@
 """Database bootstrap utilities."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+try:  # pragma: no cover - prefer orjson when available
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - SQLAlchemy's stdlib json default
+    orjson = None  # type: ignore[assignment]
 from sqlalchemy import create_engine
-from sqlalchemy.engine import URL, make_url
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from .config import settings
 from .models import Base
 
+if TYPE_CHECKING:  # pragma: no cover - the asyncio extension needs greenlet
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 
-def _initialise_engine(database_url: str):
+def pool_options(url: URL, *, pool_size: int, max_overflow: int) -> dict[str, Any]:
+    """Return ``create_engine`` pool arguments for *url* from the settings.
+
+    SQLite keeps SQLAlchemy's default pools, which do not take these options.
+    """
+
+    if url.drivername.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_use_lifo": True,
+    }
+
+
+BULK_INSERT_PAGE_SIZE = 1000
+"""Rows per multi-VALUES ``INSERT`` emitted for ``executemany`` batches."""
+
+
+def bulk_execution_options(url: URL) -> dict[str, Any]:
+    """Return driver options that turn ``executemany`` into batched round-trips."""
+
+    driver = url.get_driver_name()
+    if driver == "psycopg2":
+        return {
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": BULK_INSERT_PAGE_SIZE,
+            "executemany_batch_page_size": 500,
+        }
+    if driver == "pyodbc":
+        return {"fast_executemany": True}
+    return {"insertmanyvalues_page_size": BULK_INSERT_PAGE_SIZE}
+
+
+def _orjson_serializer(value: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_options() -> dict[str, Any]:
+    """Return ``create_engine`` hooks that (de)serialise JSON columns with orjson."""
+
+    if orjson is None:
+        return {}
+    return {"json_serializer": _orjson_serializer, "json_deserializer": orjson.loads}
+
+
+def _initialise_engine(database_url: str) -> Engine:
     """Create the SQLAlchemy engine ensuring SQLite files exist."""
 
     url: URL = make_url(database_url)
@@ -30,7 +87,20 @@ def _initialise_engine(database_url: str):
             db_path.parent.mkdir(parents=True, exist_ok=True)
             url = url.set(database=str(db_path))
 
-    engine_kwargs: dict[str, Any] = {"future": True, "echo": False}
+    engine_kwargs: dict[str, Any] = {
+        "future": True,
+        "echo": False,
+        **pool_options(
+            url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+        ),
+        **bulk_execution_options(url),
+        **json_options(),
+    }
+    if url.drivername.startswith("sqlite") and url.database in {None, "", ":memory:"}:
+        # Every connection to an in-memory database is a new, empty database.
+        engine_kwargs["poolclass"] = StaticPool
     if connect_args:
         engine_kwargs["connect_args"] = connect_args
 
@@ -39,13 +109,76 @@ def _initialise_engine(database_url: str):
     return engine
 
 
-engine = _initialise_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Return the application engine, creating it on first use."""
+
+    return _initialise_engine(settings.database_url)
+
+
+@lru_cache(maxsize=None)
+def get_session_factory() -> sessionmaker[Session]:
+    """Return the shared session factory bound to :func:`get_engine`."""
+
+    # Keep loaded state after commit: server-generated columns are still expired
+    # on flush, so only values we already hold skip the re-SELECT.
+    return sessionmaker(
+        autocommit=False, autoflush=False, bind=get_engine(), expire_on_commit=False
+    )
+
+
+def async_database_url(database_url: str) -> URL:
+    """Return *database_url* rewritten for the asyncio driver of its backend.
+
+    Only PostgreSQL is supported: psycopg 3 (already a dependency) serves
+    both the sync and the async engine.
+    """
+
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        raise ValueError(
+            f"El motor asíncrono solo admite PostgreSQL, no {url.drivername!r}"
+        )
+    return url.set(drivername="postgresql+psycopg")
+
+
+@lru_cache(maxsize=None)
+def get_async_session_factory() -> "async_sessionmaker[AsyncSession]":
+    """Return an asyncio session factory for write paths that overlap I/O.
+
+    The engine shares the pool, bulk-insert and JSON options of
+    :func:`get_engine`; the schema itself is still managed by the sync engine.
+    """
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    url = async_database_url(settings.database_url)
+    engine = create_async_engine(
+        url,
+        **pool_options(
+            url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+        ),
+        **bulk_execution_options(url),
+        **json_options(),
+    )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def __getattr__(name: str) -> Any:
+    # ``engine`` and ``SessionLocal`` are resolved lazily (PEP 562) so importing
+    # this module does not load database drivers or touch the database.
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_session():
     """Yield a database session for request lifecycle management."""
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
@@ -2,7 +2,7 @@
 
 from .models import PrevengosTrainingRecord
 from .csv_adapter import PrevengosCSVAdapter
-from .api_client import PrevengosAPIClient
+from .api_client import PrevengosAPIAsyncClient, PrevengosAPIClient
 from .db_adapter import PrevengosDBAdapter
 from .service import PrevengosSyncService
 from .exceptions import PrevengosIntegrationError
@@ -11,6 +11,7 @@ __all__ = [
     "PrevengosTrainingRecord",
     "PrevengosCSVAdapter",
     "PrevengosAPIClient",
+    "PrevengosAPIAsyncClient",
     "PrevengosDBAdapter",
     "PrevengosSyncService",
     "PrevengosIntegrationError",
@@ -2,13 +2,48 @@
 
 from __future__ import annotations
 
+from itertools import islice
+from types import MappingProxyType
 from typing import Iterable, List, Mapping, MutableMapping, Optional
 
 import httpx
+import orjson
 
 from .exceptions import PrevengosAPIError
 from .models import PrevengosTrainingRecord
 
+PUSH_CHUNK_SIZE = 1000
+API_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+
+
+def _build_headers(token: str | None) -> Mapping[str, str]:
+    headers: MutableMapping[str, str] = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return MappingProxyType(headers)
+
+
+def _encode_records(records: List[PrevengosTrainingRecord]) -> bytes:
+    return orjson.dumps([record.to_payload() for record in records])
+
+
+def _contract_from_response(response: httpx.Response) -> Mapping[str, object]:
+    data = response.json()
+    if not isinstance(data, Mapping):  # pragma: no cover - defensive
+        raise PrevengosAPIError("Prevengos API returned a non-object response")
+    return data
+
+
+def _records_from_response(response: httpx.Response) -> List[Mapping[str, object]]:
+    data = response.json()
+    if not isinstance(data, list):  # pragma: no cover - defensive
+        raise PrevengosAPIError("Prevengos API returned a non-array response")
+    return [record for record in data if isinstance(record, Mapping)]
+
 
 class PrevengosAPIClient:
     """Thin wrapper around the Prevengos JSON API."""
@@ -24,6 +59,7 @@ class PrevengosAPIClient:
         self._owns_client = client is None
         self._client = client or httpx.Client(base_url=base_url, timeout=timeout)
         self._token = token
+        self._headers: Mapping[str, str] = _build_headers(token)
 
     def close(self) -> None:
         """Release underlying HTTP resources if we created the client."""
@@ -31,46 +67,49 @@ class PrevengosAPIClient:
         if self._owns_client:
             self._client.close()
 
-    def _auth_headers(self) -> MutableMapping[str, str]:
-        headers: MutableMapping[str, str] = {"Content-Type": "application/json"}
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
-
     def fetch_contract(self, contract_code: str) -> Mapping[str, object]:
         """Retrieve contract metadata from Prevengos."""
 
         try:
             response = self._client.get(
-                f"/contracts/{contract_code}", headers=self._auth_headers()
+                f"/contracts/{contract_code}", headers=self._headers
             )
             response.raise_for_status()
         except httpx.HTTPError as exc:  # pragma: no cover - network protection
             raise PrevengosAPIError(f"Prevengos API request failed: {exc}") from exc
-        data = response.json()
-        if not isinstance(data, Mapping):  # pragma: no cover - defensive
-            raise PrevengosAPIError("Prevengos API returned a non-object response")
-        return data
+        return _contract_from_response(response)
 
     def push_training_records(
-        self, records: Iterable[PrevengosTrainingRecord]
+        self,
+        records: Iterable[PrevengosTrainingRecord],
+        *,
+        chunk_size: int = PUSH_CHUNK_SIZE,
     ) -> List[Mapping[str, object]]:
-        """Send training records to Prevengos using the JSON API."""
+        """Send training records to Prevengos using the JSON API.
 
-        payload = [record.to_payload() for record in records]
+        Records are posted in chunks of ``chunk_size`` over the same keep-alive
+        connection so only one chunk is encoded in memory at a time.
+        """
+
+        results: List[Mapping[str, object]] = []
+        iterator = iter(records)
+        while chunk := list(islice(iterator, chunk_size)):
+            results.extend(self._post_training_chunk(chunk))
+        return results
+
+    def _post_training_chunk(
+        self, chunk: List[PrevengosTrainingRecord]
+    ) -> List[Mapping[str, object]]:
         try:
             response = self._client.post(
                 "/training-records",
-                json=payload,
-                headers=self._auth_headers(),
+                content=_encode_records(chunk),
+                headers=self._headers,
             )
             response.raise_for_status()
         except httpx.HTTPError as exc:  # pragma: no cover - network protection
             raise PrevengosAPIError(f"Prevengos API request failed: {exc}") from exc
-        data = response.json()
-        if not isinstance(data, list):  # pragma: no cover - defensive
-            raise PrevengosAPIError("Prevengos API returned a non-array response")
-        return [record for record in data if isinstance(record, Mapping)]
+        return _records_from_response(response)
 
     def __enter__(self) -> "PrevengosAPIClient":
         return self
@@ -78,3 +117,69 @@ class PrevengosAPIClient:
     def __exit__(self, *_: object) -> Optional[bool]:
         self.close()
         return None
+
+
+class PrevengosAPIAsyncClient:
+    """Asynchronous variant of :class:`PrevengosAPIClient` for concurrent calls."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        *,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            base_url=base_url, timeout=timeout, limits=API_POOL_LIMITS
+        )
+        self._token = token
+        self._headers: Mapping[str, str] = _build_headers(token)
+
+    async def aclose(self) -> None:
+        """Release underlying HTTP resources if we created the client."""
+
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def fetch_contract(self, contract_code: str) -> Mapping[str, object]:
+        """Retrieve contract metadata from Prevengos."""
+
+        try:
+            response = await self._client.get(
+                f"/contracts/{contract_code}", headers=self._headers
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:  # pragma: no cover - network protection
+            raise PrevengosAPIError(f"Prevengos API request failed: {exc}") from exc
+        return _contract_from_response(response)
+
+    async def push_training_records(
+        self,
+        records: Iterable[PrevengosTrainingRecord],
+        *,
+        chunk_size: int = PUSH_CHUNK_SIZE,
+    ) -> List[Mapping[str, object]]:
+        """Send training records to Prevengos in chunks of ``chunk_size``."""
+
+        results: List[Mapping[str, object]] = []
+        iterator = iter(records)
+        while chunk := list(islice(iterator, chunk_size)):
+            try:
+                response = await self._client.post(
+                    "/training-records",
+                    content=_encode_records(chunk),
+                    headers=self._headers,
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as exc:  # pragma: no cover - network protection
+                raise PrevengosAPIError(f"Prevengos API request failed: {exc}") from exc
+            results.extend(_records_from_response(response))
+        return results
+
+    async def __aenter__(self) -> "PrevengosAPIAsyncClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
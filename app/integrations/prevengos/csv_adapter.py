@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Iterable, List
+from typing import Collection, Iterable, Iterator, List
 
 from .exceptions import PrevengosCSVError
-from .models import PrevengosTrainingRecord
+from .models import CSV_COLUMNS, PrevengosTrainingRecord
+
+_RESERVED_COLUMNS = frozenset(CSV_COLUMNS)
 
 
 class PrevengosCSVAdapter:
@@ -16,49 +18,92 @@ class PrevengosCSVAdapter:
     def __init__(self, path: Path, encoding: str = "utf-8-sig") -> None:
         self.path = Path(path)
         self.encoding = encoding
-        self.fieldnames = [
-            "employee_nif",
-            "contract_code",
-            "course_code",
-            "status",
-            "hours_completed",
-            "last_update",
-        ]
+        self.fieldnames = list(CSV_COLUMNS)
 
-    def read_records(self) -> List[PrevengosTrainingRecord]:
-        """Load records from the CSV file, returning an empty list if it does not exist."""
+    def iter_records(self) -> Iterator[PrevengosTrainingRecord]:
+        """Yield records one by one from the CSV file, if it exists."""
 
         if not self.path.exists():
-            return []
+            return
 
         try:
             with self.path.open("r", encoding=self.encoding, newline="") as file:
-                reader = csv.DictReader(file)
-                records = [PrevengosTrainingRecord.from_csv_row(row) for row in reader]
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is None:
+                    return
+                index = {name: position for position, name in enumerate(header)}
+                positions = [index[name] for name in CSV_COLUMNS]
+                extra_columns = [
+                    (name, position)
+                    for position, name in enumerate(header)
+                    if name not in _RESERVED_COLUMNS
+                ]
+                for values in reader:
+                    if values:
+                        yield PrevengosTrainingRecord.from_csv_values(
+                            values, positions, extra_columns
+                        )
         except (OSError, ValueError, KeyError) as exc:  # pragma: no cover - defensive
             raise PrevengosCSVError(f"Unable to read Prevengos CSV: {exc}") from exc
-        return records
+
+    def read_records(self) -> List[PrevengosTrainingRecord]:
+        """Load records from the CSV file, returning an empty list if it does not exist."""
+
+        return list(self.iter_records())
 
     def write_records(self, records: Iterable[PrevengosTrainingRecord]) -> None:
         """Persist the provided records overriding the file contents."""
 
+        if not isinstance(records, Collection):
+            records = list(records)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        rows = [record.to_csv_row() for record in records]
-        fieldnames = self._merge_fieldnames(rows)
+        extra_fieldnames = self._extra_fieldnames(records)
         try:
             with self.path.open("w", encoding=self.encoding, newline="") as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+                writer = csv.writer(file)
+                writer.writerow([*CSV_COLUMNS, *extra_fieldnames])
+                writer.writerows(
+                    record.to_csv_values(extra_fieldnames) for record in records
+                )
         except OSError as exc:  # pragma: no cover - defensive
             raise PrevengosCSVError(f"Unable to write Prevengos CSV: {exc}") from exc
 
-    def _merge_fieldnames(self, rows: List[dict]) -> List[str]:
-        """Ensure dynamic fields from the `extra` payload are preserved."""
+    def append_records(self, records: Collection[PrevengosTrainingRecord]) -> bool:
+        """Append *records* to an existing file without rewriting it.
+
+        Returns ``False`` (writing nothing) when the file is missing, its
+        header does not start with the standard columns or lacks a column the
+        records need; callers then fall back to :meth:`write_records`.
+        """
+
+        if not self.path.exists():
+            return False
+        try:
+            with self.path.open("r+", encoding=self.encoding, newline="") as file:
+                header = next(csv.reader(file), None)
+                if not header or tuple(header[: len(CSV_COLUMNS)]) != CSV_COLUMNS:
+                    return False
+                extra_fieldnames = header[len(CSV_COLUMNS) :]
+                if not set(self._extra_fieldnames(records)) <= set(extra_fieldnames):
+                    return False
+                file.seek(0, 2)
+                csv.writer(file).writerows(
+                    record.to_csv_values(extra_fieldnames) for record in records
+                )
+        except OSError as exc:  # pragma: no cover - defensive
+            raise PrevengosCSVError(f"Unable to append Prevengos CSV: {exc}") from exc
+        return True
+
+    @staticmethod
+    def _extra_fieldnames(records: Collection[PrevengosTrainingRecord]) -> List[str]:
+        """Collect dynamic fields from the `extra` payloads, in first-seen order.
+
+        A dict keeps the union ordered (a set would shuffle columns between
+        runs) with O(1) membership; records without extras are skipped.
+        """
 
-        fieldnames = list(self.fieldnames)
-        for row in rows:
-            for key in row:
-                if key not in fieldnames:
-                    fieldnames.append(key)
-        return fieldnames
+        fieldnames: dict[str, None] = {}
+        for extra in (record.extra for record in records if record.extra):
+            fieldnames.update(dict.fromkeys(extra))
+        return [name for name in fieldnames if name not in _RESERVED_COLUMNS]
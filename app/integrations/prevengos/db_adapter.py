@@ -2,26 +2,78 @@
 
 from __future__ import annotations
 
-from contextlib import closing
 from datetime import datetime
-from typing import Callable, Iterable, List, Sequence
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
 
 from .exceptions import PrevengosDatabaseError
-from .models import ISO_FORMAT, PrevengosTrainingRecord
+from .models import PrevengosTrainingRecord, format_timestamp
 
 ConnectionFactory = Callable[[], object]
 
+FETCH_BATCH_SIZE = 1000
+UPSERT_BATCH_SIZE = 1000
+
+_CREATE_STAGING_SQL = (
+    "CREATE TABLE #prl_training_staging ("
+    "employee_nif NVARCHAR(64) NOT NULL, contract_code NVARCHAR(64) NOT NULL, "
+    "course_code NVARCHAR(64) NOT NULL, status NVARCHAR(64) NOT NULL, "
+    "hours_completed FLOAT NOT NULL, last_update NVARCHAR(40) NOT NULL)"
+)
+_INSERT_STAGING_SQL = (
+    "INSERT INTO #prl_training_staging (employee_nif, contract_code, course_code, "
+    "status, hours_completed, last_update) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_MERGE_STAGING_SQL = (
+    "SET NOCOUNT ON; "
+    "DECLARE @actions TABLE (action NVARCHAR(10)); "
+    "MERGE prl_training_status AS target "
+    "USING #prl_training_staging AS source "
+    "ON (target.employee_nif = source.employee_nif "
+    "AND target.contract_code = source.contract_code "
+    "AND target.course_code = source.course_code) "
+    "WHEN MATCHED THEN UPDATE SET status = source.status, "
+    "hours_completed = source.hours_completed, last_update = source.last_update "
+    "WHEN NOT MATCHED THEN INSERT (employee_nif, contract_code, course_code, status, hours_completed, last_update) "
+    "VALUES (source.employee_nif, source.contract_code, source.course_code, source.status, source.hours_completed, source.last_update) "
+    "OUTPUT $action INTO @actions; "
+    "SELECT COUNT(*) FROM @actions;"
+)
+_DROP_STAGING_SQL = "DROP TABLE #prl_training_staging"
+
 
 class PrevengosDBAdapter:
     """Execute parametrised queries against the Prevengos SQL Server database."""
 
     def __init__(self, connection_factory: ConnectionFactory) -> None:
         self._connection_factory = connection_factory
+        self._connection: Any = None
 
-    def fetch_training_records(
+    def close(self) -> None:
+        """Close the connection kept open between calls, if any."""
+
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+    def _get_connection(self) -> Any:
+        # Reuse one connection across fetch/upsert calls so a sync run pays the
+        # ODBC/TLS handshake once; it is dropped again after any failure.
+        if self._connection is None:
+            self._connection = self._connection_factory()
+        return self._connection
+
+    def __enter__(self) -> "PrevengosDBAdapter":
+        return self
+
+    def __exit__(self, *_: object) -> Optional[bool]:
+        self.close()
+        return None
+
+    def iter_training_records(
         self, *, since: datetime | None = None
-    ) -> List[PrevengosTrainingRecord]:
-        """Retrieve training records published by Prevengos."""
+    ) -> Iterator[PrevengosTrainingRecord]:
+        """Yield training records published by Prevengos, one batch at a time."""
 
         query = (
             "SELECT employee_nif, contract_code, course_code, status, "
@@ -30,68 +82,70 @@ class PrevengosDBAdapter:
         params: Sequence[object] = ()
         if since is not None:
             query += " WHERE last_update >= ?"
-            params = (since.strftime(ISO_FORMAT),)
+            params = (format_timestamp(since),)
+        # Oldest first, so the newest row for a key is always the last one seen.
+        query += " ORDER BY last_update ASC"
 
         try:
-            connection = self._connection_factory()
-            with closing(connection):
-                cursor = connection.cursor()
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
+            cursor = self._get_connection().cursor()
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(query, params)
+            while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+                for row in rows:
+                    yield PrevengosTrainingRecord.from_row(row)
         except Exception as exc:  # pragma: no cover - DB protection
+            self.close()
             raise PrevengosDatabaseError(f"Prevengos DB query failed: {exc}") from exc
 
-        records = [
-            PrevengosTrainingRecord.from_payload(
-                {
-                    "employee_nif": row[0],
-                    "contract_code": row[1],
-                    "course_code": row[2],
-                    "status": row[3],
-                    "hours_completed": row[4],
-                    "last_update": row[5],
-                }
-            )
-            for row in rows
-        ]
-        return records
+    def fetch_training_records(
+        self, *, since: datetime | None = None
+    ) -> List[PrevengosTrainingRecord]:
+        """Retrieve training records published by Prevengos."""
+
+        return list(self.iter_training_records(since=since))
 
     def upsert_training_records(
         self, records: Iterable[PrevengosTrainingRecord]
     ) -> int:
-        """Write records into a staging table authorised by Prevengos."""
+        """Write records into a staging table authorised by Prevengos.
 
-        query = (
-            "MERGE prl_training_status AS target "
-            "USING (VALUES (?, ?, ?, ?, ?, ?)) AS source("\
-            "employee_nif, contract_code, course_code, status, hours_completed, last_update"\
-            ") ON (target.employee_nif = source.employee_nif "
-            "AND target.contract_code = source.contract_code "
-            "AND target.course_code = source.course_code) "
-            "WHEN MATCHED THEN UPDATE SET status = source.status, "
-            "hours_completed = source.hours_completed, last_update = source.last_update "
-            "WHEN NOT MATCHED THEN INSERT (employee_nif, contract_code, course_code, status, hours_completed, last_update) "
-            "VALUES (source.employee_nif, source.contract_code, source.course_code, source.status, source.hours_completed, source.last_update);"
-        )
+        Rows are bulk-loaded into a session temp table and merged with a single
+        ``MERGE`` whose ``OUTPUT`` clause lets the server count affected rows.
+        Repeated keys keep only their last record, as ``MERGE`` rejects a source
+        that matches the same target row twice.
+        """
+
+        latest = {record.identity_key(): record for record in records}
 
         try:
-            connection = self._connection_factory()
-            with closing(connection):
-                cursor = connection.cursor()
-                rows_affected = 0
-                for record in records:
-                    payload = record.to_payload()
-                    params = (
-                        payload["employee_nif"],
-                        payload["contract_code"],
-                        payload["course_code"],
-                        payload["status"],
-                        payload["hours_completed"],
-                        payload["last_update"],
-                    )
-                    cursor.execute(query, params)
-                    rows_affected += cursor.rowcount
-                cursor.connection.commit()
+            cursor = self._get_connection().cursor()
+            try:
+                # pyodbc sends each executemany batch as a single round-trip.
+                cursor.fast_executemany = True
+            except AttributeError:
+                pass
+            cursor.execute(_CREATE_STAGING_SQL)
+            params_iter = (_upsert_params(record) for record in latest.values())
+            while batch := list(islice(params_iter, UPSERT_BATCH_SIZE)):
+                cursor.executemany(_INSERT_STAGING_SQL, batch)
+            cursor.execute(_MERGE_STAGING_SQL)
+            row = cursor.fetchone()
+            rows_affected = int(row[0]) if row else 0
+            cursor.execute(_DROP_STAGING_SQL)
+            cursor.connection.commit()
         except Exception as exc:  # pragma: no cover - DB protection
+            self.close()
             raise PrevengosDatabaseError(f"Prevengos DB upsert failed: {exc}") from exc
         return rows_affected
+
+
+def _upsert_params(record: PrevengosTrainingRecord) -> tuple[object, ...]:
+    payload = record.to_payload()
+    return (
+        payload["employee_nif"],
+        payload["contract_code"],
+        payload["course_code"],
+        payload["status"],
+        payload["hours_completed"],
+        payload["last_update"],
+    )
@@ -2,12 +2,71 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
+CSV_COLUMNS: Tuple[str, ...] = (
+    "employee_nif",
+    "contract_code",
+    "course_code",
+    "status",
+    "hours_completed",
+    "last_update",
+)
+"""Fixed leading columns of Prevengos CSV files, in file order."""
+
+_RESERVED_KEYS = frozenset(CSV_COLUMNS)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an :data:`ISO_FORMAT` timestamp without going through ``strptime``."""
+
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        raise ValueError(f"Timestamp {value!r} lacks a UTC offset")
+    return parsed
+
+
+def format_timestamp(value: datetime) -> str:
+    """Render *value* exactly like ``value.strftime(ISO_FORMAT)``, only faster."""
+
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+        f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+        f"{_format_offset(value.utcoffset())}"
+    )
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+@lru_cache(maxsize=64)
+def _format_offset(offset: timedelta | None) -> str:
+    if offset is None:
+        return ""
+    sign = "-" if offset < timedelta(0) else "+"
+    offset = abs(offset)
+    hours, remainder = divmod(offset, timedelta(hours=1))
+    minutes, remainder = divmod(remainder, timedelta(minutes=1))
+    suffix = f"{sign}{hours:02d}{minutes:02d}"
+    if remainder:
+        suffix += f"{remainder.seconds:02d}"
+        if remainder.microseconds:
+            suffix += f".{remainder.microseconds:06d}"
+    return suffix
+
 
 @dataclass(slots=True)
 class PrevengosTrainingRecord:
@@ -20,11 +79,22 @@ class PrevengosTrainingRecord:
     hours_completed: float
     last_update: datetime
     extra: Dict[str, Any] = field(default_factory=dict)
+    _identity: Tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    last_update_us: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Integer UTC microseconds make ordering checks plain int comparisons;
+        # ``last_update`` keeps the original offset for serialization.
+        self.last_update_us = _epoch_micros(self.last_update)
 
     def identity_key(self) -> Tuple[str, str, str]:
         """Return the unique identifier composed by employee, contract and course."""
 
-        return self.employee_nif, self.contract_code, self.course_code
+        if self._identity is None:
+            self._identity = (self.employee_nif, self.contract_code, self.course_code)
+        return self._identity
 
     def to_csv_row(self) -> Dict[str, str]:
         """Serialize the record into a CSV friendly dictionary."""
@@ -35,12 +105,29 @@ class PrevengosTrainingRecord:
             "course_code": self.course_code,
             "status": self.status,
             "hours_completed": f"{self.hours_completed:.2f}",
-            "last_update": self.last_update.strftime(ISO_FORMAT),
+            "last_update": format_timestamp(self.last_update),
         }
         for key, value in self.extra.items():
             row[key] = "" if value is None else str(value)
         return row
 
+    def to_csv_values(self, extra_fieldnames: Sequence[str] = ()) -> List[str]:
+        """Serialize the record as a positional row: :data:`CSV_COLUMNS` + extras."""
+
+        values = [
+            self.employee_nif,
+            self.contract_code,
+            self.course_code,
+            self.status,
+            f"{self.hours_completed:.2f}",
+            format_timestamp(self.last_update),
+        ]
+        extra = self.extra
+        for name in extra_fieldnames:
+            value = extra.get(name)
+            values.append("" if value is None else str(value))
+        return values
+
     def to_payload(self) -> Dict[str, Any]:
         """Serialize the record for JSON payloads."""
 
@@ -50,7 +137,7 @@ class PrevengosTrainingRecord:
             "course_code": self.course_code,
             "status": self.status,
             "hours_completed": self.hours_completed,
-            "last_update": self.last_update.strftime(ISO_FORMAT),
+            "last_update": format_timestamp(self.last_update),
         }
         payload.update(self.extra)
         return payload
@@ -59,56 +146,82 @@ class PrevengosTrainingRecord:
     def from_csv_row(cls, row: Dict[str, str]) -> "PrevengosTrainingRecord":
         """Build a record from a CSV row."""
 
-        extra = {
-            key: value
-            for key, value in row.items()
-            if key
-            not in {
-                "employee_nif",
-                "contract_code",
-                "course_code",
-                "status",
-                "hours_completed",
-                "last_update",
-            }
-        }
+        extra = {key: value for key, value in row.items() if key not in _RESERVED_KEYS}
         return cls(
-            employee_nif=row["employee_nif"].strip(),
-            contract_code=row["contract_code"].strip(),
-            course_code=row["course_code"].strip(),
+            employee_nif=sys.intern(row["employee_nif"].strip()),
+            contract_code=sys.intern(row["contract_code"].strip()),
+            course_code=sys.intern(row["course_code"].strip()),
             status=row["status"].strip(),
             hours_completed=float(row["hours_completed"] or 0),
-            last_update=datetime.strptime(row["last_update"], ISO_FORMAT),
+            last_update=parse_timestamp(row["last_update"]),
             extra=extra,
         )
 
+    @classmethod
+    def from_csv_values(
+        cls,
+        values: Sequence[str],
+        positions: Sequence[int],
+        extra_columns: Sequence[Tuple[str, int]] = (),
+    ) -> "PrevengosTrainingRecord":
+        """Build a record from a positional CSV row.
+
+        ``positions`` holds the index of each :data:`CSV_COLUMNS` entry in the
+        file header and ``extra_columns`` the ``(name, index)`` of any others.
+        """
+
+        nif, contract, course, status, hours, last_update = (
+            values[index] for index in positions
+        )
+        size = len(values)
+        return cls(
+            employee_nif=sys.intern(nif.strip()),
+            contract_code=sys.intern(contract.strip()),
+            course_code=sys.intern(course.strip()),
+            status=status.strip(),
+            hours_completed=float(hours or 0),
+            last_update=parse_timestamp(last_update),
+            extra={
+                name: values[index] if index < size else None
+                for name, index in extra_columns
+            },
+        )
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "PrevengosTrainingRecord":
+        """Build a record from a ``(nif, contract, course, status, hours, last_update)`` row."""
+
+        last_update = row[5]
+        return cls(
+            employee_nif=sys.intern(str(row[0]).strip()),
+            contract_code=sys.intern(str(row[1]).strip()),
+            course_code=sys.intern(str(row[2]).strip()),
+            status=str(row[3]).strip(),
+            hours_completed=float(row[4] or 0),
+            last_update=(
+                parse_timestamp(last_update)
+                if isinstance(last_update, str)
+                else last_update
+            ),
+        )
+
     @classmethod
     def from_payload(cls, payload: Dict[str, Any]) -> "PrevengosTrainingRecord":
         """Build a record from a JSON payload coming from the API or DB."""
 
         extra = {
-            key: value
-            for key, value in payload.items()
-            if key
-            not in {
-                "employee_nif",
-                "contract_code",
-                "course_code",
-                "status",
-                "hours_completed",
-                "last_update",
-            }
+            key: value for key, value in payload.items() if key not in _RESERVED_KEYS
         }
         last_update_raw = payload["last_update"]
         last_update = (
-            datetime.strptime(last_update_raw, ISO_FORMAT)
+            parse_timestamp(last_update_raw)
             if isinstance(last_update_raw, str)
             else last_update_raw
         )
         return cls(
-            employee_nif=str(payload["employee_nif"]).strip(),
-            contract_code=str(payload["contract_code"]).strip(),
-            course_code=str(payload["course_code"]).strip(),
+            employee_nif=sys.intern(str(payload["employee_nif"]).strip()),
+            contract_code=sys.intern(str(payload["contract_code"]).strip()),
+            course_code=sys.intern(str(payload["course_code"]).strip()),
             status=str(payload["status"]).strip(),
             hours_completed=float(payload.get("hours_completed", 0)),
             last_update=last_update,
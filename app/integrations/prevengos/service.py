@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Iterable, List, Mapping
 
-from .api_client import PrevengosAPIClient
+from .api_client import PrevengosAPIAsyncClient, PrevengosAPIClient
 from .csv_adapter import PrevengosCSVAdapter
 from .db_adapter import PrevengosDBAdapter
 from .exceptions import PrevengosIntegrationError
@@ -21,10 +22,12 @@ class PrevengosSyncService:
         csv_adapter: PrevengosCSVAdapter,
         api_client: PrevengosAPIClient | None = None,
         db_adapter: PrevengosDBAdapter | None = None,
+        async_api_client: PrevengosAPIAsyncClient | None = None,
     ) -> None:
         self.csv_adapter = csv_adapter
         self.api_client = api_client
         self.db_adapter = db_adapter
+        self.async_api_client = async_api_client
 
     def export_records(
         self,
@@ -59,17 +62,31 @@ class PrevengosSyncService:
                 "Cannot reconcile Prevengos database without a DB adapter"
             )
         current_records = {
-            record.identity_key(): record for record in self.csv_adapter.read_records()
+            record.identity_key(): record for record in self.csv_adapter.iter_records()
         }
-        db_records = self.db_adapter.fetch_training_records(since=since)
-        changed = False
-        for record in db_records:
+        added: dict[tuple[str, str, str], PrevengosTrainingRecord] = {}
+        updated = False
+        for record in self.db_adapter.iter_training_records(since=since):
             key = record.identity_key()
-            existing = current_records.get(key)
-            if existing is None or record.last_update > existing.last_update:
-                current_records[key] = record
-                changed = True
-        if changed:
+            if key in added:
+                # Text timestamps with mixed offsets do not sort chronologically,
+                # so compare instants; on a tie the later row wins.
+                if record.last_update_us < added[key].last_update_us:
+                    continue
+                added[key] = record
+            else:
+                existing = current_records.get(key)
+                if existing is None:
+                    added[key] = record
+                elif record.last_update_us > existing.last_update_us:
+                    updated = True
+                else:
+                    continue
+            current_records[key] = record
+
+        # Only a change to existing rows forces a full rewrite; pure additions
+        # are appended to the current file when its header allows it.
+        if updated or (added and not self.csv_adapter.append_records(added.values())):
             self.csv_adapter.write_records(current_records.values())
         return list(current_records.values())
 
@@ -82,8 +99,25 @@ class PrevengosSyncService:
             )
         return self.api_client.fetch_contract(contract_code)
 
+    async def fetch_contracts_metadata(
+        self, contract_codes: Iterable[str]
+    ) -> dict[str, Mapping[str, object]]:
+        """Fetch metadata for several contracts concurrently."""
+
+        if not self.async_api_client:
+            raise PrevengosIntegrationError(
+                "Cannot fetch Prevengos contract metadata without an async API client"
+            )
+        codes = list(dict.fromkeys(contract_codes))
+        results = await asyncio.gather(
+            *(self.async_api_client.fetch_contract(code) for code in codes)
+        )
+        return dict(zip(codes, results))
+
     def close(self) -> None:
         """Close any owned resources."""
 
         if self.api_client:
             self.api_client.close()
+        if self.db_adapter:
+            self.db_adapter.close()
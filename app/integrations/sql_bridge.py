@@ -8,16 +8,203 @@ movements between the ORM models used in this repository and external tables.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import contextmanager
-import re
-from typing import Any, Mapping
-
-from sqlalchemy import text
-from sqlalchemy.engine import Connection, Engine, Result
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import lru_cache
+from itertools import chain, islice
+import io
+import json
+import queue
+import threading
+from typing import Any, Mapping, TypeVar
+
+try:  # pragma: no cover - prefer orjson when available
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+from sqlalchemy import TextClause, insert, text
+from sqlalchemy.engine import Connection, Engine, Result, RowMapping
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+T = TypeVar("T")
+
+EXECUTE_MANY_CHUNK_SIZE = 1000
+"""Maximum parameter sets sent per ``executemany`` call by the bridge."""
+
+
+Statement = str | TextClause
+
+_batch_connection: ContextVar[tuple[Engine, Connection] | None] = ContextVar(
+    "sql_bridge_batch_connection", default=None
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_text(sql: str) -> TextClause:
+    return text(sql)
+
+
+def _as_text(sql: Statement) -> TextClause:
+    """Return a cached :class:`TextClause` so bind parameters are parsed once."""
+
+    return sql if isinstance(sql, TextClause) else _compile_text(sql)
+
+
+@lru_cache(maxsize=128)
+def _build_insert_stmt(table_name: str, columns: tuple[str, ...]) -> TextClause:
+    for column in columns:
+        ExternalSQLClient.validate_identifier(column)
+    placeholders = ", ".join(f":{column}" for column in columns)
+    return text(
+        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+    )
+
+
+_COPY_DRIVERS = frozenset({"psycopg2", "psycopg"})
+"""DBAPI drivers whose cursors provide the COPY API used by ``copy_rows``."""
+
+_COPY_TEXT_ESCAPE = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text_line(row: Sequence[Any]) -> str:
+    """Encode *row* as one line of PostgreSQL ``COPY`` text format."""
+
+    return (
+        "\t".join(
+            "\\N" if value is None else _pg_text(value).translate(_COPY_TEXT_ESCAPE)
+            for value in row
+        )
+        + "\n"
+    )
+
+
+def _pg_text(value: Any) -> str:
+    """Return the PostgreSQL input literal for *value*, as the driver adapts it.
+
+    Mappings become JSON, sequences array literals, bytes ``bytea`` hex and
+    :class:`~datetime.timedelta` an interval; other values use ``str()``.
+    """
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, Mapping):
+        return _json_text(value)
+    if isinstance(value, (list, tuple)):
+        return "{" + ",".join(_pg_array_element(item) for item in value) + "}"
+    if isinstance(value, timedelta):
+        return (
+            f"{value.days} days {value.seconds} seconds "
+            f"{value.microseconds} microseconds"
+        )
+    return str(value)
+
+
+def _pg_array_element(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return _pg_text(value)
+    escaped = _pg_text(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _json_text(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=str)
+
+
+def _parameter_chunks(
+    parameters: Iterable[Mapping[str, Any]], chunk_size: int
+) -> Iterator[list[Mapping[str, Any]]]:
+    """Split *parameters* into lists of at most ``chunk_size`` mappings."""
+
+    if isinstance(parameters, list) and len(parameters) <= chunk_size:
+        # Already a single batch: hand the caller's list over without copying.
+        if parameters:
+            yield parameters
+        return
+    iterator = iter(parameters)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _copy_chunks(
+    connection: Any, copy_sql: str, rows: Iterator[Sequence[Any]], chunk_size: int
+) -> int:
+    """Stream *rows* through ``COPY ... FROM STDIN`` on a DBAPI connection."""
+
+    copied = 0
+    cursor = connection.cursor()
+    try:
+        while chunk := list(islice(rows, chunk_size)):
+            data = "".join(_copy_text_line(row) for row in chunk)
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(copy_sql, io.StringIO(data))
+            else:  # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    copy.write(data)
+            copied += len(chunk)
+    finally:
+        cursor.close()
+    return copied
+
+
+def _prefetch(
+    produce_items: Callable[[], Iterator[T]], depth: int, *, name: str
+) -> Iterator[T]:
+    """Run ``produce_items()`` on a worker thread, up to *depth* items ahead.
+
+    The generator is created inside the worker, so any connection or session
+    it opens is owned by that thread for its whole lifetime (neither is
+    thread-safe). Producer errors are re-raised in the consumer; closing the
+    returned iterator early stops the worker.
+    """
+
+    items: queue.Queue[Any] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def offer(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            iterator = produce_items()
+            try:
+                for item in iterator:
+                    if not offer(item):
+                        return
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the consumer
+            offer(exc)
+            return
+        offer(done)
+
+    worker = threading.Thread(target=produce, name=name, daemon=True)
+    worker.start()
+    try:
+        while (item := items.get()) is not done:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
 
 class ExternalSQLBridgeError(RuntimeError):
     """Raised when the external SQL bridge cannot execute an operation."""
@@ -31,8 +218,6 @@ class ExternalSQLClient:
     can talk to databases that are managed manually.
     """
 
-    _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_\.]*$")
-
     def __init__(
         self,
         engine: Engine,
@@ -59,81 +244,259 @@ class ExternalSQLClient:
 
     @contextmanager
     def transaction(self) -> Iterator[Connection]:
-        """Context manager that yields a transactional connection."""
+        """Context manager that yields a transactional connection.
+
+        Inside :meth:`batch` the batch connection is yielded instead, so the
+        statement joins its transaction rather than checking out another one.
+        """
 
+        connection = self._batch_connection()
+        if connection is not None:
+            yield connection
+            return
         with self._engine.begin() as connection:
             yield connection
 
-    def execute(self, sql: str, parameters: Mapping[str, Any] | None = None) -> int:
-        """Execute a SQL command and return the number of affected rows."""
+    @contextmanager
+    def batch(self) -> Iterator[Connection]:
+        """Run several writes on one connection and a single transaction.
+
+        :meth:`execute`, :meth:`execute_many` and :meth:`copy_rows` called
+        within the block reuse the yielded connection; everything commits
+        together on exit or rolls back if the block raises. Nested calls
+        reuse the outer batch.
+        """
+
+        connection = self._batch_connection()
+        if connection is not None:
+            yield connection
+            return
+        with self._engine.begin() as connection:
+            token = _batch_connection.set((self._engine, connection))
+            try:
+                yield connection
+            finally:
+                _batch_connection.reset(token)
+
+    def _batch_connection(self) -> Connection | None:
+        active = _batch_connection.get()
+        if active is not None and active[0] is self._engine:
+            return active[1]
+        return None
+
+    @contextmanager
+    def autocommit(self) -> Iterator[Connection]:
+        """Context manager that yields a connection in ``AUTOCOMMIT`` mode.
+
+        Each statement commits on its own, without a BEGIN/COMMIT round-trip.
+        Inside :meth:`batch` the batch connection is yielded instead.
+        """
+
+        connection = self._batch_connection()
+        if connection is not None:
+            yield connection
+            return
+        with self._engine.connect() as connection:
+            yield connection.execution_options(isolation_level="AUTOCOMMIT")
+
+    def execute(
+        self, sql: Statement, parameters: Mapping[str, Any] | None = None
+    ) -> int:
+        """Execute a SQL command and return the number of affected rows.
+
+        A single statement is atomic on its own, so it runs in autocommit
+        mode; group statements that must commit together with :meth:`batch`.
+        """
 
         try:
-            with self.transaction() as connection:
+            with self.autocommit() as connection:
                 result: Result[Any] = connection.execute(
-                    text(sql),
+                    _as_text(sql),
                     parameters or {},
                 )
         except SQLAlchemyError as exc:  # pragma: no cover - defensive, re-raised
             raise ExternalSQLBridgeError(str(exc)) from exc
         return result.rowcount
 
+    @property
+    def supports_copy(self) -> bool:
+        """Whether :meth:`copy_rows` can bulk-load into this database.
+
+        Only PostgreSQL through psycopg2 or psycopg 3 exposes the COPY API used.
+        """
+
+        dialect = self._engine.dialect
+        return dialect.name == "postgresql" and dialect.driver in _COPY_DRIVERS
+
+    def copy_rows(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        chunk_size: int = EXECUTE_MANY_CHUNK_SIZE,
+    ) -> int:
+        """Bulk-load positional *rows* into a PostgreSQL table with ``COPY``.
+
+        Rows are encoded in COPY's text format ``chunk_size`` at a time and
+        streamed within a single transaction. Works with psycopg2 and psycopg 3.
+        """
+
+        table = self.validate_identifier(table_name)
+        column_list = ", ".join(self.validate_identifier(column) for column in columns)
+        copy_sql = f"COPY {table} ({column_list}) FROM STDIN"
+        iterator = iter(rows)
+        batch_connection = self._batch_connection()
+        if batch_connection is not None:
+            # Share the batch transaction; it commits when the batch exits.
+            try:
+                return _copy_chunks(
+                    batch_connection.connection, copy_sql, iterator, chunk_size
+                )
+            except Exception as exc:  # pragma: no cover - requires PostgreSQL
+                raise ExternalSQLBridgeError(str(exc)) from exc
+
+        connection = self._engine.raw_connection()
+        try:
+            copied = _copy_chunks(connection, copy_sql, iterator, chunk_size)
+            connection.commit()
+        except Exception as exc:  # pragma: no cover - requires PostgreSQL
+            connection.rollback()
+            raise ExternalSQLBridgeError(str(exc)) from exc
+        finally:
+            connection.close()
+        return copied
+
     def execute_many(
         self,
-        sql: str,
-        parameters: Sequence[Mapping[str, Any]] | None = None,
+        sql: Statement,
+        parameters: Iterable[Mapping[str, Any]] | None = None,
+        *,
+        chunk_size: int = EXECUTE_MANY_CHUNK_SIZE,
     ) -> int:
-        """Execute a parametrised statement against a sequence of mappings."""
+        """Execute a parametrised statement against a sequence of mappings.
 
-        payload: list[Mapping[str, Any]] = list(parameters or [])
-        if not payload:
+        Parameters are sent in ``chunk_size`` batches within one transaction so
+        peak memory stays bounded while the driver batches each chunk.
+        """
+
+        chunks = _parameter_chunks(parameters or (), chunk_size)
+        first = next(chunks, None)
+        if first is None:
             return 0
+        affected = 0
         try:
             with self.transaction() as connection:
-                result: Result[Any] = connection.execute(text(sql), payload)
+                statement = _as_text(sql)
+                for chunk in chain((first,), chunks):
+                    result: Result[Any] = connection.execute(statement, chunk)
+                    affected += result.rowcount
         except SQLAlchemyError as exc:  # pragma: no cover - defensive, re-raised
             raise ExternalSQLBridgeError(str(exc)) from exc
-        return result.rowcount
+        return affected
 
     def fetch_all(
-        self, sql: str, parameters: Mapping[str, Any] | None = None
-    ) -> list[dict[str, Any]]:
-        """Execute a read query and return a list of dictionaries."""
+        self,
+        sql: Statement,
+        parameters: Mapping[str, Any] | None = None,
+        *,
+        row_factory: Callable[[RowMapping], T] | None = None,
+    ) -> list[RowMapping] | list[T]:
+        """Execute a read query and return its rows as mappings.
+
+        Rows are SQLAlchemy :class:`RowMapping` views (read-only, comparable to
+        dicts); pass ``row_factory=dict`` when mutable copies are needed.
+        """
 
         try:
             with self.connect() as connection:
-                result = connection.execute(text(sql), parameters or {})
-                return [dict(row._mapping) for row in result]
+                rows = (
+                    connection.execute(_as_text(sql), parameters or {}).mappings().all()
+                )
         except SQLAlchemyError as exc:  # pragma: no cover - defensive, re-raised
             raise ExternalSQLBridgeError(str(exc)) from exc
+        if row_factory is None:
+            return rows
+        return [row_factory(row) for row in rows]
 
     def stream(
         self,
-        sql: str,
+        sql: Statement,
         parameters: Mapping[str, Any] | None = None,
         *,
         chunk_size: int = 500,
-    ) -> Iterable[dict[str, Any]]:
-        """Yield rows lazily to operate on large result sets."""
+        row_factory: Callable[[RowMapping], T] | None = None,
+        prefetch: int = 0,
+    ) -> Iterator[RowMapping] | Iterator[T]:
+        """Yield rows lazily to operate on large result sets.
+
+        Like :meth:`fetch_all`, rows are :class:`RowMapping` views unless a
+        ``row_factory`` is given. With ``prefetch > 0`` a background thread,
+        using its own connection, fetches up to that many chunks ahead so the
+        database round-trips overlap with the caller's processing.
+        """
 
         try:
-            with self.connect() as connection:
-                result = connection.execution_options(stream_results=True).execute(
-                    text(sql), parameters or {}
+            if prefetch > 0:
+                partitions = self._prefetched_partitions(
+                    sql, parameters, chunk_size, prefetch
                 )
-                while True:
-                    chunk = result.fetchmany(chunk_size)
-                    if not chunk:
-                        break
-                    for row in chunk:
-                        yield dict(row._mapping)
+                if row_factory is None:
+                    for partition in partitions:
+                        yield from partition
+                else:
+                    for partition in partitions:
+                        yield from map(row_factory, partition)
+            else:
+                with self.connect() as connection:
+                    rows = self._execute_streaming(
+                        connection, sql, parameters, chunk_size
+                    ).mappings()
+                    yield from rows if row_factory is None else map(row_factory, rows)
         except SQLAlchemyError as exc:  # pragma: no cover - defensive, re-raised
             raise ExternalSQLBridgeError(str(exc)) from exc
 
+    @staticmethod
+    def _execute_streaming(
+        connection: Connection,
+        sql: Statement,
+        parameters: Mapping[str, Any] | None,
+        chunk_size: int,
+    ) -> Result[Any]:
+        # ``yield_per`` sizes the server-side cursor buffer (the driver's
+        # ``arraysize``) so rows are fetched ``chunk_size`` at a time.
+        return connection.execution_options(
+            stream_results=True, yield_per=chunk_size
+        ).execute(_as_text(sql), parameters or {})
+
+    def _partitions(
+        self, sql: Statement, parameters: Mapping[str, Any] | None, chunk_size: int
+    ) -> Iterator[Sequence[RowMapping]]:
+        with self.connect() as connection:
+            result = self._execute_streaming(connection, sql, parameters, chunk_size)
+            yield from result.mappings().partitions()
+
+    def _prefetched_partitions(
+        self,
+        sql: Statement,
+        parameters: Mapping[str, Any] | None,
+        chunk_size: int,
+        prefetch: int,
+    ) -> Iterator[Sequence[RowMapping]]:
+        return _prefetch(
+            lambda: self._partitions(sql, parameters, chunk_size),
+            prefetch,
+            name="sql-bridge-prefetch",
+        )
+
     @classmethod
     def validate_identifier(cls, identifier: str) -> str:
         """Validate a SQL identifier used in dynamic statements."""
 
-        if not cls._IDENTIFIER_RE.match(identifier):
+        # ``str.isidentifier``/``isascii`` run in C and, unlike a ``$``-anchored
+        # regex, do not accept a trailing newline or empty schema segments.
+        parts = identifier.split(".")
+        if not all(part.isascii() and part.isidentifier() for part in parts):
             msg = (
                 "SQL identifiers must start with a letter/underscore and contain "
                 "only alphanumeric characters, underscores or schema separators."
@@ -159,47 +522,89 @@ class DatabaseBridgeService:
         *,
         target_table: str,
         truncate: bool = False,
+        chunk_size: int = EXECUTE_MANY_CHUNK_SIZE,
+        prefetch: int = 0,
     ) -> int:
-        """Materialise the results of a SQLAlchemy query into an external table."""
+        """Materialise the results of a SQLAlchemy query into an external table.
+
+        With ``prefetch > 0`` the source query runs on a background thread with
+        its own session, reading up to that many chunks ahead so source reads
+        overlap with the writes to the external table.
+        """
 
         table_name = ExternalSQLClient.validate_identifier(target_table)
+        use_copy = self._external_client.supports_copy
 
-        session = self._session_factory()
+        def source() -> Iterator[Any]:
+            return self._source_partitions(query, chunk_size, mappings=not use_copy)
+
+        partitions = (
+            _prefetch(source, prefetch, name="sql-bridge-sync")
+            if prefetch > 0
+            else source()
+        )
         try:
-            result = session.execute(query)
-            column_keys = list(result.keys())
-            rows = result.mappings().all()
+            # Result keys are fixed for the whole query: resolve them and the
+            # cached INSERT once, before the first row is fetched.
+            column_keys: tuple[str, ...] = next(partitions)
+            insert_stmt = (
+                None if use_copy else _build_insert_stmt(table_name, column_keys)
+            )
+            rows = chain.from_iterable(partitions)
+            # One checkout and one transaction for the truncate and the load,
+            # so readers never observe the table emptied but not yet refilled.
+            with self._external_client.batch():
+                if truncate:
+                    self._external_client.execute(f"DELETE FROM {table_name}")
+
+                if insert_stmt is None:
+                    return self._external_client.copy_rows(
+                        table_name, column_keys, rows, chunk_size=chunk_size
+                    )
+                return self._external_client.execute_many(
+                    insert_stmt, rows, chunk_size=chunk_size
+                )
         finally:
-            session.close()
+            partitions.close()
 
-        if truncate:
-            self._external_client.execute(f"DELETE FROM {table_name}")
-
-        if not rows:
-            return 0
+    def _source_partitions(
+        self, query: Any, chunk_size: int, *, mappings: bool
+    ) -> Iterator[Any]:
+        """Yield the query's column keys, then its rows in ``chunk_size`` lists."""
 
-        placeholders = ", ".join(f":{column}" for column in column_keys)
-        columns = ", ".join(column_keys)
-        insert_sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-        return self._external_client.execute_many(insert_sql, rows)
+        session = self._session_factory()
+        try:
+            result = session.execute(
+                query,
+                execution_options={"stream_results": True, "yield_per": chunk_size},
+            )
+            yield tuple(result.keys())
+            yield from (result.mappings() if mappings else result).partitions()
+        finally:
+            session.close()
 
     def import_external(
         self,
-        sql: str,
+        sql: Statement,
         handler: Callable[[Session, Mapping[str, Any]], None],
         *,
         chunk_size: int = 500,
-        commit_interval: int = 1000,
+        commit_interval: int = 10_000,
+        flush_interval: int = 1000,
     ) -> int:
         """Run a raw SQL query and apply a handler for each resulting row.
 
         The handler receives the active ORM session so it can upsert data into the
-        internal models. Commits are batched to reduce round-trips to the local
-        database but still allow deterministic persistence.
+        internal models. Pending changes are flushed every ``flush_interval``
+        rows, which keeps the unit of work small, while the transaction is only
+        committed (and made durable) every ``commit_interval`` rows and at the
+        end, so the cost of each COMMIT is spread over more rows.
         """
 
         if commit_interval <= 0:
             raise ValueError("commit_interval must be greater than zero")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be greater than zero")
 
         processed = 0
         session = self._session_factory()
@@ -209,7 +614,54 @@ class DatabaseBridgeService:
                 processed += 1
                 if processed % commit_interval == 0:
                     session.commit()
+                elif processed % flush_interval == 0:
+                    session.flush()
             session.commit()
         finally:
             session.close()
         return processed
+
+    def import_external_rows(
+        self,
+        sql: Statement,
+        target: Any,
+        transform: Callable[[Mapping[str, Any]], Mapping[str, Any] | None],
+        *,
+        chunk_size: int = 500,
+        commit_interval: int = 1000,
+    ) -> int:
+        """Bulk-insert transformed external rows into *target*.
+
+        ``target`` is an ORM model or :class:`~sqlalchemy.Table`. ``transform``
+        maps each external row to the values to insert, or ``None`` to skip it.
+        Rows are buffered and written with one ``executemany`` INSERT and a
+        commit per ``commit_interval`` rows, instead of a flush per row as
+        :meth:`import_external` handlers usually incur. Returns the number of
+        inserted rows.
+        """
+
+        if commit_interval <= 0:
+            raise ValueError("commit_interval must be greater than zero")
+
+        statement = insert(target)
+        inserted = 0
+        buffer: list[Mapping[str, Any]] = []
+        session = self._session_factory()
+        try:
+            for row in self._external_client.stream(sql, chunk_size=chunk_size):
+                values = transform(row)
+                if values is None:
+                    continue
+                buffer.append(values)
+                if len(buffer) >= commit_interval:
+                    session.execute(statement, buffer)
+                    session.commit()
+                    inserted += len(buffer)
+                    buffer.clear()
+            if buffer:
+                session.execute(statement, buffer)
+                inserted += len(buffer)
+            session.commit()
+        finally:
+            session.close()
+        return inserted
@@ -0,0 +1,73 @@
+"""Background ingestion of uploaded Moodle workbooks."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+
+from app.db import get_session_factory
+from app.logging import get_logger
+from app.models import UploadedFile
+from app.modules.ingest import course_loader
+
+
+logger = get_logger(__name__)
+
+
+def serialize_loader_result(result: course_loader.LoaderResult) -> dict[str, Any]:
+    """Return the JSON-compatible summary stored on uploads and sent to clients."""
+
+    return {
+        "summary": jsonable_encoder(asdict(result.summary)),
+        "ingest": jsonable_encoder(asdict(result.stats)),
+    }
+
+
+def ingest_upload(
+    upload_id: int, stored_path: str, workbook_label: str | None = None
+) -> dict[str, Any]:
+    """Entry point executed by RQ workers to ingest a previously stored upload."""
+
+    session = get_session_factory()()
+    try:
+        upload = session.get(UploadedFile, upload_id)
+        if upload is None:
+            raise LookupError(f"Upload {upload_id} not found")
+
+        upload.status = "processing"
+        session.commit()
+
+        try:
+            result = course_loader.ingest_workbook(
+                Path(stored_path), db=session, workbook_label=workbook_label
+            )
+        except Exception as exc:
+            session.rollback()
+            upload.status = "failed"
+            upload.error = str(exc)
+            session.commit()
+            logger.exception(
+                "uploads.xlsx.ingest_failed",
+                upload_id=upload_id,
+                stored_path=stored_path,
+                error=str(exc),
+            )
+            raise
+
+        upload.status = "ingested"
+        upload.result = serialize_loader_result(result)
+        session.commit()
+        logger.info(
+            "uploads.xlsx.ingest_completed",
+            upload_id=upload_id,
+            stored_path=stored_path,
+            stats=asdict(result.stats),
+        )
+        return upload.result
+    finally:
+        session.close()
+
+
+__all__ = ["ingest_upload", "serialize_loader_result"]
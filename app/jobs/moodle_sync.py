@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
@@ -11,6 +12,8 @@ from app.workflows.runner import WorkflowRunner
 
 from .scheduler import Scheduler
 
+logger = get_logger(__name__)
+
 
 @dataclass(slots=True)
 class MoodleSyncJobDefinition:
@@ -30,21 +33,28 @@ def schedule_moodle_sync_jobs(
 ) -> None:
     """Register Moodle synchronisation jobs respecting the service dry-run mode."""
 
-    logger = get_logger(__name__)
-
     for job in jobs:
-        def _run_job(definition: MoodleSyncJobDefinition = job) -> None:
-            result = _execute_sync(service, definition)
-            logger.info(
-                "moodle.sync.completed",
-                job=definition.identifier,
-                courses=len(result.courses),
-                source=result.source,
-                dry_run=result.dry_run,
-            )
-            runner.run(definition.playbook, dry_run=result.dry_run)
-
-        scheduler.schedule_interval(job.identifier, _run_job, job.interval_minutes)
+        scheduler.schedule_interval(
+            job.identifier,
+            partial(_run_sync_job, service, runner, job),
+            job.interval_minutes,
+        )
+
+
+def _run_sync_job(
+    service: CourseSyncService,
+    runner: WorkflowRunner,
+    definition: MoodleSyncJobDefinition,
+) -> None:
+    result = _execute_sync(service, definition)
+    logger.info(
+        "moodle.sync.completed",
+        job=definition.identifier,
+        courses=len(result.courses),
+        source=result.source,
+        dry_run=result.dry_run,
+    )
+    runner.run(definition.playbook, dry_run=result.dry_run)
 
 
 def _execute_sync(
@@ -1,15 +1,21 @@
 """Simple scheduler wrapper honouring quiet hours for notifications."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time
+from time import monotonic
 from typing import Callable
 
 try:  # pragma: no cover - import when dependency available
+    from apscheduler.executors.pool import ThreadPoolExecutor
     from apscheduler.schedulers.background import BackgroundScheduler
 except ModuleNotFoundError:  # pragma: no cover - lightweight fallback
+    class ThreadPoolExecutor:  # type: ignore[override]
+        def __init__(self, max_workers: int = 10):
+            self.max_workers = max_workers
+
     class BackgroundScheduler:  # type: ignore[override]
-        def __init__(self):
+        def __init__(self, **_options):
             self.running = False
 
         def add_job(self, *_args, **_kwargs):  # noqa: D401 - mimic APScheduler API
@@ -22,29 +28,78 @@ except ModuleNotFoundError:  # pragma: no cover - lightweight fallback
             self.running = False
 
 
+SCHEDULER_MAX_WORKERS = 8
+"""Threads available to run scheduled jobs concurrently."""
+
+JOB_DEFAULTS = {
+    # Ticks missed while a job was still running collapse into a single run,
+    # and a job never overlaps with itself.
+    "coalesce": True,
+    "max_instances": 1,
+    "misfire_grace_time": 60,
+}
+
+
+_DAY = 24 * 60 * 60
+
+
+def _seconds_of_day(value: datetime | time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
 @dataclass(slots=True)
 class QuietHours:
     """Represents the daily time window where notifications must be paused."""
 
     start: time
     end: time
+    _start_s: int = field(init=False, repr=False, compare=False)
+    _width_s: int = field(init=False, repr=False, compare=False)
+    _last_check: tuple[float, bool] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # The window as (start, length) in seconds since midnight; modular
+        # arithmetic then covers windows that span midnight without a branch.
+        # ``start == end`` yields a full-day window, i.e. always quiet.
+        self._start_s = _seconds_of_day(self.start)
+        self._width_s = (_seconds_of_day(self.end) - self._start_s - 1) % _DAY + 1
 
     def allows(self, now: datetime) -> bool:
         """Return True when the provided datetime is outside the quiet window."""
 
-        current = now.time()
-        if self.start < self.end:
-            return not (self.start <= current < self.end)
-        # Quiet hours span across midnight
-        return self.end <= current < self.start
+        return (_seconds_of_day(now) - self._start_s) % _DAY >= self._width_s
+
+    def allows_now(self, max_age: float = 1.0) -> bool:
+        """Return :meth:`allows` for the current UTC time, cached for *max_age* seconds.
+
+        Jobs firing on the same tick share one clock read and evaluation.
+        """
+
+        tick = monotonic()
+        last = self._last_check
+        if last is not None and tick - last[0] < max_age:
+            return last[1]
+        verdict = self.allows(datetime.utcnow())
+        self._last_check = (tick, verdict)
+        return verdict
 
 
 class Scheduler:
     """Thin wrapper around APScheduler to illustrate background job setup."""
 
-    def __init__(self, quiet_hours: QuietHours | None = None):
+    def __init__(
+        self,
+        quiet_hours: QuietHours | None = None,
+        *,
+        max_workers: int = SCHEDULER_MAX_WORKERS,
+    ):
         self.quiet_hours = quiet_hours
-        self._scheduler = BackgroundScheduler()
+        self._scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(max_workers=max_workers)},
+            job_defaults=dict(JOB_DEFAULTS),
+        )
 
     def schedule_interval(
         self,
@@ -54,8 +109,10 @@ class Scheduler:
     ) -> None:
         """Schedule a callable to run every *minutes* minutes respecting quiet hours."""
 
+        # APScheduler listeners only observe submitted jobs and cannot veto
+        # them, so quiet hours are still enforced inside the job itself.
         def wrapper():
-            if self.quiet_hours and not self.quiet_hours.allows(datetime.utcnow()):
+            if self.quiet_hours and not self.quiet_hours.allows_now():
                 return
             func()
 
@@ -6,8 +6,14 @@ import json
 import logging
 import sys
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Iterator
 
+try:  # pragma: no cover - prefer orjson when available
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - prefer structlog when available
     import structlog
     from structlog import stdlib
@@ -33,6 +39,24 @@ except ModuleNotFoundError:  # pragma: no cover - lightweight fallback for offli
 _LOGGING_CONFIGURED = False
 
 
+def _dumps(payload: Any, *, sort_keys: bool = False, default: Any = str) -> str:
+    """Serialise *payload* to a JSON string, through orjson when installed."""
+
+    if orjson is None:
+        return json.dumps(
+            payload, default=default, ensure_ascii=False, sort_keys=sort_keys
+        )
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(payload, default=default, option=option).decode()
+
+
+def _render_json(payload: Any, **kwargs: Any) -> str:
+    # structlog passes ``default`` (and json.dumps-only options we ignore).
+    return _dumps(payload, default=kwargs.get("default", str))
+
+
 def configure_logging(level: int = logging.INFO) -> None:
     """Initialise structlog with a JSON formatter and contextvars support."""
 
@@ -52,7 +76,7 @@ def configure_logging(level: int = logging.INFO) -> None:
             structlog.stdlib.filter_by_level,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_render_json),
         ],
         wrapper_class=stdlib.BoundLogger,
         logger_factory=stdlib.LoggerFactory(),
@@ -61,8 +85,13 @@ def configure_logging(level: int = logging.INFO) -> None:
     _LOGGING_CONFIGURED = True
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str | None = None):
-    """Return a structlog logger ensuring the configuration is ready."""
+    """Return a structlog logger ensuring the configuration is ready.
+
+    Loggers are memoised per name: with ``cache_logger_on_first_use`` the
+    shared proxy resolves its processor chain once and is reused afterwards.
+    """
 
     configure_logging()
     if structlog is None:
@@ -127,9 +156,7 @@ class _FallbackLogger:
         if not payload:
             return event
         try:
-            serialized = json.dumps(
-                payload, default=str, ensure_ascii=False, sort_keys=True
-            )
+            serialized = _dumps(payload, sort_keys=True)
         except TypeError:  # pragma: no cover - defensive fallback
             serialized = str(payload)
         return f"{event} | {serialized}"
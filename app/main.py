@@ -1,19 +1,27 @@
-"""Application entry point for the prl-notifier FastAPI monolith."""
+"""Application entry point for the prl-notifier FastAPI monolith.
+
+Serve it with ``uvicorn app.main:create_app --factory``; ``app.main:app`` is
+still available and builds the application on first access.
+"""
+from functools import lru_cache
+from typing import Any
+
+import orjson
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
 
-from .api.courses import router as courses_router
-from .api.notifications import router as notifications_router
-from .api.students import router as students_router
-from .api.uploads import router as uploads_router
-from .api.workflows import router as workflows_router
 from .config import settings
 from .logging import configure_logging, get_logger
 
-configure_logging()
 logger = get_logger(__name__)
-logger.info("app.startup", environment=settings.environment)
 
-app = FastAPI(title="prl-notifier", version="0.1.0")
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (native date/datetime support)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 router = APIRouter(tags=["health"])
 
@@ -25,9 +33,42 @@ def healthcheck() -> dict[str, str]:
     return {"status": "ok", "environment": settings.environment}
 
 
-app.include_router(router)
-app.include_router(courses_router)
-app.include_router(notifications_router)
-app.include_router(students_router)
-app.include_router(uploads_router)
-app.include_router(workflows_router)
+def create_app() -> FastAPI:
+    """Build the FastAPI application and mount every router."""
+
+    # Routers pull in the ORM models, services and jobs; importing them here
+    # keeps ``import app.main`` cheap until an application is actually built.
+    from .api.courses import router as courses_router
+    from .api.notifications import router as notifications_router
+    from .api.students import router as students_router
+    from .api.uploads import router as uploads_router
+    from .api.workflows import router as workflows_router
+
+    configure_logging()
+    application = FastAPI(
+        title="prl-notifier",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
+    application.include_router(router)
+    application.include_router(courses_router)
+    application.include_router(notifications_router)
+    application.include_router(students_router)
+    application.include_router(uploads_router)
+    application.include_router(workflows_router)
+    logger.info("app.startup", environment=settings.environment)
+    return application
+
+
+@lru_cache(maxsize=None)
+def get_app() -> FastAPI:
+    """Return the process-wide application, creating it on first use."""
+
+    return create_app()
+
+
+def __getattr__(name: str) -> Any:
+    # ``app`` is resolved lazily (PEP 562) for ``uvicorn app.main:app``.
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
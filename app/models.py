@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+import json
+import sys
+import zlib
+from datetime import date, datetime, timezone
+from enum import StrEnum
+from functools import lru_cache
+from typing import Annotated, Any, Iterable, Literal, get_args
+
+try:  # pragma: no cover - prefer orjson when available
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
 
 try:  # pragma: no cover - exercised indirectly when dependency is present
-    from pydantic import BaseModel, ConfigDict, Field
+    from pydantic import BaseModel, ConfigDict, TypeAdapter
 except ModuleNotFoundError:  # pragma: no cover - fallback for offline environments
 
     class ConfigDict(dict):
@@ -15,60 +26,210 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for offline environme
         """Simplified Pydantic replacement supporting ``model_validate``."""
 
         model_config: ConfigDict = ConfigDict()
+        _fields: tuple[str, ...] = ()
+
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            # Resolve the field names once per class, not on every instance.
+            cls._fields = tuple(cls.__dict__.get("__annotations__", {}))
 
         def __init__(self, **data):
-            for field in self.__class__.__annotations__:
-                setattr(self, field, data.get(field))
+            get = data.get
+            for field in self._fields:
+                setattr(self, field, get(field))
 
         @classmethod
         def model_validate(cls, obj):
+            missing = object()
             data = {}
-            for field in cls.__annotations__:
-                if hasattr(obj, field):
-                    data[field] = getattr(obj, field)
+            for field in cls._fields:
+                value = getattr(obj, field, missing)
+                if value is not missing:
+                    data[field] = value
             return cls(**data)
 
-    def Field(default=None, **_kwargs):  # type: ignore[override]
-        return default
+    class TypeAdapter:  # type: ignore[override]
+        """Stand-in for ``TypeAdapter(list[Model])`` over the fallback models."""
+
+        def __init__(self, type_):
+            (self._model,) = get_args(type_)
+
+        def validate_python(self, rows, **_kwargs):
+            return [self._model.model_validate(row) for row in rows]
+
+        def dump_python(self, models, **_kwargs):
+            return [
+                {field: getattr(model, field) for field in model._fields}
+                for model in models
+            ]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _intern_label(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class NotificationStatus(StrEnum):
+    """Outcomes recorded for a notification audit entry."""
+
+    QUEUED = "queued"
+    QUIET_HOURS = "quiet_hours"
+    DRY_RUN = "dry_run"
+    SENT = "sent"
+    ERROR = "error"
+
+
+class JobStatus(StrEnum):
+    """Lifecycle states of a tracked :class:`Job`."""
+
+    QUEUED = "queued"
+    DRY_RUN = "dry_run"
+    PAUSED = "paused"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class CourseSource(StrEnum):
+    """Origins a :class:`Course` can be imported from."""
+
+    XLSX = "xlsx"
+    MOODLE = "moodle"
 
 
 try:  # pragma: no cover - prefer real SQLAlchemy when installed
     from sqlalchemy import (
-        Date,
         DateTime,
+        Enum,
         Float,
         ForeignKey,
-        Integer,
+        Index,
         JSON,
+        LargeBinary,
         String,
         Text,
+        TypeDecorator,
         func,
+        insert,
     )
-    from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.orm import (
+        DeclarativeBase,
+        Mapped,
+        Session,
+        mapped_column,
+        relationship,
+    )
+
+    JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+    """JSON column type stored as pre-parsed, indexable ``JSONB`` on PostgreSQL."""
+
+    def _closed_set(enum: type[StrEnum], name: str) -> Enum:
+        """``VARCHAR(50)`` limited to *enum*'s values by the CHECK *name*.
+
+        Rows are read back as the enum's (singleton) members, so repeated values
+        share one object instead of allocating a string per row.
+        """
+
+        return Enum(
+            enum,
+            name=name,
+            native_enum=False,
+            create_constraint=True,
+            length=50,
+            values_callable=lambda members: [member.value for member in members],
+        )
+
+    class CompressedJSON(TypeDecorator):
+        """JSON document stored as bytes, zlib-compressed above a size threshold.
+
+        The first byte flags the encoding (``0`` plain JSON, ``1`` compressed),
+        so small documents skip the compressor. Plain JSON text written before
+        the column became binary is still read back.
+        """
+
+        impl = LargeBinary
+        cache_ok = True
+
+        PLAIN = b"\x00"
+        COMPRESSED = b"\x01"
+        THRESHOLD = 1024
+
+        def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+            if value is None:
+                return None
+            if orjson is not None:
+                raw = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                raw = json.dumps(value).encode()
+            if len(raw) < self.THRESHOLD:
+                return self.PLAIN + raw
+            return self.COMPRESSED + zlib.compress(raw)
+
+        def process_result_value(self, value: Any, dialect: Any) -> Any:
+            if value is None:
+                return None
+            if isinstance(value, str):
+                return json.loads(value)
+            value = bytes(value)
+            flag, raw = value[:1], value[1:]
+            if flag == self.COMPRESSED:
+                raw = zlib.decompress(raw)
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    str50 = Annotated[str, 50]
+    str64 = Annotated[str, 64]
+    str100 = Annotated[str, 100]
+    str255 = Annotated[str, 255]
 
     class Base(DeclarativeBase):
-        """Declarative base for SQLAlchemy ORM models."""
+        """Declarative base for SQLAlchemy ORM models.
+
+        Columns take their type from the annotation via one shared instance per
+        type; nullability follows ``| None``.
+        """
+
+        type_annotation_map = {
+            str50: String(50),
+            str64: String(64),
+            str100: String(100),
+            str255: String(255),
+            float: Float(),
+            datetime: DateTime(timezone=True),
+            dict: JSONDocument,
+        }
+
+    class _BulkInsertMixin:
+        """Adds a multi-row ``INSERT`` for rows written without loading objects."""
+
+        @classmethod
+        def bulk_create(cls, session: Session, rows: list[dict]) -> None:
+            """Insert *rows* (attribute-name dicts) without loading ORM objects.
+
+            SQLAlchemy batches them into multi-VALUES statements
+            (``insertmanyvalues``); nothing is returned or added to the session.
+            """
+
+            if rows:
+                session.execute(insert(cls), rows)
 
     class Contact(Base):
         """Represents a unique contact that can receive communications."""
 
         __tablename__ = "contacts"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-        full_name: Mapped[str] = mapped_column(String(255), nullable=False)
-        email: Mapped[str | None] = mapped_column(
-            String(255), nullable=True, unique=True
-        )
-        phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
-        attributes: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+        full_name: Mapped[str255]
+        email: Mapped[str255 | None] = mapped_column(unique=True)
+        phone: Mapped[str50 | None]
+        attributes: Mapped[dict | None]
         created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True), nullable=False, server_default=func.now()
+            default=_utcnow, server_default=func.now()
         )
         updated_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True),
-            nullable=False,
-            server_default=func.now(),
-            onupdate=func.now(),
+            default=_utcnow, server_default=func.now(), onupdate=_utcnow
         )
 
     class Course(Base):
@@ -76,15 +237,21 @@ try:  # pragma: no cover - prefer real SQLAlchemy when installed
 
         __tablename__ = "courses"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-        name: Mapped[str] = mapped_column(String(255), nullable=False)
-        hours_required: Mapped[int] = mapped_column(Integer, nullable=False)
-        deadline_date: Mapped[date] = mapped_column(Date, nullable=False)
-        source: Mapped[str] = mapped_column(String(50), nullable=False, default="xlsx")
-        source_reference: Mapped[str | None] = mapped_column(String(255), nullable=True)
-        attributes: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+        name: Mapped[str255]
+        hours_required: Mapped[int]
+        deadline_date: Mapped[date]
+        source: Mapped[str] = mapped_column(
+            _closed_set(CourseSource, "ck_courses_source"), default=CourseSource.XLSX
+        )
+        source_reference: Mapped[str255 | None]
+        attributes: Mapped[dict | None]
         created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True), nullable=False, server_default=func.now()
+            default=_utcnow, server_default=func.now()
+        )
+
+        enrollments: Mapped[list["Enrollment"]] = relationship(
+            back_populates="course", lazy="raise"
         )
 
     class Student(Base):
@@ -92,159 +259,207 @@ try:  # pragma: no cover - prefer real SQLAlchemy when installed
 
         __tablename__ = "students"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-        full_name: Mapped[str] = mapped_column(String(255), nullable=False)
-        email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
-        course: Mapped[str] = mapped_column(String(255), nullable=False)
-        certificate_expires_at: Mapped[date] = mapped_column(Date, nullable=False)
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+        full_name: Mapped[str255]
+        email: Mapped[str255] = mapped_column(unique=True)
+        course: Mapped[str255]
+        certificate_expires_at: Mapped[date]
+
+        enrollments: Mapped[list["Enrollment"]] = relationship(
+            back_populates="student", lazy="raise"
+        )
 
     class Enrollment(Base):
         """Join table linking students with courses and tracking their progress."""
 
         __tablename__ = "enrollments"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
         course_id: Mapped[int | None] = mapped_column(
-            ForeignKey("courses.id", ondelete="SET NULL"), nullable=True, index=True
+            ForeignKey("courses.id", ondelete="SET NULL")
         )
         student_id: Mapped[int | None] = mapped_column(
-            ForeignKey("students.id", ondelete="CASCADE"), nullable=True, index=True
+            ForeignKey("students.id", ondelete="CASCADE")
         )
         contact_id: Mapped[int | None] = mapped_column(
-            ForeignKey("contacts.id", ondelete="SET NULL"), nullable=True, index=True
+            ForeignKey("contacts.id", ondelete="SET NULL"), index=True
         )
-        progress_hours: Mapped[float] = mapped_column(
-            Float, nullable=False, default=0.0
+        progress_hours: Mapped[float] = mapped_column(default=0.0)
+        status: Mapped[str50] = mapped_column(default="active")
+        last_notified_at: Mapped[datetime | None]
+        attributes: Mapped[dict | None]
+
+        # Related rows must be loaded explicitly (see ENROLLMENT_RELATIONS in
+        # app.services.enrollments); an implicit lazy load raises instead of
+        # silently issuing one query per enrollment.
+        course: Mapped["Course | None"] = relationship(
+            back_populates="enrollments", lazy="raise"
         )
-        status: Mapped[str] = mapped_column(
-            String(50), nullable=False, default="active"
-        )
-        last_notified_at: Mapped[datetime | None] = mapped_column(
-            DateTime(timezone=True), nullable=True
+        student: Mapped["Student | None"] = relationship(
+            back_populates="enrollments", lazy="raise"
         )
-        attributes: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+        contact: Mapped["Contact | None"] = relationship(lazy="raise")
+
+    Index(
+        "ix_enrollments_status_last_notified_at",
+        Enrollment.status,
+        Enrollment.last_notified_at,
+    )
+    # Lead with the foreign key so these also serve plain course/student lookups
+    # and the ON DELETE scans, replacing the single-column indexes.
+    Index("ix_enrollments_course_id_status", Enrollment.course_id, Enrollment.status)
+    Index("ix_enrollments_student_id_status", Enrollment.student_id, Enrollment.status)
 
     class UploadedFile(Base):
         """Metadata of files ingested through the uploads API."""
 
         __tablename__ = "uploaded_files"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-        original_name: Mapped[str] = mapped_column(String(255), nullable=False)
-        stored_path: Mapped[str] = mapped_column(String(512), nullable=False)
-        mime: Mapped[str] = mapped_column(String(255), nullable=False)
-        size: Mapped[int] = mapped_column(Integer, nullable=False)
-
-    class Notification(Base):
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+        original_name: Mapped[str255]
+        stored_path: Mapped[str255]
+        mime: Mapped[str255]
+        size: Mapped[int]
+        status: Mapped[str50] = mapped_column(default="received")
+        error: Mapped[str | None] = mapped_column(Text)
+        result: Mapped[dict | None]
+
+    # On PostgreSQL, migration 20261016_0011 range-partitions notifications and
+    # job_events by month of created_at, with (id, created_at) as the table's
+    # primary key; ``id`` alone still identifies a row for the ORM.
+    class Notification(_BulkInsertMixin, Base):
         """Audit trail entry for dispatched notifications."""
 
         __tablename__ = "notifications"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
         enrollment_id: Mapped[int | None] = mapped_column(
-            ForeignKey("enrollments.id", ondelete="SET NULL"),
-            nullable=True,
-            index=True,
+            ForeignKey("enrollments.id", ondelete="SET NULL"), index=True
         )
-        playbook: Mapped[str | None] = mapped_column(String(255), nullable=True)
-        channel: Mapped[str] = mapped_column(String(50), nullable=False)
-        adapter: Mapped[str] = mapped_column(String(100), nullable=False)
-        recipient: Mapped[str | None] = mapped_column(String(255), nullable=True)
-        subject: Mapped[str | None] = mapped_column(String(255), nullable=True)
-        status: Mapped[str] = mapped_column(String(50), nullable=False)
-        payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-        response: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-        error: Mapped[str | None] = mapped_column(Text, nullable=True)
-        job_id: Mapped[str | None] = mapped_column(
-            String(191),
-            ForeignKey("jobs.id", ondelete="SET NULL"),
-            nullable=True,
-            index=True,
+        playbook: Mapped[str255 | None]
+        channel: Mapped[str50]
+        adapter: Mapped[str100]
+        recipient: Mapped[str255 | None]
+        subject: Mapped[str255 | None]
+        status: Mapped[str] = mapped_column(
+            _closed_set(NotificationStatus, "ck_notifications_status")
         )
-        created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True), nullable=False, server_default=func.now()
+        payload: Mapped[dict] = mapped_column(default=dict)
+        response: Mapped[dict | None] = mapped_column(CompressedJSON())
+        error: Mapped[str | None] = mapped_column(Text)
+        job_id: Mapped[str64 | None] = mapped_column(
+            ForeignKey("jobs.id", ondelete="SET NULL"), index=True
         )
-        sent_at: Mapped[datetime | None] = mapped_column(
-            DateTime(timezone=True), nullable=True
+        created_at: Mapped[datetime] = mapped_column(
+            default=_utcnow, server_default=func.now()
         )
+        sent_at: Mapped[datetime | None]
 
-    class Job(Base):
+    Index(
+        "ix_notifications_created_at_id",
+        Notification.created_at.desc(),
+        Notification.id.desc(),
+    )
+    Index(
+        "ix_notifications_status_channel_created_at",
+        Notification.status,
+        Notification.channel,
+        Notification.created_at.desc(),
+    )
+    Index("ix_notifications_recipient", Notification.recipient)
+    Index(
+        "ix_notifications_payload_gin", Notification.payload, postgresql_using="gin"
+    ).ddl_if(dialect="postgresql")
+    # Append-only log: a BRIN index serves created_at range filters at a fraction
+    # of a B-tree's size.
+    Index(
+        "ix_notifications_created_at_brin",
+        Notification.created_at,
+        postgresql_using="brin",
+    ).ddl_if(dialect="postgresql")
+    Index(
+        "ix_notifications_status_created_at_id",
+        Notification.status,
+        Notification.created_at.desc(),
+        Notification.id.desc(),
+    )
+
+    class Job(_BulkInsertMixin, Base):
         """Background job tracked for observability and correlation."""
 
         __tablename__ = "jobs"
 
-        id: Mapped[str] = mapped_column(String(191), primary_key=True)
-        name: Mapped[str] = mapped_column(String(255), nullable=False)
-        queue_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+        id: Mapped[str64] = mapped_column(primary_key=True)
+        name: Mapped[str255]
+        queue_name: Mapped[str100 | None]
         status: Mapped[str] = mapped_column(
-            String(50), nullable=False, default="queued"
+            _closed_set(JobStatus, "ck_jobs_status"), default=JobStatus.QUEUED
         )
-        payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+        payload: Mapped[dict | None]
         created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True), nullable=False, server_default=func.now()
-        )
-        started_at: Mapped[datetime | None] = mapped_column(
-            DateTime(timezone=True), nullable=True
-        )
-        finished_at: Mapped[datetime | None] = mapped_column(
-            DateTime(timezone=True), nullable=True
+            default=_utcnow, server_default=func.now()
         )
+        started_at: Mapped[datetime | None]
+        finished_at: Mapped[datetime | None]
+
+    Index("ix_jobs_status_queue_name", Job.status, Job.queue_name)
 
-    class JobEvent(Base):
+    class JobEvent(_BulkInsertMixin, Base):
         """Time-ordered events emitted while a job progresses through the pipeline."""
 
         __tablename__ = "job_events"
 
-        id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-        job_id: Mapped[str] = mapped_column(
-            String(191),
-            ForeignKey("jobs.id", ondelete="CASCADE"),
-            nullable=False,
-            index=True,
+        id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+        job_id: Mapped[str64] = mapped_column(
+            ForeignKey("jobs.id", ondelete="CASCADE"), index=True
         )
-        event_type: Mapped[str] = mapped_column(String(100), nullable=False)
-        message: Mapped[str | None] = mapped_column(Text, nullable=True)
-        payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+        event_type: Mapped[str100]
+        message: Mapped[str | None] = mapped_column(Text)
+        payload: Mapped[dict | None]
         created_at: Mapped[datetime] = mapped_column(
-            DateTime(timezone=True), nullable=False, server_default=func.now()
+            default=_utcnow, server_default=func.now()
         )
 
+    Index("ix_job_events_created_at", JobEvent.created_at.desc())
+
 except ModuleNotFoundError:  # pragma: no cover - lightweight fallback for tests
-    from dataclasses import dataclass
+    from dataclasses import dataclass, field
 
     class Base:  # type: ignore[override]
         """Placeholder base when SQLAlchemy is unavailable."""
 
-    @dataclass
+        __slots__ = ()
+
+    @dataclass(slots=True)
     class Contact(Base):  # type: ignore[override]
         id: int | None = None
         full_name: str = ""
         email: str | None = None
         phone: str | None = None
         attributes: dict | None = None
-        created_at: datetime = datetime.utcnow()
-        updated_at: datetime = datetime.utcnow()
+        created_at: datetime = field(default_factory=_utcnow)
+        updated_at: datetime = field(default_factory=_utcnow)
 
-    @dataclass
+    @dataclass(slots=True)
     class Course(Base):  # type: ignore[override]
         id: int | None = None
         name: str = ""
         hours_required: int = 0
-        deadline_date: date = date.today()
+        deadline_date: date = field(default_factory=date.today)
         source: str = "xlsx"
         source_reference: str | None = None
         attributes: dict | None = None
-        created_at: datetime = datetime.utcnow()
+        created_at: datetime = field(default_factory=_utcnow)
 
-    @dataclass
+    @dataclass(slots=True)
     class Student(Base):  # type: ignore[override]
         id: int | None = None
         full_name: str = ""
         email: str = ""
         course: str = ""
-        certificate_expires_at: date = date.today()
+        certificate_expires_at: date = field(default_factory=date.today)
 
-    @dataclass
+    @dataclass(slots=True)
     class Enrollment(Base):  # type: ignore[override]
         id: int | None = None
         course_id: int | None = None
@@ -255,15 +470,20 @@ except ModuleNotFoundError:  # pragma: no cover - lightweight fallback for tests
         last_notified_at: datetime | None = None
         attributes: dict | None = None
 
-    @dataclass
+    # Audit rows (uploads, notifications, job events) are never compared or
+    # printed structurally, so they skip the generated __eq__/__repr__.
+    @dataclass(slots=True, eq=False, repr=False)
     class UploadedFile(Base):  # type: ignore[override]
         id: int | None = None
         original_name: str = ""
         stored_path: str = ""
         mime: str = ""
         size: int = 0
+        status: str = "received"
+        error: str | None = None
+        result: dict | None = None
 
-    @dataclass
+    @dataclass(slots=True, eq=False, repr=False)
     class Notification(Base):  # type: ignore[override]
         id: int | None = None
         enrollment_id: int | None = None
@@ -277,54 +497,84 @@ except ModuleNotFoundError:  # pragma: no cover - lightweight fallback for tests
         response: dict | None = None
         error: str | None = None
         job_id: str | None = None
-        created_at: datetime = datetime.utcnow()
+        created_at: datetime = field(default_factory=_utcnow)
         sent_at: datetime | None = None
 
         def __post_init__(self) -> None:  # pragma: no cover - defensive defaulting
             if self.payload is None:
                 self.payload = {}
+            # Low-cardinality labels: share one string object per distinct value.
+            # Only exact ``str`` can be interned; enum members and None are kept.
+            self.channel = _intern_label(self.channel)
+            self.adapter = _intern_label(self.adapter)
+            self.status = _intern_label(self.status)
 
-    @dataclass
+    @dataclass(slots=True)
     class Job(Base):  # type: ignore[override]
         id: str = ""
         name: str = ""
         queue_name: str | None = None
         status: str = "queued"
         payload: dict | None = None
-        created_at: datetime = datetime.utcnow()
+        created_at: datetime = field(default_factory=_utcnow)
         started_at: datetime | None = None
         finished_at: datetime | None = None
 
-    @dataclass
+    @dataclass(slots=True, eq=False, repr=False)
     class JobEvent(Base):  # type: ignore[override]
         id: int | None = None
         job_id: str = ""
         event_type: str = ""
         message: str | None = None
         payload: dict | None = None
-        created_at: datetime = datetime.utcnow()
+        created_at: datetime = field(default_factory=_utcnow)
 
 
-class StudentModel(BaseModel):
-    """Pydantic representation of the :class:`Student` ORM entity."""
+@lru_cache(maxsize=None)
+def _list_adapter(model: type) -> TypeAdapter:
+    return TypeAdapter(list[model])
 
-    model_config = ConfigDict(from_attributes=True)
 
-    id: int | None = Field(
-        default=None, description="Database identifier of the student"
+class _BatchModel(BaseModel):
+    """Adds batch conversions driven by one cached ``TypeAdapter`` per model.
+
+    DTOs are immutable snapshots: frozen instances are hashable (handy for
+    dedup) and rejecting extras spares pydantic-core the extras bookkeeping.
+    """
+
+    model_config = ConfigDict(
+        from_attributes=True, frozen=True, extra="forbid", validate_default=False
     )
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Any]) -> list[Any]:
+        """Validate ORM objects (or mappings) into a list of models in one pass."""
+
+        return _list_adapter(cls).validate_python(rows, from_attributes=True)
+
+    @classmethod
+    def dump_many(
+        cls, models: list[Any], *, mode: Literal["python", "json"] = "python"
+    ) -> list[dict[str, Any]]:
+        """Dump *models* to plain dictionaries in one pass."""
+
+        return _list_adapter(cls).dump_python(models, mode=mode)
+
+
+class StudentModel(_BatchModel):
+    """Pydantic representation of the :class:`Student` ORM entity."""
+
+    id: int | None = None
     full_name: str
     email: str
     course: str
     certificate_expires_at: date
 
 
-class NotificationModel(BaseModel):
+class NotificationModel(_BatchModel):
     """Pydantic representation of the :class:`Notification` audit entry."""
 
-    model_config = ConfigDict(from_attributes=True)
-
-    id: int | None = Field(default=None, description="Database identifier of the entry")
+    id: int | None = None
     enrollment_id: int | None = None
     playbook: str | None = None
     channel: str
@@ -340,11 +590,9 @@ class NotificationModel(BaseModel):
     sent_at: datetime | None = None
 
 
-class ContactModel(BaseModel):
+class ContactModel(_BatchModel):
     """Pydantic representation of a contact entity."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int | None = None
     full_name: str
     email: str | None = None
@@ -354,11 +602,9 @@ class ContactModel(BaseModel):
     updated_at: datetime
 
 
-class CourseModel(BaseModel):
+class CourseModel(_BatchModel):
     """Pydantic representation of the :class:`Course` entity."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int | None = None
     name: str
     hours_required: int
@@ -369,11 +615,9 @@ class CourseModel(BaseModel):
     created_at: datetime
 
 
-class EnrollmentModel(BaseModel):
+class EnrollmentModel(_BatchModel):
     """Pydantic representation of :class:`Enrollment`."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int | None = None
     course_id: int | None = None
     student_id: int | None = None
@@ -384,11 +628,9 @@ class EnrollmentModel(BaseModel):
     attributes: dict | None = None
 
 
-class JobModel(BaseModel):
+class JobModel(_BatchModel):
     """Pydantic representation of :class:`Job`."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: str
     name: str
     queue_name: str | None = None
@@ -399,11 +641,9 @@ class JobModel(BaseModel):
     finished_at: datetime | None = None
 
 
-class JobEventModel(BaseModel):
+class JobEventModel(_BatchModel):
     """Pydantic representation of :class:`JobEvent`."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: int | None = None
     job_id: str
     event_type: str
@@ -418,14 +658,17 @@ __all__ = [
     "ContactModel",
     "Course",
     "CourseModel",
+    "CourseSource",
     "Enrollment",
     "EnrollmentModel",
     "Job",
     "JobEvent",
     "JobEventModel",
     "JobModel",
+    "JobStatus",
     "Notification",
     "NotificationModel",
+    "NotificationStatus",
     "Student",
     "StudentModel",
     "UploadedFile",
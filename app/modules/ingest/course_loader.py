@@ -8,11 +8,12 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from ...logging import get_logger
 from ...models import Course, Enrollment, Student
+from ...services.enrollments import clear_evaluation_cache
 from . import xlsx_importer
 
 
@@ -57,12 +58,16 @@ def ingest_workbook(
 
     logger.info("ingest.workbook.start", **log_context)
 
-    summary = xlsx_importer.parse_xlsx(
-        file_path, mapping_path=effective_mapping_path, preview_rows=5
+    mapping = xlsx_importer.load_mapping(effective_mapping_path)
+    summary, dataframe = xlsx_importer.read_workbook(
+        file_path,
+        mapping=mapping,
+        mapping_path=effective_mapping_path,
+        preview_rows=5,
     )
 
     stats = LoaderStats()
-    if not summary.is_valid:
+    if not summary.is_valid or dataframe is None:
         logger.warning(
             "ingest.workbook.invalid",
             errors=summary.errors,
@@ -72,20 +77,8 @@ def ingest_workbook(
         )
         return LoaderResult(summary=summary, stats=stats)
 
-    mapping = xlsx_importer.load_mapping(effective_mapping_path)
     column_map: dict[str, xlsx_importer.ColumnConfig] = mapping.get("columns", {})
     defaults: dict[str, Any] = mapping.get("defaults", {})
-    sheet_name = mapping.get("sheet_name")
-
-    try:
-        dataframe = pd.read_excel(
-            file_path,
-            engine="openpyxl",
-            sheet_name=sheet_name if sheet_name is not None else 0,
-        )
-    except Exception as exc:  # pragma: no cover - surfacing unexpected read errors
-        logger.exception("ingest.workbook.read_failed", error=str(exc), **log_context)
-        raise
 
     label_source = workbook_label or file_path.name
     row_context = {
@@ -93,18 +86,17 @@ def ingest_workbook(
         "workbook_label": Path(label_source).stem,
     }
 
-    for raw_row in dataframe.to_dict(orient="records"):
-        normalized = _normalize_row(raw_row, column_map, defaults, row_context)
+    latest = _latest_rows(dataframe, column_map, defaults, row_context)
+    rows = _normalize_rows(latest, column_map, defaults, row_context)
+    index = _EntityIndex.prefetch(db, rows)
 
-        email = normalized.get("email")
-        if not email:
-            continue
-
-        course = _get_or_create_course(db, normalized, stats)
-        student = _get_or_create_student(db, normalized, course, stats)
-        _get_or_create_enrollment(db, normalized, student, course, stats)
+    for normalized in rows:
+        course = _get_or_create_course(db, index, normalized, stats)
+        student = _get_or_create_student(db, index, normalized, course, stats)
+        _get_or_create_enrollment(db, index, normalized, student, course, stats)
 
     db.commit()
+    clear_evaluation_cache()
 
     logger.info(
         "ingest.workbook.completed",
@@ -118,10 +110,74 @@ def ingest_workbook(
     return LoaderResult(summary=summary, stats=stats)
 
 
+@dataclass(slots=True)
+class _EntityIndex:
+    """Existing entities touched by a workbook, looked up in bulk up front."""
+
+    courses: dict[str, Course]
+    students: dict[str, Student]
+    enrollments: dict[tuple[Student, Course], Enrollment]
+
+    @classmethod
+    def prefetch(cls, db: Session, rows: list[dict[str, Any]]) -> "_EntityIndex":
+        names = {row.get("course_name") or _DEFAULT_COURSE_NAME for row in rows}
+        emails = {row["email"] for row in rows}
+
+        courses = {
+            course.name: course
+            for chunk in _chunked(names)
+            for course in db.execute(select(Course).where(Course.name.in_(chunk))).scalars()
+        }
+        students = {
+            student.email: student
+            for chunk in _chunked(emails)
+            for student in db.execute(
+                select(Student).where(Student.email.in_(chunk))
+            ).scalars()
+        }
+
+        # Only (student, course) pairs that both already exist can have an
+        # enrollment; fetch exactly those instead of the students x courses grid.
+        pairs = {
+            (student.id, course.id): (student, course)
+            for student, course in (
+                (
+                    students.get(row["email"]),
+                    courses.get(row.get("course_name") or _DEFAULT_COURSE_NAME),
+                )
+                for row in rows
+            )
+            if student is not None and course is not None
+        }
+        enrollments: dict[tuple[Student, Course], Enrollment] = {}
+        for chunk in _chunked(pairs):
+            for enrollment in db.execute(
+                select(Enrollment).where(
+                    tuple_(Enrollment.student_id, Enrollment.course_id).in_(chunk)
+                )
+            ).scalars():
+                key = pairs[(enrollment.student_id, enrollment.course_id)]
+                enrollments.setdefault(key, enrollment)
+
+        return cls(courses=courses, students=students, enrollments=enrollments)
+
+
+_DEFAULT_COURSE_NAME = "Curso sin nombre"
+_PREFETCH_CHUNK_SIZE = 500
+
+
+def _chunked(values: Any) -> list[list[Any]]:
+    items = list(values)
+    return [
+        items[start : start + _PREFETCH_CHUNK_SIZE]
+        for start in range(0, len(items), _PREFETCH_CHUNK_SIZE)
+    ]
+
+
 def _get_or_create_course(
-    db: Session, normalized: dict[str, Any], stats: LoaderStats
+    db: Session, index: _EntityIndex, normalized: dict[str, Any], stats: LoaderStats
 ) -> Course:
-    name = normalized.get("course_name") or "Curso sin nombre"
+    name = normalized.get("course_name") or _DEFAULT_COURSE_NAME
     hours_required = normalized.get("course_hours_required")
     if hours_required is None:
         hours_required = normalized.get("progress_hours") or 0
@@ -130,7 +186,7 @@ def _get_or_create_course(
     if deadline_date is None:
         deadline_date = certificate_date or date.today()
 
-    course = db.execute(select(Course).where(Course.name == name)).scalar_one_or_none()
+    course = index.courses.get(name)
     if course is None:
         course = Course(
             name=name,
@@ -139,7 +195,7 @@ def _get_or_create_course(
             source="xlsx",
         )
         db.add(course)
-        db.flush()
+        index.courses[name] = course
         stats.courses_created += 1
         return course
 
@@ -158,6 +214,7 @@ def _get_or_create_course(
 
 def _get_or_create_student(
     db: Session,
+    index: _EntityIndex,
     normalized: dict[str, Any],
     course: Course,
     stats: LoaderStats,
@@ -170,7 +227,7 @@ def _get_or_create_student(
         or date.today()
     )
 
-    student = db.execute(select(Student).where(Student.email == email)).scalar_one_or_none()
+    student = index.students.get(email)
     if student is None:
         student = Student(
             full_name=full_name,
@@ -179,7 +236,7 @@ def _get_or_create_student(
             certificate_expires_at=certificate_date,
         )
         db.add(student)
-        db.flush()
+        index.students[email] = student
         stats.students_created += 1
         return student
 
@@ -201,6 +258,7 @@ def _get_or_create_student(
 
 def _get_or_create_enrollment(
     db: Session,
+    index: _EntityIndex,
     normalized: dict[str, Any],
     student: Student,
     course: Course,
@@ -209,20 +267,19 @@ def _get_or_create_enrollment(
     progress_hours = normalized.get("progress_hours") or 0.0
     attributes = _build_enrollment_attributes(normalized)
 
-    enrollment = db.execute(
-        select(Enrollment).where(
-            Enrollment.student_id == student.id, Enrollment.course_id == course.id
-        )
-    ).scalar_one_or_none()
+    enrollment = index.enrollments.get((student, course))
 
     if enrollment is None:
+        # Relationships let the unit of work resolve ids for new students and
+        # courses, so every INSERT is batched into the final flush.
         enrollment = Enrollment(
-            student_id=student.id,
-            course_id=course.id,
+            student=student,
+            course=course,
             progress_hours=progress_hours,
             attributes=attributes,
         )
         db.add(enrollment)
+        index.enrollments[(student, course)] = enrollment
         stats.enrollments_created += 1
         return enrollment
 
@@ -273,120 +330,181 @@ def _build_enrollment_attributes(normalized: dict[str, Any]) -> dict[str, Any]:
     return attributes
 
 
-def _normalize_row(
-    raw_row: dict[str, Any],
+def _latest_rows(
+    dataframe: pd.DataFrame,
     column_map: dict[str, xlsx_importer.ColumnConfig],
     defaults: dict[str, Any],
     context: dict[str, Any],
-) -> dict[str, Any]:
-    def get_value(key: str) -> Any:
+) -> pd.DataFrame:
+    """Keep the last sheet row per ``(email, course)``, dropping rows without email.
+
+    Earlier rows for the same enrollment would be overwritten by the later one,
+    so they are discarded before any per-value conversion or lookup.
+    """
+
+    def field(key: str) -> list[Any]:
         config = column_map.get(key)
         if config is None:
-            return None
-        for column in config.sources:
-            value = raw_row.get(column)
-            if value is None:
-                continue
-            if isinstance(value, float) and pd.isna(value):
-                continue
-            if isinstance(value, str):
-                stripped = value.strip()
-                if not stripped:
-                    continue
-                return stripped
-            if pd.isna(value):  # type: ignore[arg-type]
-                continue
-            return value
-        return None
+            return [None] * len(dataframe)
+        return _coalesce_sources(dataframe, config.sources)
+
+    emails = field("email")
+    default_course = _resolve_default(defaults.get("course_name"), context)
+    keys = pd.DataFrame(
+        {
+            "email": emails,
+            "course_name": [
+                (default_course if name is None else name) or _DEFAULT_COURSE_NAME
+                for name in field("course_name")
+            ],
+        },
+        index=dataframe.index,
+    )
+    keys = keys[[bool(email) for email in emails]]
+    return dataframe.loc[keys.drop_duplicates(keep="last").index]
 
-    def get_default(key: str) -> Any:
-        if key not in defaults:
-            return None
-        value = defaults[key]
-        if isinstance(value, str):
-            try:
-                return value.format(**context)
-            except (KeyError, ValueError):  # pragma: no cover - defensive
-                return value
-        return value
 
-    def to_date(value: Any) -> date | None:
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value.date()
-        if isinstance(value, pd.Timestamp):
-            return value.date()
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            parsed = pd.to_datetime(value, errors="coerce", dayfirst=True)
-            if pd.isna(parsed):
-                return None
-            return parsed.date()
-        return None
+def _normalize_rows(
+    dataframe: pd.DataFrame,
+    column_map: dict[str, xlsx_importer.ColumnConfig],
+    defaults: dict[str, Any],
+    context: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Normalize every sheet row, resolving each mapped field column-wise.
 
-    def to_datetime(value: Any) -> datetime | None:
-        if value is None:
-            return None
-        if isinstance(value, datetime):
+    Blank detection, stripping and source fallbacks run once per column in
+    pandas; only the type conversions below still look at single values.
+    """
+
+    values = {
+        key: _coalesce_sources(dataframe, config.sources)
+        for key, config in column_map.items()
+    }
+    resolved_defaults = {
+        key: _resolve_default(value, context) for key, value in defaults.items()
+    }
+    keys = list(values)
+    rows = zip(*values.values()) if keys else [()] * len(dataframe)
+    return [_normalize_row(dict(zip(keys, row)), resolved_defaults) for row in rows]
+
+
+def _coalesce_sources(dataframe: pd.DataFrame, sources: tuple[str, ...]) -> list[Any]:
+    """Return, per row, the first non-blank value among *sources* (else ``None``)."""
+
+    merged: pd.Series | None = None
+    for source in sources:
+        if source not in dataframe.columns:
+            continue
+        # Object dtype keeps each source's own scalar types when combined.
+        column = dataframe[source].astype(object)
+        try:
+            stripped = column.str.strip()
+        except AttributeError:  # no string values in this column
+            pass
+        else:
+            column = stripped.where(stripped.notna(), column).mask(stripped.eq(""))
+        merged = column if merged is None else merged.combine_first(column)
+    if merged is None:
+        return [None] * len(dataframe)
+    return merged.where(merged.notna(), None).tolist()
+
+
+def _resolve_default(value: Any, context: dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        try:
+            return value.format(**context)
+        except (KeyError, ValueError):  # pragma: no cover - defensive
             return value
-        if isinstance(value, pd.Timestamp):
-            return value.to_pydatetime()
-        if isinstance(value, date):
-            return datetime.combine(value, datetime.min.time())
-        if isinstance(value, str):
-            cleaned = value.strip()
-            if not cleaned or cleaned.lower() == "no visitado":
-                return None
-            parsed = pd.to_datetime(cleaned, errors="coerce", dayfirst=True)
-            if pd.isna(parsed):
-                return None
-            return parsed.to_pydatetime()
-        return None
+    return value
+
+
+# Blank cells and Moodle's "No visitado" marker carry no date or time spent.
+_EMPTY_MARKERS = frozenset({"", "no visitado"})
 
-    def to_float(value: Any) -> float | None:
-        if value is None:
+
+def _to_date(value: Any) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, pd.Timestamp):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        if value.strip().casefold() in _EMPTY_MARKERS:
+            return None
+        parsed = pd.to_datetime(value, errors="coerce", dayfirst=True)
+        if pd.isna(parsed):
             return None
-        if isinstance(value, (int, float)):
-            if pd.isna(value):  # type: ignore[arg-type]
-                return None
-            return float(value)
-        if isinstance(value, str):
-            cleaned = value.replace(",", ".")
-            try:
-                return float(cleaned)
-            except ValueError:
-                return None
+        return parsed.date()
+    return None
+
+
+def _to_datetime(value: Any) -> datetime | None:
+    if value is None:
         return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if isinstance(value, str):
+        cleaned = value.strip()
+        if cleaned.casefold() in _EMPTY_MARKERS:
+            return None
+        parsed = pd.to_datetime(cleaned, errors="coerce", dayfirst=True)
+        if pd.isna(parsed):
+            return None
+        return parsed.to_pydatetime()
+    return None
 
-    def to_duration_hours(value: Any) -> float | None:
-        if value is None:
+
+def _to_float(value: Any) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        if pd.isna(value):  # type: ignore[arg-type]
             return None
-        if isinstance(value, (int, float)):
-            if pd.isna(value):  # type: ignore[arg-type]
-                return None
-            return float(value)
-        if isinstance(value, str):
-            cleaned = value.strip()
-            if not cleaned or cleaned.lower() == "no visitado":
-                return 0.0
-            total_seconds = 0
-            for amount, unit in re.findall(r"(\d+)\s*([hms])", cleaned.lower()):
-                quantity = int(amount)
-                if unit == "h":
-                    total_seconds += quantity * 3600
-                elif unit == "m":
-                    total_seconds += quantity * 60
-                elif unit == "s":
-                    total_seconds += quantity
-            if total_seconds == 0:
-                numeric = to_float(cleaned)
-                if numeric is not None:
-                    return numeric
-                return None
-            return total_seconds / 3600
+        return float(value)
+    if isinstance(value, str):
+        cleaned = value.replace(",", ".")
+        try:
+            return float(cleaned)
+        except ValueError:
+            return None
+    return None
+
+
+_DURATION_PART_RE = re.compile(r"(\d+)\s*([hms])")
+_SECONDS_PER_UNIT = {"h": 3600, "m": 60, "s": 1}
+
+
+def _to_duration_hours(value: Any) -> float | None:
+    if value is None:
         return None
+    if isinstance(value, (int, float)):
+        if pd.isna(value):  # type: ignore[arg-type]
+            return None
+        return float(value)
+    if isinstance(value, str):
+        cleaned = value.strip().casefold()
+        if cleaned in _EMPTY_MARKERS:
+            return 0.0
+        total_seconds = sum(
+            int(amount) * _SECONDS_PER_UNIT[unit]
+            for amount, unit in _DURATION_PART_RE.findall(cleaned)
+        )
+        if total_seconds == 0:
+            return _to_float(cleaned)
+        return total_seconds / 3600
+    return None
+
+
+def _normalize_row(values: dict[str, Any], defaults: dict[str, Any]) -> dict[str, Any]:
+    get_value = values.get
+    get_default = defaults.get
 
     normalized: dict[str, Any] = {}
 
@@ -412,23 +530,23 @@ def _normalize_row(
     hours_required = get_value("course_hours_required")
     if hours_required is None:
         hours_required = get_default("course_hours_required")
-    hours_value = to_float(hours_required)
+    hours_value = _to_float(hours_required)
     normalized["course_hours_required"] = int(round(hours_value)) if hours_value is not None else None
 
     deadline = get_value("course_deadline_date")
     if deadline is None:
         deadline = get_default("course_deadline_date")
-    normalized["course_deadline_date"] = to_date(deadline)
+    normalized["course_deadline_date"] = _to_date(deadline)
 
     certificate = get_value("certificate_expires_at")
     if certificate is None:
         certificate = get_default("certificate_expires_at")
-    normalized["certificate_expires_at"] = to_date(certificate)
+    normalized["certificate_expires_at"] = _to_date(certificate)
 
     progress = get_value("progress_hours")
-    progress_float = to_float(progress)
+    progress_float = _to_float(progress)
     raw_total_time = get_value("total_time")
-    duration_hours = to_duration_hours(raw_total_time)
+    duration_hours = _to_duration_hours(raw_total_time)
     normalized["progress_hours"] = (
         progress_float
         if progress_float is not None
@@ -436,8 +554,8 @@ def _normalize_row(
     )
 
     normalized["raw_total_time"] = raw_total_time
-    normalized["first_access_at"] = to_datetime(get_value("first_access"))
-    normalized["last_access_at"] = to_datetime(get_value("last_access"))
+    normalized["first_access_at"] = _to_datetime(get_value("first_access"))
+    normalized["last_access_at"] = _to_datetime(get_value("last_access"))
 
     return normalized
 
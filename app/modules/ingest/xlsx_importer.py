@@ -20,6 +20,16 @@ except ImportError:  # pragma: no cover - degrade gracefully if openpyxl missing
     class InvalidFileException(Exception):
         """Fallback placeholder when ``openpyxl`` is not installed."""
 
+try:  # pragma: no cover - optional Rust-backed reader, several times faster
+    from python_calamine import CalamineError
+except ModuleNotFoundError:  # pragma: no cover - openpyxl remains the default engine
+    EXCEL_ENGINE = "openpyxl"
+
+    class CalamineError(Exception):
+        """Fallback placeholder when ``python-calamine`` is not installed."""
+else:
+    EXCEL_ENGINE = "calamine"
+
 
 from ...logging import get_logger
 
@@ -116,7 +126,29 @@ def parse_xlsx(
 ) -> ImportSummary:
     """Load a spreadsheet, validate required columns and produce a preview."""
 
-    mapping = load_mapping(mapping_path)
+    summary, _ = read_workbook(
+        file_path,
+        mapping=load_mapping(mapping_path),
+        mapping_path=mapping_path,
+        preview_rows=preview_rows,
+    )
+    return summary
+
+
+def read_workbook(
+    file_path: Path,
+    *,
+    mapping: dict[str, Any],
+    mapping_path: Path | None = None,
+    preview_rows: int = 5,
+) -> tuple[ImportSummary, pd.DataFrame | None]:
+    """Validate a spreadsheet against a resolved mapping and keep its rows.
+
+    Only the columns referenced by ``mapping`` are materialised, and the
+    returned dataframe lets callers persist the rows without reading the
+    workbook a second time. It is ``None`` when the file could not be read.
+    """
+
     sheet_name = mapping.get("sheet_name")
     context = {
         "file_path": str(file_path),
@@ -126,25 +158,34 @@ def parse_xlsx(
 
     logger.info("ingest.xlsx.parse.start", **context)
 
+    column_configs: dict[str, ColumnConfig] = mapping.get("columns", {})
+    mapped_sources = {
+        column for config in column_configs.values() for column in config.sources
+    }
+    usecols = (lambda column: column in mapped_sources) if mapped_sources else None
+
     try:
         dataframe = pd.read_excel(
             file_path,
-            engine="openpyxl",
+            engine=EXCEL_ENGINE,
             sheet_name=sheet_name if sheet_name is not None else 0,
+            usecols=usecols,
         )
     except ValueError as exc:
         error = f"No se pudo leer la pestaña '{sheet_name}' del XLSX: {exc}"
         logger.error("ingest.xlsx.parse.failed", error=str(exc), **context)
-        return ImportSummary(total_rows=0, missing_columns=[], preview=[], errors=[error])
-    except (OSError, BadZipFile, InvalidFileException, ImportError) as exc:
+        summary = ImportSummary(total_rows=0, missing_columns=[], preview=[], errors=[error])
+        return summary, None
+    except (
+        OSError, BadZipFile, InvalidFileException, CalamineError, ImportError
+    ) as exc:
         error = (
             "No se pudo abrir el fichero XLSX. Verifica que el archivo no está corrupto "
             f"y que utiliza un formato Excel válido. Detalle: {exc}"
         )
         logger.error("ingest.xlsx.parse.failed", error=str(exc), **context)
-        return ImportSummary(total_rows=0, missing_columns=[], preview=[], errors=[error])
-
-    column_configs: dict[str, ColumnConfig] = mapping.get("columns", {})
+        summary = ImportSummary(total_rows=0, missing_columns=[], preview=[], errors=[error])
+        return summary, None
 
     required_sources: list[str] = []
     for config in column_configs.values():
@@ -196,7 +237,7 @@ def parse_xlsx(
             **context,
         )
 
-    return summary
+    return summary, dataframe
 
 
 def load_mapping(mapping_path: Path | None = None) -> dict[str, Any]:
@@ -207,4 +248,10 @@ def load_mapping(mapping_path: Path | None = None) -> dict[str, Any]:
     return _resolve_mapping(raw_mapping)
 
 
-__all__ = ["ColumnConfig", "ImportSummary", "parse_xlsx", "load_mapping"]
+__all__ = [
+    "ColumnConfig",
+    "ImportSummary",
+    "parse_xlsx",
+    "read_workbook",
+    "load_mapping",
+]
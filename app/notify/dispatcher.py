@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Iterable, Mapping, Protocol
@@ -41,8 +42,20 @@ class NotificationAuditEntry:
     queue_name: str | None = None
 
 
+# Audit entries buffered by the ``dispatch`` call running in this context,
+# together with the dispatcher that owns them.
+_AUDIT_BUFFER: ContextVar[
+    tuple["NotificationDispatcher", list[NotificationAuditEntry]] | None
+] = ContextVar("notification_audit_buffer", default=None)
+
+
 class NotificationAuditRepository(Protocol):
-    """Repository interface used by the dispatcher to persist audits."""
+    """Repository interface used by the dispatcher to persist audits.
+
+    Implementations may also provide ``add_many(entries)``; the dispatcher then
+    persists all the entries of a :meth:`NotificationDispatcher.dispatch` run
+    in one call.
+    """
 
     def add(self, entry: NotificationAuditEntry) -> Any:  # pragma: no cover - protocol
         """Persist *entry* in the underlying storage backend."""
@@ -134,8 +147,39 @@ class NotificationDispatcher:
         dry_run: bool,
         playbook: str | None = None,
     ) -> dict[str, dict[str, int]]:
-        """Dispatch notification actions and return per-channel stats."""
+        """Dispatch notification actions and return per-channel stats.
+
+        When the audit repository provides ``add_many``, the audit entries of
+        the whole run are buffered and persisted with a single call at the end.
+        Entries for enqueued jobs are still stored right away, before a worker
+        can report on them.
+        """
+
+        add_many = getattr(self._audit_repository, "add_many", None)
+        buffered = _AUDIT_BUFFER.get()
+        if add_many is None or (buffered is not None and buffered[0] is self):
+            return self._dispatch(
+                evaluated_rows, actions, dry_run=dry_run, playbook=playbook
+            )
+        entries: list[NotificationAuditEntry] = []
+        token = _AUDIT_BUFFER.set((self, entries))
+        try:
+            return self._dispatch(
+                evaluated_rows, actions, dry_run=dry_run, playbook=playbook
+            )
+        finally:
+            _AUDIT_BUFFER.reset(token)
+            if entries:
+                add_many(entries)
 
+    def _dispatch(
+        self,
+        evaluated_rows: Iterable[EvaluatedRow],
+        actions: Iterable[Mapping[str, Any]],
+        *,
+        dry_run: bool,
+        playbook: str | None,
+    ) -> dict[str, dict[str, int]]:
         summary: dict[str, dict[str, int]] = {}
         for item in evaluated_rows:
             context = {
@@ -244,7 +288,8 @@ class NotificationDispatcher:
                         job_id=job_id,
                         job_name=self._job_name,
                         queue_name=queue_name,
-                    )
+                    ),
+                    defer=False,
                 )
                 stats["enqueued"] += 1
         return summary
@@ -447,9 +492,15 @@ class NotificationDispatcher:
         adapter = self._adapters.get(channel)
         return self._adapter_name(adapter) if adapter else channel
 
-    def _record_audit(self, entry: NotificationAuditEntry) -> None:
+    def _record_audit(
+        self, entry: NotificationAuditEntry, *, defer: bool = True
+    ) -> None:
         if self._audit_repository is None:
             return
+        buffered = _AUDIT_BUFFER.get()
+        if defer and buffered is not None and buffered[0] is self:
+            buffered[1].append(entry)
+            return
         self._audit_repository.add(entry)
 
     def _record_dry_run(
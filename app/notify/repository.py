@@ -4,14 +4,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models import Job, JobEvent, Notification
+from app.models import Job, JobEvent, JobStatus, Notification
 
 from .dispatcher import NotificationAuditEntry
 
+if TYPE_CHECKING:  # pragma: no cover - the asyncio extension needs greenlet
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 @dataclass(slots=True)
 class SQLANotificationRepository:
@@ -22,65 +26,153 @@ class SQLANotificationRepository:
     def add(self, entry: NotificationAuditEntry) -> Notification:
         session = self.session_factory()
         try:
-            job_record = None
-            if entry.job_id:
-                job_record = session.get(Job, entry.job_id)
-                if job_record is None:
-                    job_record = Job(
-                        id=entry.job_id,
-                        name=entry.job_name or entry.channel,
-                        queue_name=entry.queue_name,
-                        status=_map_job_status(entry.status),
-                        payload=entry.payload,
-                    )
-                    session.add(job_record)
-                else:
-                    job_record.name = entry.job_name or job_record.name
-                    job_record.queue_name = entry.queue_name or job_record.queue_name
-                    job_record.status = _map_job_status(entry.status)
-                    if entry.payload:
-                        job_record.payload = entry.payload
-                session.flush()
-
-            record = Notification(
-                playbook=entry.playbook,
-                channel=entry.channel,
-                adapter=entry.adapter,
-                recipient=entry.recipient,
-                subject=entry.subject,
-                status=entry.status,
-                payload=entry.payload,
-                response=entry.response,
-                error=entry.error,
-                job_id=entry.job_id,
-            )
-            if entry.status == "sent":
-                record.sent_at = datetime.now(timezone.utc)
+            job_record = _sync_job(session, entry) if entry.job_id else None
+            record = Notification(**_notification_values(entry))
             session.add(record)
             if job_record is not None:
-                event = JobEvent(
-                    job_id=job_record.id,
-                    event_type=f"notification.{entry.status}",
-                    message=entry.error or entry.subject,
-                    payload=entry.payload,
-                )
-                session.add(event)
+                session.add(JobEvent(**_job_event_values(entry)))
             session.commit()
             session.refresh(record)
             return record
         finally:
             session.close()
 
+    def add_many(self, entries: Iterable[NotificationAuditEntry]) -> int:
+        """Persist several entries in one transaction with multi-row INSERTs.
+
+        Unlike :meth:`add`, no ORM objects are returned; the number of stored
+        notifications is.
+        """
+
+        entries = list(entries)
+        if not entries:
+            return 0
+        session = self.session_factory()
+        try:
+            _store_many(session, entries)
+            session.commit()
+        finally:
+            session.close()
+        return len(entries)
 
-__all__ = ["SQLANotificationRepository"]
 
+@dataclass(slots=True)
+class AsyncSQLANotificationRepository:
+    """Persist notification audit entries through an asyncio session factory.
 
-def _map_job_status(status: str) -> str:
-    mapping = {
-        "queued": "queued",
-        "dry_run": "dry_run",
-        "quiet_hours": "paused",
-        "sent": "succeeded",
-        "error": "failed",
+    Awaiting :meth:`add_many` releases the event loop during the round-trips,
+    so concurrent dispatch coroutines overlap their audit writes.
+    """
+
+    session_factory: Callable[[], AsyncSession]
+
+    async def add_many(self, entries: Iterable[NotificationAuditEntry]) -> int:
+        """Async counterpart of :meth:`SQLANotificationRepository.add_many`."""
+
+        entries = list(entries)
+        if not entries:
+            return 0
+        async with self.session_factory() as session, session.begin():
+            await session.run_sync(_store_many, entries)
+        return len(entries)
+
+
+def _store_many(session: Session, entries: list[NotificationAuditEntry]) -> None:
+    _sync_jobs(session, entries)
+    Notification.bulk_create(
+        session, [_notification_values(entry) for entry in entries]
+    )
+    JobEvent.bulk_create(
+        session,
+        [_job_event_values(entry) for entry in entries if entry.job_id],
+    )
+
+
+def _sync_jobs(session: Session, entries: list[NotificationAuditEntry]) -> None:
+    """Create or update the jobs of *entries* with one lookup and one insert."""
+
+    latest = {entry.job_id: entry for entry in entries if entry.job_id}
+    if not latest:
+        return
+    for job_record in session.scalars(select(Job).where(Job.id.in_(latest))):
+        _update_job(job_record, latest.pop(job_record.id))
+    Job.bulk_create(session, [_job_values(entry) for entry in latest.values()])
+
+
+def _sync_job(session: Session, entry: NotificationAuditEntry) -> Job:
+    job_record = session.get(Job, entry.job_id)
+    if job_record is None:
+        job_record = Job(**_job_values(entry))
+        session.add(job_record)
+    else:
+        _update_job(job_record, entry)
+    session.flush()
+    return job_record
+
+
+def _job_values(entry: NotificationAuditEntry) -> dict[str, Any]:
+    return {
+        "id": entry.job_id,
+        "name": entry.job_name or entry.channel,
+        "queue_name": entry.queue_name,
+        "status": _map_job_status(entry.status),
+        "payload": entry.payload,
+    }
+
+
+def _update_job(job_record: Job, entry: NotificationAuditEntry) -> None:
+    job_record.name = entry.job_name or job_record.name
+    job_record.queue_name = entry.queue_name or job_record.queue_name
+    status = _map_job_status(entry.status)
+    # A worker may finish the job before the dispatcher's "queued" entry lands;
+    # never move a finished job back to a pending state.
+    if (
+        job_record.status not in _FINISHED_JOB_STATUSES
+        or status in _FINISHED_JOB_STATUSES
+    ):
+        job_record.status = status
+    if entry.payload:
+        job_record.payload = entry.payload
+
+
+def _notification_values(entry: NotificationAuditEntry) -> dict[str, Any]:
+    return {
+        "playbook": entry.playbook,
+        "channel": entry.channel,
+        "adapter": entry.adapter,
+        "recipient": entry.recipient,
+        "subject": entry.subject,
+        "status": entry.status,
+        "payload": entry.payload,
+        "response": entry.response,
+        "error": entry.error,
+        "job_id": entry.job_id,
+        "sent_at": datetime.now(timezone.utc) if entry.status == "sent" else None,
     }
-    return mapping.get(status, status)
+
+
+def _job_event_values(entry: NotificationAuditEntry) -> dict[str, Any]:
+    return {
+        "job_id": entry.job_id,
+        "event_type": f"notification.{entry.status}",
+        "message": entry.error or entry.subject,
+        "payload": entry.payload,
+    }
+
+
+_FINISHED_JOB_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED})
+
+_JOB_STATUS_BY_NOTIFICATION_STATUS = {
+    "queued": "queued",
+    "dry_run": "dry_run",
+    "quiet_hours": "paused",
+    "sent": "succeeded",
+    "error": "failed",
+}
+
+
+def _map_job_status(status: str) -> str:
+    return _JOB_STATUS_BY_NOTIFICATION_STATUS.get(status, status)
+
+
+__all__ = ["AsyncSQLANotificationRepository", "SQLANotificationRepository"]
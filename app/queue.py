@@ -13,5 +13,8 @@ redis_connection = Redis.from_url(settings.redis_url, decode_responses=False)
 notification_queue = Queue(connection=redis_connection)
 """Default RQ queue for notification jobs."""
 
+ingest_queue = Queue("ingest", connection=redis_connection)
+"""RQ queue for workbook ingestion offloaded from the uploads API."""
 
-__all__ = ["redis_connection", "notification_queue"]
+
+__all__ = ["redis_connection", "notification_queue", "ingest_queue"]
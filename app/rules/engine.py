@@ -1,10 +1,14 @@
 """Tiny declarative rule evaluator used for early prototyping."""
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from datetime import date, datetime
+import ast
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache, reduce
 from pathlib import Path
+from types import CodeType
 from typing import Any
 
 try:  # pragma: no cover - used in production environments
@@ -52,6 +56,10 @@ except ModuleNotFoundError:  # pragma: no cover - fallback parser for offline te
     yaml = _MiniYAML()  # type: ignore[assignment]
 
 
+class RuleEvaluationError(RuntimeError):
+    """Raised when the evaluation of a rule fails."""
+
+
 @dataclass(slots=True)
 class Rule:
     """In-memory representation of a declarative rule."""
@@ -59,10 +67,15 @@ class Rule:
     identifier: str
     description: str
     expression: str
+    code: CodeType = field(init=False, repr=False, compare=False)
 
-
-class RuleEvaluationError(RuntimeError):
-    """Raised when the evaluation of a rule fails."""
+    def __post_init__(self) -> None:
+        try:
+            self.code = compile(self.expression, f"<rule:{self.identifier}>", "eval")
+        except SyntaxError as exc:
+            raise RuleEvaluationError(
+                f"Invalid expression for rule '{self.identifier}': {exc}"
+            ) from exc
 
 
 SAFE_FUNCTIONS: dict[str, Callable[..., Any]] = {
@@ -71,6 +84,11 @@ SAFE_FUNCTIONS: dict[str, Callable[..., Any]] = {
     "days_until": lambda target: (target - date.today()).days,
 }
 
+_SAFE_GLOBALS: dict[str, Any] = {
+    "__builtins__": {"__import__": __import__},
+    **SAFE_FUNCTIONS,
+}
+
 
 class RuleSet:
     """Collection of :class:`Rule` loaded from a YAML document."""
@@ -102,9 +120,7 @@ class RuleSet:
             try:
                 results[rule.identifier] = bool(
                     eval(  # noqa: S307 - controlled environment for prototyping
-                        rule.expression,
-                        {"__builtins__": {"__import__": __import__}},
-                        {**SAFE_FUNCTIONS, **context},
+                        rule.code, _SAFE_GLOBALS, context
                     )
                 )
             except Exception as exc:  # pragma: no cover - surface detailed error
@@ -113,5 +129,176 @@ class RuleSet:
                 ) from exc
         return results
 
+    def to_sql_filters(self, columns: Mapping[str, Any]) -> dict[str, Any | None]:
+        """Translate each rule into a SQLAlchemy boolean expression when possible.
+
+        ``columns`` maps the keys available in ``row`` to SQLAlchemy columns. Rules
+        built from comparisons, ``and``/``or``/``not``, ``today()``,
+        ``parse_date`` and ``days_until`` against integer offsets are lowered;
+        any other rule maps to ``None`` and must be evaluated in Python.
+        """
+
+        lowering = _SQLLowering(columns, date.today())
+        return {rule.identifier: lowering.lower(rule.expression) for rule in self._rules}
+
+
+DEFAULT_RULESET_PATH = Path(__file__).resolve().parent / "rulesets" / "enrollments.yaml"
+
+
+@lru_cache(maxsize=None)
+def get_default_ruleset(path: str | Path = DEFAULT_RULESET_PATH) -> RuleSet:
+    """Return the process-wide cached :class:`RuleSet` loaded from *path*."""
+
+    return RuleSet.from_yaml(path)
+
+
+class _NotLowerable(Exception):
+    """Internal signal raised when a rule cannot be expressed in SQL."""
+
+
+@dataclass(slots=True)
+class _Operand:
+    kind: str  # "column", "date_column", "days_until" or "constant"
+    value: Any
+
+
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+class _SQLLowering:
+    """Lower the supported subset of rule expressions to SQLAlchemy clauses."""
+
+    def __init__(self, columns: Mapping[str, Any], today: date):
+        self._columns = columns
+        self._today = today
+
+    def lower(self, expression: str) -> Any | None:
+        try:
+            return self._boolean(ast.parse(expression, mode="eval").body)
+        except (_NotLowerable, SyntaxError, ValueError):
+            return None
+
+    def _boolean(self, node: ast.expr) -> Any:
+        if isinstance(node, ast.BoolOp):
+            combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+            return reduce(combine, [self._boolean(value) for value in node.values])
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ~self._boolean(node.operand)
+        if isinstance(node, ast.Compare):
+            operands = [self._operand(item) for item in [node.left, *node.comparators]]
+            clauses = [
+                self._compare(left, op, right)
+                for left, op, right in zip(operands, node.ops, operands[1:])
+            ]
+            return reduce(operator.and_, clauses)
+        raise _NotLowerable(ast.dump(node))
+
+    def _operand(self, node: ast.expr) -> _Operand:
+        if isinstance(node, ast.Constant):
+            return _Operand("constant", node.value)
+        if (
+            isinstance(node, ast.UnaryOp)
+            and isinstance(node.op, ast.USub)
+            and isinstance(node.operand, ast.Constant)
+            and isinstance(node.operand.value, (int, float))
+        ):
+            return _Operand("constant", -node.operand.value)
+        if (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "row"
+            and isinstance(node.slice, ast.Constant)
+            and node.slice.value in self._columns
+        ):
+            return _Operand("column", self._columns[node.slice.value])
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            name, args = node.func.id, node.args
+            if name == "today" and not args:
+                return _Operand("constant", self._today)
+            if name == "parse_date" and len(args) == 1:
+                inner = self._operand(args[0])
+                if inner.kind == "column" and _python_type(inner.value) is date:
+                    return _Operand("date_column", inner.value)
+                if inner.kind == "constant" and isinstance(inner.value, str):
+                    return _Operand("constant", datetime.fromisoformat(inner.value).date())
+            if name == "days_until" and len(args) == 1:
+                inner = self._operand(args[0])
+                if inner.kind == "date_column":
+                    return _Operand("days_until", inner.value)
+                if inner.kind == "constant" and isinstance(inner.value, date):
+                    return _Operand("constant", (inner.value - self._today).days)
+        raise _NotLowerable(ast.dump(node))
+
+    def _compare(self, left: _Operand, op: ast.cmpop, right: _Operand) -> Any:
+        if isinstance(op, (ast.Is, ast.IsNot)):
+            if left.kind != "column" or right.kind != "constant" or right.value is not None:
+                raise _NotLowerable("identity checks only support 'column is None'")
+            if isinstance(op, ast.Is):
+                return left.value.is_(None)
+            return left.value.is_not(None)
+
+        compare = _COMPARISONS.get(type(op))
+        if compare is None:
+            raise _NotLowerable(type(op).__name__)
+
+        # ``days_until(d) <op> n`` is equivalent to ``d <op> today + n days``.
+        left, right = self._shift_days(left, right), self._shift_days(right, left)
+        if "constant" == left.kind == right.kind or "days_until" in (left.kind, right.kind):
+            raise _NotLowerable("comparison needs a column and a compatible operand")
+        for operand, other in ((left, right), (right, left)):
+            if operand.kind == "constant" and (
+                operand.value is None or not self._compatible(operand.value, other)
+            ):
+                raise _NotLowerable("constant type does not match column")
+        if isinstance(op, (ast.Eq, ast.NotEq)):
+            # Python treats ``None == value`` as a plain boolean, so use the
+            # NULL-safe SQL operators to keep both evaluations in agreement.
+            if left.kind == "constant":
+                left, right = right, left
+            if isinstance(op, ast.Eq):
+                return left.value.is_not_distinct_from(right.value)
+            return left.value.is_distinct_from(right.value)
+        return compare(left.value, right.value)
+
+    def _shift_days(self, operand: _Operand, other: _Operand) -> _Operand:
+        if operand.kind == "days_until" and other.kind == "constant":
+            if isinstance(other.value, int) and not isinstance(other.value, bool):
+                return _Operand("date_column", operand.value)
+        if operand.kind == "constant" and other.kind == "days_until":
+            if isinstance(operand.value, int) and not isinstance(operand.value, bool):
+                return _Operand("constant", self._today + timedelta(days=operand.value))
+        return operand
+
+    @staticmethod
+    def _compatible(value: Any, other: _Operand) -> bool:
+        if other.kind == "date_column":
+            return isinstance(value, date)
+        expected = _python_type(other.value)
+        if expected is None or isinstance(value, date) or expected is date:
+            return isinstance(value, date) and expected is date
+        if expected in (int, float):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        return isinstance(value, expected)
+
+
+def _python_type(column: Any) -> type | None:
+    try:
+        return column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
 
-__all__ = ["Rule", "RuleSet", "RuleEvaluationError"]
+__all__ = [
+    "DEFAULT_RULESET_PATH",
+    "Rule",
+    "RuleSet",
+    "RuleEvaluationError",
+    "get_default_ruleset",
+]
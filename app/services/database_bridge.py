@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy import create_engine
 
 from app.config import settings
 
-from app.db import SessionLocal
-from app.integrations.sql_bridge import DatabaseBridgeService, ExternalSQLClient
+from app.db import (
+    bulk_execution_options,
+    get_session_factory,
+    json_options,
+    pool_options,
+)
+from app.integrations.sql_bridge import (
+    DatabaseBridgeService,
+    ExternalSQLClient,
+)
 
 
 def build_external_sql_client() -> ExternalSQLClient | None:
@@ -22,10 +30,18 @@ def build_external_sql_client() -> ExternalSQLClient | None:
             "external_sql_database_url must be configured when the bridge is enabled"
         )
 
+    url = make_url(settings.external_sql_database_url)
     engine: Engine = create_engine(
-        settings.external_sql_database_url,
+        url,
         future=True,
         echo=settings.external_sql_echo,
+        **pool_options(
+            url,
+            pool_size=settings.external_sql_pool_size,
+            max_overflow=settings.external_sql_max_overflow,
+        ),
+        **bulk_execution_options(url),
+        **json_options(),
     )
     return ExternalSQLClient(engine)
 
@@ -36,7 +52,7 @@ def build_database_bridge_service() -> DatabaseBridgeService | None:
     client = build_external_sql_client()
     if client is None:
         return None
-    return DatabaseBridgeService(SessionLocal, client)
+    return DatabaseBridgeService(get_session_factory(), client)
 
 
 __all__ = [
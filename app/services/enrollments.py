@@ -2,15 +2,92 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from datetime import date
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, selectinload
 
 from ..models import Course, Enrollment, Notification, Student
 from ..rules.engine import RuleSet
 
 
+SERIALIZED_ENROLLMENT_COLUMNS = (
+    Enrollment.id,
+    Enrollment.course_id,
+    Enrollment.student_id,
+    Enrollment.status,
+    Enrollment.progress_hours,
+    Enrollment.last_notified_at,
+)
+"""Enrollment columns read by :func:`serialize_enrollment`, for ``load_only``."""
+
+SERIALIZED_STUDENT_COLUMNS = (
+    Student.id,
+    Student.full_name,
+    Student.email,
+    Student.certificate_expires_at,
+)
+"""Student columns read by :func:`serialize_enrollment`, for ``load_only``."""
+
+SERIALIZED_COURSE_COLUMNS = (
+    Course.id,
+    Course.name,
+    Course.deadline_date,
+    Course.hours_required,
+)
+"""Course columns read by :func:`serialize_enrollment`, for ``load_only``."""
+
+ENROLLMENT_RELATIONS = (
+    selectinload(Enrollment.course),
+    selectinload(Enrollment.student),
+    selectinload(Enrollment.contact),
+)
+"""Loader options fetching each relation with one ``IN`` query per batch.
+
+The relationships are ``lazy="raise"``: pass these to ``.options()`` whenever
+:class:`Enrollment` entities are loaded and their related rows are read.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RuleRow:
+    """Fields exposed to rule expressions as ``row``.
+
+    Rules index it like a mapping (``row['status']``); being frozen it also
+    serves directly as the memoization key for rule results.
+    """
+
+    certificate_expires_at: str | None
+    deadline_date: str | None
+    progress_hours: float | None
+    hours_required: int | None
+    status: str | None
+
+    @classmethod
+    def from_records(
+        cls, enrollment: Enrollment, student: Student, course: Course | None
+    ) -> "RuleRow":
+        return cls(
+            certificate_expires_at=_to_iso(student.certificate_expires_at),
+            deadline_date=_to_iso(course.deadline_date) if course else None,
+            progress_hours=float(enrollment.progress_hours or 0.0),
+            hours_required=course.hours_required if course else None,
+            status=enrollment.status,
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
 @dataclass(slots=True)
 class EnrollmentEvaluation:
     """Container with serialization and rule evaluation metadata."""
@@ -59,12 +136,81 @@ def evaluate_enrollment(
     """Evaluate *enrollment* against configured rules and return metadata."""
 
     payload = serialize_enrollment(enrollment, student, course)
-    rule_row = _build_rule_row(payload)
-    rule_results = ruleset.evaluate({"row": rule_row})
+    rule_results = evaluate_rules(
+        enrollment=enrollment, student=student, course=course, ruleset=ruleset
+    )
     violations = [key for key, matched in rule_results.items() if matched]
     return EnrollmentEvaluation(payload=payload, rule_results=rule_results, violations=violations)
 
 
+def evaluate_rules(
+    *,
+    enrollment: Enrollment,
+    student: Student,
+    course: Course | None,
+    ruleset: RuleSet,
+) -> dict[str, Any]:
+    """Return rule results for *enrollment* without building its API payload."""
+
+    rule_row = RuleRow.from_records(enrollment, student, course)
+    return dict(_evaluate_rule_row(ruleset, date.today(), rule_row))
+
+
+def clear_evaluation_cache() -> None:
+    """Drop memoized rule results, e.g. after ingesting new enrollment data."""
+
+    _evaluate_rule_row.cache_clear()
+
+
+def iter_enrollments_lite(
+    session: Session, *columns: Any, chunk_size: int = 1000
+) -> Iterator[Row[Any]]:
+    """Stream enrollments joined to their student as plain ``Row`` tuples.
+
+    Only *columns* are selected and no ORM instances are built, which suits
+    read-only scans; use the :class:`Enrollment` entity for writes.
+    """
+
+    statement = (
+        select(*columns)
+        .select_from(Enrollment)
+        .join(Student, Enrollment.student_id == Student.id)
+        .execution_options(yield_per=chunk_size, stream_results=True)
+    )
+    yield from session.execute(statement)
+
+
+def count_non_compliant_by_course(
+    session: Session, courses: Iterable[Course], ruleset: RuleSet
+) -> dict[int, int]:
+    """Count, per course id, the enrollments matching at least one rule."""
+
+    courses_by_id = {course.id: course for course in courses}
+    today = date.today()
+    counts: dict[int, int] = {}
+    rows = iter_enrollments_lite(
+        session,
+        Enrollment.course_id,
+        Enrollment.progress_hours,
+        Enrollment.status,
+        Student.certificate_expires_at,
+    )
+    for course_id, progress_hours, status, certificate_expires_at in rows:
+        course = courses_by_id.get(course_id)
+        if course is None:
+            continue
+        rule_row = RuleRow(
+            certificate_expires_at=_to_iso(certificate_expires_at),
+            deadline_date=_to_iso(course.deadline_date),
+            progress_hours=float(progress_hours or 0.0),
+            hours_required=course.hours_required,
+            status=status,
+        )
+        if any(value for _, value in _evaluate_rule_row(ruleset, today, rule_row)):
+            counts[course_id] = counts.get(course_id, 0) + 1
+    return counts
+
+
 def summarize_notifications(
     session: Session, *, enrollment_ids: Iterable[int]
 ) -> dict[int, dict[str, int]]:
@@ -89,16 +235,12 @@ def summarize_notifications(
     return summary
 
 
-def _build_rule_row(payload: dict[str, Any]) -> dict[str, Any]:
-    course = payload.get("course") or {}
-    student = payload.get("student") or {}
-    return {
-        "certificate_expires_at": student.get("certificate_expires_at"),
-        "deadline_date": course.get("deadline_date"),
-        "progress_hours": payload.get("progress_hours"),
-        "hours_required": course.get("hours_required"),
-        "status": payload.get("status"),
-    }
+@lru_cache(maxsize=4096)
+def _evaluate_rule_row(
+    ruleset: RuleSet, today: date, row: RuleRow
+) -> tuple[tuple[str, Any], ...]:
+    # ``today`` is part of the key because rules are relative to the current date.
+    return tuple(ruleset.evaluate({"row": row}).items())
 
 
 def _to_iso(value: Any) -> str | None:
@@ -108,8 +250,17 @@ def _to_iso(value: Any) -> str | None:
 
 
 __all__ = [
+    "ENROLLMENT_RELATIONS",
+    "SERIALIZED_COURSE_COLUMNS",
+    "SERIALIZED_ENROLLMENT_COLUMNS",
+    "SERIALIZED_STUDENT_COLUMNS",
     "EnrollmentEvaluation",
+    "RuleRow",
+    "clear_evaluation_cache",
+    "count_non_compliant_by_course",
     "evaluate_enrollment",
+    "evaluate_rules",
+    "iter_enrollments_lite",
     "serialize_enrollment",
     "summarize_notifications",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import time
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, TypeVar
 
 import pandas as pd
 import yaml
@@ -15,6 +15,8 @@ from app.queue import notification_queue
 from app.rules.engine import RuleSet
 
 
+T = TypeVar("T")
+
 DEFAULT_PLAYBOOKS_DIR = (
     Path(__file__).resolve().parents[2] / "workflows" / "playbooks"
 )
@@ -46,6 +48,7 @@ class WorkflowRunner:
         self._repository_root = self._playbooks_dir.parents[1]
         self._queue = queue
         self._dispatcher_factory = dispatcher_factory or self._default_dispatcher_factory
+        self._file_cache: dict[tuple[str, Path], tuple[int, Any]] = {}
 
     def run(self, playbook_name: str, *, dry_run: bool) -> dict[str, Any]:
         """Execute the requested playbook either in dry-run or live mode."""
@@ -72,8 +75,23 @@ class WorkflowRunner:
             "summary": summary,
         }
 
+    def _cached(self, kind: str, path: Path, loader: Callable[[Path], T]) -> T:
+        """Return ``loader(path)``, reused until the file modification time changes."""
+
+        mtime = path.stat().st_mtime_ns
+        key = (kind, path)
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        value = loader(path)
+        self._file_cache[key] = (mtime, value)
+        return value
+
     def _load_playbook(self, identifier: str) -> Playbook:
         path = self._resolve_playbook_path(identifier)
+        return self._cached("playbook", path, self._parse_playbook)
+
+    def _parse_playbook(self, path: Path) -> Playbook:
         with path.open("r", encoding="utf-8") as fh:
             data = yaml.safe_load(fh) or {}
 
@@ -131,10 +149,10 @@ class WorkflowRunner:
 
     def _evaluate_rows(self, playbook: Playbook) -> Iterable[EvaluatedRow]:
         dataframe = self._load_dataframe(playbook)
-        mapping = self._load_mapping(playbook.mapping_path)
+        mapping = self._cached("mapping", playbook.mapping_path, self._load_mapping)
         rename_map = {value: key for key, value in mapping.get("columns", {}).items()}
         dataframe = dataframe.rename(columns=rename_map)
-        ruleset = RuleSet.from_yaml(playbook.ruleset_path)
+        ruleset = self._cached("ruleset", playbook.ruleset_path, RuleSet.from_yaml)
 
         for row in dataframe.to_dict(orient="records"):
             cleaned_row = {key: self._normalize_value(value) for key, value in row.items()}
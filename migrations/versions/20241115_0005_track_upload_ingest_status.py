@@ -0,0 +1,31 @@
+"""Track ingestion status and results for uploaded files."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20241115_0005"
+down_revision = "20241101_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "uploaded_files",
+        sa.Column(
+            "status",
+            sa.String(length=50),
+            nullable=False,
+            server_default="ingested",
+        ),
+    )
+    op.add_column("uploaded_files", sa.Column("error", sa.Text(), nullable=True))
+    op.add_column("uploaded_files", sa.Column("result", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("uploaded_files", "result")
+    op.drop_column("uploaded_files", "error")
+    op.drop_column("uploaded_files", "status")
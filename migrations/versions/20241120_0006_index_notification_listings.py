@@ -0,0 +1,56 @@
+"""Index notifications for the filtered, newest-first audit listing."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20241120_0006"
+down_revision = "20241115_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction on PostgreSQL.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_created_at_id",
+            "notifications",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_notifications_status_channel_created_at",
+            "notifications",
+            ["status", "channel", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_notifications_recipient",
+            "notifications",
+            ["recipient"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_notifications_recipient",
+            table_name="notifications",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_notifications_status_channel_created_at",
+            table_name="notifications",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_notifications_created_at_id",
+            table_name="notifications",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""Index the status-filtered scans on enrollments, notifications and jobs."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0007"
+down_revision = "20241120_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction on PostgreSQL.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_enrollments_status_last_notified_at",
+            "enrollments",
+            ["status", "last_notified_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_notifications_status_created_at_id",
+            "notifications",
+            ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_jobs_status_queue_name",
+            "jobs",
+            ["status", "queue_name"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_status_queue_name",
+            table_name="jobs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_notifications_status_created_at_id",
+            table_name="notifications",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_enrollments_status_last_notified_at",
+            table_name="enrollments",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,62 @@
+"""Store JSON documents as JSONB on PostgreSQL and index notification payloads."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0008"
+down_revision = "20261016_0007"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = (
+    ("contacts", "attributes"),
+    ("courses", "attributes"),
+    ("enrollments", "attributes"),
+    ("uploaded_files", "result"),
+    ("notifications", "payload"),
+    ("notifications", "response"),
+    ("jobs", "payload"),
+    ("job_events", "payload"),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    # Other backends keep their native JSON type; only PostgreSQL has JSONB.
+    if not _is_postgresql():
+        return
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE JSONB USING {column}::jsonb"
+        )
+    # CONCURRENTLY cannot run inside a transaction on PostgreSQL.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_payload_gin",
+            "notifications",
+            ["payload"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_notifications_payload_gin",
+            table_name="notifications",
+            postgresql_concurrently=True,
+        )
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE JSON USING {column}::json"
+        )
@@ -0,0 +1,53 @@
+"""Narrow job identifiers and stored upload paths to their real sizes."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0009"
+down_revision = "20261016_0008"
+branch_labels = None
+depends_on = None
+
+# Job ids are uuid4 hex strings (32 chars), ``rq-`` + hex (35) or RQ's own
+# uuid4 ids (36); 64 leaves headroom while shrinking the FK indexes.
+JOB_ID_COLUMNS = (
+    ("jobs", "id"),
+    ("notifications", "job_id"),
+    ("job_events", "job_id"),
+)
+
+
+def upgrade() -> None:
+    for table, column in JOB_ID_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=191),
+                type_=sa.String(length=64),
+            )
+    with op.batch_alter_table("uploaded_files") as batch_op:
+        batch_op.alter_column(
+            "stored_path",
+            existing_type=sa.String(length=512),
+            type_=sa.String(length=255),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("uploaded_files") as batch_op:
+        batch_op.alter_column(
+            "stored_path",
+            existing_type=sa.String(length=255),
+            type_=sa.String(length=512),
+            existing_nullable=False,
+        )
+    for table, column in reversed(JOB_ID_COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=64),
+                type_=sa.String(length=191),
+            )
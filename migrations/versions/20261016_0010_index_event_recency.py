@@ -0,0 +1,49 @@
+"""Index job events by recency and notifications by created_at ranges."""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0010"
+down_revision = "20261016_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    # CONCURRENTLY cannot run inside a transaction on PostgreSQL.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_events_created_at",
+            "job_events",
+            [sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        if is_postgresql:
+            op.create_index(
+                "ix_notifications_created_at_brin",
+                "notifications",
+                ["created_at"],
+                unique=False,
+                postgresql_using="brin",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        if is_postgresql:
+            op.drop_index(
+                "ix_notifications_created_at_brin",
+                table_name="notifications",
+                postgresql_concurrently=True,
+            )
+        op.drop_index(
+            "ix_job_events_created_at",
+            table_name="job_events",
+            postgresql_concurrently=True,
+        )
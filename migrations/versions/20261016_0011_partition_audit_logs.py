@@ -0,0 +1,192 @@
+"""Partition notifications and job events by month on PostgreSQL."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0011"
+down_revision = "20261016_0010"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+CRON_JOB_NAME = "prl-monthly-partitions"
+
+# Foreign keys and indexes declared on the ORM models, recreated on the new table.
+FOREIGN_KEYS = {
+    "notifications": (
+        ("enrollment_id", "enrollments", "SET NULL"),
+        ("job_id", "jobs", "SET NULL"),
+    ),
+    "job_events": (("job_id", "jobs", "CASCADE"),),
+}
+INDEXES = {
+    "notifications": (
+        ("ix_notifications_enrollment_id", "btree", "enrollment_id"),
+        ("ix_notifications_job_id", "btree", "job_id"),
+        ("ix_notifications_created_at_id", "btree", "created_at DESC, id DESC"),
+        (
+            "ix_notifications_status_channel_created_at",
+            "btree",
+            "status, channel, created_at DESC",
+        ),
+        ("ix_notifications_recipient", "btree", "recipient"),
+        ("ix_notifications_payload_gin", "gin", "payload"),
+        ("ix_notifications_created_at_brin", "brin", "created_at"),
+        (
+            "ix_notifications_status_created_at_id",
+            "btree",
+            "status, created_at DESC, id DESC",
+        ),
+    ),
+    "job_events": (
+        ("ix_job_events_job_id", "btree", "job_id"),
+        ("ix_job_events_created_at", "btree", "created_at DESC"),
+    ),
+}
+
+# Months whose rows already reached the DEFAULT partition (a late or missing
+# run) cannot be created while those rows sit there: detach the default, create
+# the month, move its rows over and re-attach the default.
+ENSURE_PARTITIONS_SQL = """
+CREATE OR REPLACE FUNCTION prl_ensure_monthly_partitions(
+    parent text, start_month date, months_ahead integer DEFAULT 3
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    month date := date_trunc('month', start_month)::date;
+    next_month date;
+    last_month date := (
+        date_trunc('month', now()) + make_interval(months => months_ahead)
+    )::date;
+    partition_name text;
+    default_name text := parent || '_default';
+    stray_rows boolean;
+BEGIN
+    WHILE month <= last_month LOOP
+        next_month := (month + interval '1 month')::date;
+        partition_name := parent || '_' || to_char(month, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            stray_rows := false;
+            IF to_regclass(default_name) IS NOT NULL THEN
+                EXECUTE format(
+                    'SELECT EXISTS (SELECT 1 FROM %I '
+                    'WHERE created_at >= %L AND created_at < %L)',
+                    default_name, month, next_month
+                ) INTO stray_rows;
+            END IF;
+            IF stray_rows THEN
+                EXECUTE format(
+                    'ALTER TABLE %I DETACH PARTITION %I', parent, default_name
+                );
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, parent, month, next_month
+            );
+            IF stray_rows THEN
+                EXECUTE format(
+                    'INSERT INTO %I SELECT * FROM %I '
+                    'WHERE created_at >= %L AND created_at < %L',
+                    parent, default_name, month, next_month
+                );
+                EXECUTE format(
+                    'DELETE FROM %I WHERE created_at >= %L AND created_at < %L',
+                    default_name, month, next_month
+                );
+                EXECUTE format(
+                    'ALTER TABLE %I ATTACH PARTITION %I DEFAULT',
+                    parent, default_name
+                );
+                RAISE WARNING
+                    'prl_ensure_monthly_partitions: filas de % movidas de % a %',
+                    month, default_name, partition_name;
+            END IF;
+        END IF;
+        month := next_month;
+    END LOOP;
+END
+$$
+"""
+
+SCHEDULE_CRON_SQL = f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            '{CRON_JOB_NAME}',
+            '0 3 1 * *',
+            'SELECT prl_ensure_monthly_partitions(''notifications'', current_date);'
+            'SELECT prl_ensure_monthly_partitions(''job_events'', current_date);'
+        );
+    END IF;
+END
+$$
+"""
+
+UNSCHEDULE_CRON_SQL = f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule(jobname) FROM cron.job
+        WHERE jobname = '{CRON_JOB_NAME}';
+    END IF;
+END
+$$
+"""
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _swap_table(table: str, *, partitioned: bool) -> None:
+    """Rebuild *table* with the same columns, copying rows and its id sequence."""
+
+    old = f"{table}_old"
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    partition_clause = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS){partition_clause}"
+    )
+    if partitioned:
+        # Cover every month already stored, plus a catch-all for stray dates.
+        op.execute(
+            f"SELECT prl_ensure_monthly_partitions('{table}', "
+            f"COALESCE((SELECT min(created_at) FROM {old}), now())::date, "
+            f"{MONTHS_AHEAD})"
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    # Unique constraints on a partitioned table must include the partition key.
+    primary_key = "id, created_at" if partitioned else "id"
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})")
+    for column, referred, ondelete in FOREIGN_KEYS[table]:
+        op.execute(
+            f"ALTER TABLE {table} ADD FOREIGN KEY ({column}) "
+            f"REFERENCES {referred} (id) ON DELETE {ondelete}"
+        )
+    for name, method, columns in INDEXES[table]:
+        op.execute(f"CREATE INDEX {name} ON {table} USING {method} ({columns})")
+
+
+def upgrade() -> None:
+    # Only PostgreSQL supports declarative partitioning; others keep plain tables.
+    if not _is_postgresql():
+        return
+    op.execute(ENSURE_PARTITIONS_SQL)
+    for table in FOREIGN_KEYS:
+        _swap_table(table, partitioned=True)
+    op.execute(SCHEDULE_CRON_SQL)
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    op.execute(UNSCHEDULE_CRON_SQL)
+    for table in FOREIGN_KEYS:
+        _swap_table(table, partitioned=False)
+    op.execute("DROP FUNCTION prl_ensure_monthly_partitions(text, date, integer)")
@@ -0,0 +1,64 @@
+"""Store notification responses as flagged, optionally compressed JSON bytes."""
+
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0012"
+down_revision = "20261016_0011"
+branch_labels = None
+depends_on = None
+
+# Leading flag byte written by ``app.models.CompressedJSON``.
+PLAIN = b"\x00"
+COMPRESSED = b"\x01"
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if _is_postgresql():
+        op.execute(
+            "ALTER TABLE notifications ALTER COLUMN response TYPE bytea "
+            "USING decode('00', 'hex') || convert_to(response::text, 'UTF8')"
+        )
+        return
+    # Elsewhere existing rows keep their JSON text, which the type still reads.
+    with op.batch_alter_table("notifications") as batch_op:
+        batch_op.alter_column(
+            "response", existing_type=sa.JSON(), type_=sa.LargeBinary()
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, response FROM notifications WHERE response IS NOT NULL")
+    ).all()
+    postgresql = _is_postgresql()
+    for row_id, value in rows:
+        if isinstance(value, str):
+            continue
+        value = bytes(value)
+        raw = value[1:]
+        if value[:1] == COMPRESSED:
+            raw = zlib.decompress(raw)
+        bind.execute(
+            sa.text("UPDATE notifications SET response = :response WHERE id = :id"),
+            {"response": PLAIN + raw if postgresql else raw.decode(), "id": row_id},
+        )
+    if postgresql:
+        op.execute(
+            "ALTER TABLE notifications ALTER COLUMN response TYPE jsonb "
+            "USING convert_from(substring(response from 2), 'UTF8')::jsonb"
+        )
+        return
+    with op.batch_alter_table("notifications") as batch_op:
+        batch_op.alter_column(
+            "response", existing_type=sa.LargeBinary(), type_=sa.JSON()
+        )
@@ -0,0 +1,47 @@
+"""Replace single-column enrollment FK indexes with (fk, status) composites."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0013"
+down_revision = "20261016_0012"
+branch_labels = None
+depends_on = None
+
+# (replaced index, composite index, foreign key column)
+INDEXES = (
+    ("ix_enrollments_course_id", "ix_enrollments_course_id_status", "course_id"),
+    ("ix_enrollments_student_id", "ix_enrollments_student_id_status", "student_id"),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction on PostgreSQL.
+    with op.get_context().autocommit_block():
+        for old_name, new_name, column in INDEXES:
+            op.create_index(
+                new_name,
+                "enrollments",
+                [column, "status"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                old_name, table_name="enrollments", postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for old_name, new_name, column in reversed(INDEXES):
+            op.create_index(
+                old_name,
+                "enrollments",
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                new_name, table_name="enrollments", postgresql_concurrently=True
+            )
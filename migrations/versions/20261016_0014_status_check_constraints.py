@@ -0,0 +1,52 @@
+"""Restrict status/source labels to their closed sets with CHECK constraints."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0014"
+down_revision = "20261016_0013"
+branch_labels = None
+depends_on = None
+
+# (table, constraint, column, allowed values) mirroring the enums in app.models.
+CHECKS = (
+    (
+        "notifications",
+        "ck_notifications_status",
+        "status",
+        ("queued", "quiet_hours", "dry_run", "sent", "error"),
+    ),
+    (
+        "jobs",
+        "ck_jobs_status",
+        "status",
+        ("queued", "dry_run", "paused", "succeeded", "failed"),
+    ),
+    ("courses", "ck_courses_source", "source", ("xlsx", "moodle")),
+)
+
+
+def _condition(column: str, values: tuple[str, ...]) -> str:
+    return f"{column} IN ({', '.join(repr(value) for value in values)})"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # NOT VALID + VALIDATE scans existing rows without blocking writes.
+        for table, name, column, values in CHECKS:
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+                f"CHECK ({_condition(column, values)}) NOT VALID"
+            )
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+        return
+    for table, name, column, values in CHECKS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_check_constraint(name, _condition(column, values))
+
+
+def downgrade() -> None:
+    for table, name, _column, _values in reversed(CHECKS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(name, type_="check")
@@ -98,7 +98,7 @@ def test_course_list_and_detail(monkeypatch):
         )
         session.commit()
 
-    monkeypatch.setattr(courses_module, "_RULESET_CACHE", StubRuleSet())
+    monkeypatch.setattr(courses_module, "get_ruleset", lambda: StubRuleSet())
 
     with SessionFactory() as session:
         data = courses_module.list_courses(session=session)
@@ -138,7 +138,7 @@ def test_course_update(monkeypatch):
         session.commit()
         course_id = course.id
 
-    monkeypatch.setattr(courses_module, "_RULESET_CACHE", StubRuleSet())
+    monkeypatch.setattr(courses_module, "get_ruleset", lambda: StubRuleSet())
 
     payload = courses_module.CourseUpdatePayload(
         deadline_date=date(2024, 11, 1),
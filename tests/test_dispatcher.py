@@ -196,3 +196,127 @@ def test_deliver_records_errors():
 
     assert repository.entries
     assert repository.entries[0].status == "error"
+
+
+class BatchAuditRepository(StubAuditRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def add_many(self, entries):
+        self.batches.append(list(entries))
+        return len(entries)
+
+
+def test_dispatch_persists_audits_in_one_batch():
+    repository = BatchAuditRepository()
+    dispatcher = NotificationDispatcher(audit_repository=repository)
+    evaluated = [
+        EvaluatedRow(row={"telefono": f"+34{i}"}, rule_results={"debe_notificar": True})
+        for i in range(3)
+    ]
+
+    dispatcher.dispatch(evaluated, _build_actions(), dry_run=True, playbook="demo")
+
+    assert repository.entries == []
+    assert len(repository.batches) == 1
+    assert [entry.status for entry in repository.batches[0]] == ["dry_run"] * 3
+
+
+def test_dispatch_stores_queued_audits_right_after_enqueue():
+    repository = BatchAuditRepository()
+    stored_before_enqueue: list[int] = []
+
+    class RecordingQueue(StubQueue):
+        def enqueue(self, job_name, **options):
+            stored_before_enqueue.append(len(repository.entries))
+            return super().enqueue(job_name, **options)
+
+    dispatcher = NotificationDispatcher(
+        queue=RecordingQueue(), audit_repository=repository
+    )
+    evaluated = [
+        EvaluatedRow(row={"telefono": f"+34{i}"}, rule_results={"debe_notificar": True})
+        for i in range(3)
+    ]
+
+    dispatcher.dispatch(evaluated, _build_actions(), dry_run=False, playbook="demo")
+
+    assert stored_before_enqueue == [0, 1, 2]
+    assert [entry.status for entry in repository.entries] == ["queued"] * 3
+    assert repository.batches == []
+
+
+def test_sqla_repository_add_many_writes_notifications_and_events():
+    from sqlalchemy import create_engine, func, select
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.models import Base, Job, JobEvent, Notification
+    from app.notify.dispatcher import NotificationAuditEntry
+    from app.notify.repository import SQLANotificationRepository
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    repository = SQLANotificationRepository(session_factory=SessionLocal)
+    entries = [
+        NotificationAuditEntry(
+            playbook="demo",
+            channel="sms",
+            adapter="stub",
+            recipient=f"+34{i}",
+            subject="Aviso",
+            status="queued",
+            payload={"n": i},
+            job_id="job-1" if i < 2 else None,
+        )
+        for i in range(3)
+    ]
+
+    assert repository.add_many(entries) == 3
+
+    with SessionLocal() as session:
+        assert session.scalar(select(func.count()).select_from(Notification)) == 3
+        assert session.scalar(select(func.count()).select_from(JobEvent)) == 2
+        assert session.get(Job, "job-1").status == "queued"
+
+
+def test_sqla_repository_add_many_keeps_finished_jobs_finished():
+    from sqlalchemy import create_engine, func, select
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.models import Base, Job, JobEvent
+    from app.notify.dispatcher import NotificationAuditEntry
+    from app.notify.repository import SQLANotificationRepository
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as session:
+        session.add(Job(id="job-done", name="worker", status="succeeded"))
+        session.commit()
+
+    repository = SQLANotificationRepository(session_factory=SessionLocal)
+    entries = [
+        NotificationAuditEntry(
+            playbook="demo",
+            channel="sms",
+            adapter="stub",
+            recipient="+34",
+            subject="Aviso",
+            status="queued",
+            payload={},
+            job_id=job_id,
+        )
+        for job_id in ("job-done", "job-new-1", "job-new-2")
+    ]
+
+    assert repository.add_many(entries) == 3
+
+    with SessionLocal() as session:
+        assert session.get(Job, "job-done").status == "succeeded"
+        assert session.get(Job, "job-new-1").status == "queued"
+        assert session.get(Job, "job-new-2").status == "queued"
+        assert session.scalar(select(func.count()).select_from(JobEvent)) == 3
@@ -0,0 +1,103 @@
+from datetime import date
+
+from app.models import Course, Enrollment, Student
+from app.services import enrollments as enrollment_service
+
+
+class CountingRuleSet:
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, context):
+        self.calls += 1
+        row = context["row"]
+        return {"horas_insuficientes": row["progress_hours"] < row["hours_required"]}
+
+
+def test_evaluate_enrollment_memoizes_identical_rows():
+    enrollment_service.clear_evaluation_cache()
+    ruleset = CountingRuleSet()
+    course = Course(id=1, name="PRL", hours_required=10, deadline_date=date(2024, 6, 1))
+
+    evaluations = []
+    for index in range(3):
+        student = Student(
+            id=index,
+            full_name=f"Alumno {index}",
+            email=f"alumno{index}@example.com",
+            course=course.name,
+            certificate_expires_at=date(2025, 1, 1),
+        )
+        enrollment = Enrollment(
+            id=index, course_id=1, student_id=index, progress_hours=4.0, status="active"
+        )
+        evaluations.append(
+            enrollment_service.evaluate_enrollment(
+                enrollment=enrollment, student=student, course=course, ruleset=ruleset
+            )
+        )
+
+    assert ruleset.calls == 1
+    assert all(ev.violations == ["horas_insuficientes"] for ev in evaluations)
+    assert evaluations[2].payload["student"]["full_name"] == "Alumno 2"
+
+    enrollment_service.clear_evaluation_cache()
+    enrollment_service.evaluate_enrollment(
+        enrollment=enrollment, student=student, course=course, ruleset=ruleset
+    )
+    assert ruleset.calls == 2
+
+
+def test_rule_row_evaluates_like_a_mapping():
+    from app.rules.engine import get_default_ruleset
+
+    row = enrollment_service.RuleRow(
+        certificate_expires_at="2020-01-01",
+        deadline_date="2020-02-01",
+        progress_hours=2.0,
+        hours_required=10,
+        status="active",
+    )
+    ruleset = get_default_ruleset()
+    mapping = {field: row[field] for field in row.__slots__}
+
+    assert ruleset.evaluate({"row": row}) == ruleset.evaluate({"row": mapping})
+    assert row.get("missing") is None
+
+
+def test_enrollment_relations_load_eagerly_and_lazy_loads_raise():
+    import pytest
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from app.models import Base
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        course = Course(name="PRL", hours_required=10, deadline_date=date(2024, 6, 1))
+        student = Student(
+            full_name="Ana",
+            email="ana@example.com",
+            course="PRL",
+            certificate_expires_at=date(2025, 1, 1),
+        )
+        session.add_all([course, student])
+        session.flush()
+        session.add(Enrollment(course_id=course.id, student_id=student.id))
+        session.commit()
+
+    with Session(engine) as session:
+        enrollment = session.scalars(select(Enrollment)).one()
+        with pytest.raises(InvalidRequestError):
+            enrollment.course
+
+    with Session(engine) as session:
+        enrollment = session.scalars(
+            select(Enrollment).options(*enrollment_service.ENROLLMENT_RELATIONS)
+        ).one()
+        assert enrollment.course.name == "PRL"
+        assert enrollment.student.full_name == "Ana"
+        assert enrollment.contact is None
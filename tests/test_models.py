@@ -1,5 +1,9 @@
 from datetime import date
 
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
+
 from app.models import Student, StudentModel
 
 
@@ -17,3 +21,137 @@ def test_student_model_serializes_from_orm():
     assert model.full_name == "Ana Pérez"
     assert model.email == "ana@example.com"
     assert model.certificate_expires_at == date(2025, 5, 20)
+
+
+def test_json_columns_round_trip_through_orjson_hooks():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from app.db import json_options
+    from app.models import Base, Job
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, **json_options())
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            Job(id="job-1", name="sync", payload={"fecha": date(2025, 5, 20), 1: "a"})
+        )
+        session.commit()
+
+    with Session(engine) as session:
+        assert session.get(Job, "job-1").payload == {"fecha": "2025-05-20", "1": "a"}
+
+
+def test_validate_many_and_dump_many_reuse_one_adapter():
+    students = [
+        Student(
+            id=index,
+            full_name=f"Alumno {index}",
+            email=f"alumno{index}@example.com",
+            course="PRL",
+            certificate_expires_at=date(2025, 1, index),
+        )
+        for index in (1, 2)
+    ]
+
+    models = StudentModel.validate_many(students)
+    dumped = StudentModel.dump_many(models, mode="json")
+
+    assert [model.id for model in models] == [1, 2]
+    assert dumped[1]["certificate_expires_at"] == "2025-01-02"
+
+
+def test_models_are_frozen_and_reject_extra_fields():
+    model = StudentModel(
+        id=1,
+        full_name="Ana Pérez",
+        email="ana@example.com",
+        course="PRL Básico",
+        certificate_expires_at=date(2025, 5, 20),
+    )
+
+    with pytest.raises(ValidationError):
+        model.email = "otro@example.com"
+    with pytest.raises(ValidationError):
+        StudentModel.model_validate({**model.model_dump(), "unexpected": True})
+    assert len({model, model.model_copy()}) == 1
+
+
+def test_async_database_url_targets_psycopg_async_driver():
+    from app.db import async_database_url
+
+    url = async_database_url("postgresql+psycopg2://prl:secret@db:5432/prl")
+    assert url.drivername == "postgresql+psycopg"
+    assert url.host == "db" and url.database == "prl"
+    with pytest.raises(ValueError):
+        async_database_url("sqlite:///./data/prl_notifier.db")
+
+
+def test_notification_response_is_compressed_above_threshold():
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from app.models import Base, CompressedJSON, Notification
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    small = {"status": 200}
+    large = {"body": "x" * 4096}
+
+    with Session(engine) as session:
+        for response in (small, large, None):
+            session.add(
+                Notification(
+                    channel="email", adapter="smtp", status="sent", response=response
+                )
+            )
+        session.commit()
+
+    with engine.connect() as connection:
+        stored = (
+            connection.execute(text("SELECT response FROM notifications ORDER BY id"))
+            .scalars()
+            .all()
+        )
+    assert stored[0][:1] == CompressedJSON.PLAIN
+    assert stored[1][:1] == CompressedJSON.COMPRESSED
+    assert len(stored[1]) < 4096
+    assert stored[2] is None
+
+    with Session(engine) as session:
+        responses = session.scalars(
+            select(Notification.response).order_by(Notification.id)
+        ).all()
+    assert responses == [small, large, None]
+
+
+def test_timestamps_are_assigned_client_side_on_insert():
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from app.models import Base, Job, JobEvent
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Job(id="job-1", name="sync"))
+        event = JobEvent(job_id="job-1", event_type="notification.sent")
+        session.add(event)
+        session.flush()
+
+        assert "created_at" not in inspect(event).expired_attributes
+        assert event.created_at.tzinfo is not None
+
+
+def test_intern_label_skips_enum_members_and_none():
+    from app.models import NotificationStatus, _intern_label
+
+    label = "".join(["whats", "app"])
+    assert _intern_label(label) is _intern_label("whatsapp")
+    assert _intern_label(NotificationStatus.SENT) is NotificationStatus.SENT
+    assert _intern_label(None) is None
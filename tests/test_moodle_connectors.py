@@ -1,6 +1,14 @@
+import asyncio
+
+import httpx
 import pytest
 
-from app.connectors.moodle import MoodleAPIError, MoodleRESTClient, MoodleSOAPClient
+from app.connectors.moodle import (
+    MoodleAPIError,
+    MoodleRESTClient,
+    MoodleSOAPAsyncClient,
+    MoodleSOAPClient,
+)
 
 
 class DummyResponse:
@@ -120,8 +128,9 @@ def test_soap_client_builds_envelope_with_token():
 
     url, content, headers = transport.calls[0]
     assert url == "https://moodle.example/wsdl"
-    assert "abc123" in content
-    assert "core:some" in content
+    assert isinstance(content, bytes)
+    assert b"abc123" in content
+    assert b"core:some" in content
     assert headers["Content-Type"].startswith("text/xml")
 
 
@@ -135,3 +144,51 @@ def test_soap_client_respects_feature_flag():
 
     with pytest.raises(MoodleAPIError):
         client.call("core_function")
+
+
+def test_soap_clients_share_default_transport():
+    first = MoodleSOAPClient(wsdl_url="https://moodle.example/wsdl", token="a", enabled=True)
+    second = MoodleSOAPClient(wsdl_url="https://moodle.example/wsdl", token="b", enabled=True)
+
+    assert first._transport is second._transport
+
+    first.close()
+    assert not second._transport.is_closed
+
+
+def test_soap_client_escapes_parameter_values():
+    transport = DummyHTTPClient({"status": "ok"})
+    client = MoodleSOAPClient(
+        wsdl_url="https://moodle.example/wsdl",
+        token="a&b",
+        enabled=True,
+        transport=transport,
+    )
+
+    client.call("core_function", search='<Ana & "Luis">')
+
+    _, content, _ = transport.calls[0]
+    assert b"<core:token>a&amp;b</core:token>" in content
+    assert b"<core:search>&lt;Ana &amp; &quot;Luis&quot;&gt;</core:search>" in content
+
+
+def test_soap_async_client_posts_envelope():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text="<ok/>")
+
+    async def run():
+        async with MoodleSOAPAsyncClient(
+            wsdl_url="https://moodle.example/wsdl",
+            token="abc123",
+            enabled=True,
+            transport=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await client.call("core_function", some="value")
+
+    response = asyncio.run(run())
+
+    assert response.text == "<ok/>"
+    assert b"<core:some>value</core:some>" in requests[0].content
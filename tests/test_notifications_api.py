@@ -61,3 +61,106 @@ def test_list_notifications_filters():
         assert set(metadata["channels"]) == {"email", "whatsapp"}
         assert "sent" in metadata["statuses"]
         assert "jobs" in metadata
+
+
+def test_metadata_is_cached_until_notifications_change():
+    SessionFactory = _create_session_factory()
+    notifications_module.clear_metadata_cache()
+
+    with SessionFactory() as session:
+        session.add(
+            Notification(
+                channel="email", adapter="EmailSMTPAdapter", status="sent", payload={}
+            )
+        )
+        session.commit()
+        first = notifications_module.metadata(session=session)
+
+    with SessionFactory() as session:
+        # Plain table inserts bypass the ORM hooks, so the cached value is served.
+        session.execute(
+            Notification.__table__.insert().values(
+                channel="sms", adapter="CLIAdapter", status="sent", payload={}
+            )
+        )
+        session.commit()
+        assert notifications_module.metadata(session=session) is first
+
+    with SessionFactory() as session:
+        session.add(
+            Notification(
+                channel="whatsapp",
+                adapter="WhatsAppCLIAdapter",
+                status="sent",
+                payload={},
+            )
+        )
+        session.commit()
+        refreshed = notifications_module.metadata(session=session)
+
+    assert refreshed["channels"] == ["email", "sms", "whatsapp"]
+
+
+def test_metadata_cache_is_cleared_by_repository_bulk_writes():
+    from app.notify.dispatcher import NotificationAuditEntry
+    from app.notify.repository import SQLANotificationRepository
+
+    SessionFactory = _create_session_factory()
+    notifications_module.clear_metadata_cache()
+
+    with SessionFactory() as session:
+        assert notifications_module.metadata(session=session)["channels"] == []
+
+    repository = SQLANotificationRepository(session_factory=SessionFactory)
+    repository.add_many(
+        [
+            NotificationAuditEntry(
+                playbook="demo",
+                channel="sms",
+                adapter="CLIAdapter",
+                recipient="+34",
+                subject=None,
+                status="dry_run",
+                payload={},
+                job_id="job-1",
+            )
+        ]
+    )
+
+    with SessionFactory() as session:
+        assert notifications_module.metadata(session=session)["channels"] == ["sms"]
+
+
+def test_list_notifications_keyset_pagination():
+    SessionFactory = _create_session_factory()
+
+    with SessionFactory() as session:
+        session.add_all(
+            [
+                Notification(
+                    channel="email",
+                    adapter="EmailSMTPAdapter",
+                    recipient=f"user{index}@example.com",
+                    status="sent",
+                    payload={},
+                    created_at=datetime(2024, 1, 1 + index // 2, 9, 0),
+                )
+                for index in range(5)
+            ]
+        )
+        session.commit()
+
+    seen: list[str] = []
+    with SessionFactory() as session:
+        page = notifications_module.list_notifications(limit=2, session=session)
+        assert page["total"] == 5
+        while True:
+            seen.extend(item["recipient"] for item in page["items"])
+            if not page["has_more"]:
+                break
+            page = notifications_module.list_notifications(
+                limit=2, cursor=page["next_cursor"], session=session
+            )
+            assert page["total"] is None
+
+    assert seen == [f"user{index}@example.com" for index in (4, 3, 2, 1, 0)]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import sqlite3
 from datetime import datetime, timedelta, timezone
@@ -9,6 +10,7 @@ import httpx
 import pytest
 
 from app.integrations.prevengos import (
+    PrevengosAPIAsyncClient,
     PrevengosAPIClient,
     PrevengosCSVAdapter,
     PrevengosDBAdapter,
@@ -16,7 +18,11 @@ from app.integrations.prevengos import (
     PrevengosSyncService,
     PrevengosTrainingRecord,
 )
-from app.integrations.prevengos.models import ISO_FORMAT
+from app.integrations.prevengos.models import (
+    ISO_FORMAT,
+    format_timestamp,
+    parse_timestamp,
+)
 
 
 @pytest.fixture()
@@ -44,6 +50,43 @@ def test_csv_adapter_roundtrip(tmp_path: Path, sample_record: PrevengosTrainingR
     )
 
 
+def test_csv_adapter_streams_generators_with_extra_fields(
+    tmp_path: Path, sample_record: PrevengosTrainingRecord
+) -> None:
+    adapter = PrevengosCSVAdapter(tmp_path / "training.csv")
+    with_extra = PrevengosTrainingRecord(
+        employee_nif="87654321B",
+        contract_code="C-002",
+        course_code="PRL-ALTURAS",
+        status="in_progress",
+        hours_completed=2.5,
+        last_update=sample_record.last_update,
+        extra={"centro": "Sevilla"},
+    )
+
+    adapter.write_records(record for record in (sample_record, with_extra))
+    records = list(adapter.iter_records())
+
+    assert [record.identity_key() for record in records] == [
+        sample_record.identity_key(),
+        with_extra.identity_key(),
+    ]
+    assert records[0].extra == {"centro": ""}
+    assert records[1].extra == {"centro": "Sevilla"}
+
+
+@pytest.mark.parametrize(
+    "offset", [timedelta(0), timedelta(hours=2), -timedelta(hours=3, minutes=30)]
+)
+def test_timestamp_helpers_match_iso_format(offset: timedelta) -> None:
+    value = datetime(2024, 4, 1, 10, 5, 9, tzinfo=timezone(offset))
+
+    assert format_timestamp(value) == value.strftime(ISO_FORMAT)
+    assert parse_timestamp(value.strftime(ISO_FORMAT)) == value
+    with pytest.raises(ValueError):
+        parse_timestamp("2024-04-01T10:05:09")
+
+
 def test_api_client_fetch_and_push(sample_record: PrevengosTrainingRecord) -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         if request.url.path == "/contracts/C-001":
@@ -96,6 +139,49 @@ def _sqlite_factory(rows: list[tuple[str, str, str, str, float, str]]):
     return factory
 
 
+def test_api_client_pushes_in_chunks(sample_record: PrevengosTrainingRecord) -> None:
+    batch_sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        batch_sizes.append(len(body))
+        return httpx.Response(200, json=[{"status": "accepted"}] * len(body))
+
+    client = PrevengosAPIClient(
+        base_url="https://prevengos.local",
+        client=httpx.Client(
+            base_url="https://prevengos.local", transport=httpx.MockTransport(handler)
+        ),
+    )
+
+    results = client.push_training_records([sample_record] * 5, chunk_size=2)
+
+    assert batch_sizes == [2, 2, 1]
+    assert len(results) == 5
+
+
+def test_sync_service_fetches_contracts_concurrently(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        code = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"code": code})
+
+    async def run() -> dict[str, object]:
+        async with PrevengosAPIAsyncClient(
+            base_url="https://prevengos.local",
+            client=httpx.AsyncClient(
+                base_url="https://prevengos.local",
+                transport=httpx.MockTransport(handler),
+            ),
+        ) as api_client:
+            service = PrevengosSyncService(
+                csv_adapter=PrevengosCSVAdapter(tmp_path / "unused.csv"),
+                async_api_client=api_client,
+            )
+            return await service.fetch_contracts_metadata(["C-001", "C-002", "C-001"])
+
+    assert asyncio.run(run()) == {"C-001": {"code": "C-001"}, "C-002": {"code": "C-002"}}
+
+
 def test_db_adapter_fetch_records(sample_record: PrevengosTrainingRecord) -> None:
     rows = [
         (
@@ -118,6 +204,135 @@ def test_db_adapter_fetch_records(sample_record: PrevengosTrainingRecord) -> Non
     assert later == []
 
 
+def test_db_adapter_reuses_connection_until_closed(
+    sample_record: PrevengosTrainingRecord,
+) -> None:
+    row = (
+        sample_record.employee_nif,
+        sample_record.contract_code,
+        sample_record.course_code,
+        sample_record.status,
+        sample_record.hours_completed,
+        sample_record.last_update.strftime(ISO_FORMAT),
+    )
+    factory = _sqlite_factory([row])
+    opened: list[sqlite3.Connection] = []
+
+    def counting_factory() -> sqlite3.Connection:
+        opened.append(factory())
+        return opened[-1]
+
+    with PrevengosDBAdapter(connection_factory=counting_factory) as adapter:
+        adapter.fetch_training_records()
+        adapter.fetch_training_records()
+        assert len(opened) == 1
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute("SELECT 1")
+
+
+def test_db_adapter_upserts_in_batches(
+    monkeypatch: pytest.MonkeyPatch, sample_record: PrevengosTrainingRecord
+) -> None:
+    import app.integrations.prevengos.db_adapter as db_adapter_module
+
+    class RecordingCursor:
+        def __init__(self) -> None:
+            self.statements: list[str] = []
+            self.batches: list[list[tuple[object, ...]]] = []
+            self.fast_executemany = False
+            self.connection = self
+
+        def execute(self, query: str) -> None:
+            self.statements.append(query)
+
+        def executemany(self, query: str, params: list[tuple[object, ...]]) -> None:
+            assert query.startswith("INSERT INTO #prl_training_staging")
+            self.batches.append(params)
+
+        def fetchone(self) -> tuple[int]:
+            assert "OUTPUT $action" in self.statements[-1]
+            return (sum(len(batch) for batch in self.batches),)
+
+        def commit(self) -> None:
+            return None
+
+    class RecordingConnection:
+        def __init__(self) -> None:
+            self.cursor_obj = RecordingCursor()
+
+        def cursor(self) -> RecordingCursor:
+            return self.cursor_obj
+
+        def close(self) -> None:
+            return None
+
+    connection = RecordingConnection()
+    monkeypatch.setattr(db_adapter_module, "UPSERT_BATCH_SIZE", 2)
+    adapter = PrevengosDBAdapter(connection_factory=lambda: connection)
+
+    records = [
+        PrevengosTrainingRecord(
+            employee_nif=f"{index}{sample_record.employee_nif}",
+            contract_code=sample_record.contract_code,
+            course_code=sample_record.course_code,
+            status=sample_record.status,
+            hours_completed=sample_record.hours_completed,
+            last_update=sample_record.last_update,
+        )
+        for index in range(5)
+    ]
+    affected = adapter.upsert_training_records(iter(records))
+
+    assert affected == 5
+    assert connection.cursor_obj.fast_executemany is True
+    assert [len(batch) for batch in connection.cursor_obj.batches] == [2, 2, 1]
+    assert [statement.split()[0] for statement in connection.cursor_obj.statements] == [
+        "CREATE",
+        "SET",
+        "DROP",
+    ]
+    assert connection.cursor_obj.batches[0][0][0] == records[0].employee_nif
+
+
+def test_db_adapter_upsert_collapses_repeated_keys(
+    sample_record: PrevengosTrainingRecord,
+) -> None:
+    class StagingCursor:
+        def __init__(self) -> None:
+            self.staged: list[tuple[object, ...]] = []
+            self.connection = self
+
+        def execute(self, query: str) -> None:
+            return None
+
+        def executemany(self, query: str, params: list[tuple[object, ...]]) -> None:
+            self.staged.extend(params)
+
+        def fetchone(self) -> tuple[int]:
+            return (len(self.staged),)
+
+        def commit(self) -> None:
+            return None
+
+    cursor = StagingCursor()
+    connection = type("Connection", (), {"cursor": lambda self: cursor})()
+    adapter = PrevengosDBAdapter(connection_factory=lambda: connection)
+    pending = PrevengosTrainingRecord(
+        employee_nif=sample_record.employee_nif,
+        contract_code=sample_record.contract_code,
+        course_code=sample_record.course_code,
+        status="pending",
+        hours_completed=0,
+        last_update=sample_record.last_update,
+    )
+
+    affected = adapter.upsert_training_records([pending, sample_record])
+
+    assert affected == 1
+    assert [row[3] for row in cursor.staged] == ["completed"]
+
+
 def test_sync_service_reconcile_and_push(
     tmp_path: Path, sample_record: PrevengosTrainingRecord
 ) -> None:
@@ -174,6 +389,23 @@ def test_sync_service_reconcile_and_push(
     assert push_response == [{"status": "accepted"}]
 
 
+def test_reconcile_keeps_latest_duplicate_across_utc_offsets(tmp_path: Path) -> None:
+    key = ("12345678A", "C-001", "PRL-BASICO")
+    # Text ORDER BY puts the 11:00Z row before the 10:00Z one (12:00+02:00).
+    rows = [
+        (*key, "completed", 6.0, "2024-04-01T11:00:00+0000"),
+        (*key, "pending", 0.0, "2024-04-01T12:00:00+0200"),
+    ]
+    service = PrevengosSyncService(
+        csv_adapter=PrevengosCSVAdapter(tmp_path / "prevengos.csv"),
+        db_adapter=PrevengosDBAdapter(connection_factory=_sqlite_factory(rows)),
+    )
+
+    merged = service.reconcile_with_database()
+
+    assert [record.status for record in merged] == ["completed"]
+
+
 def test_sync_service_requires_clients(
     tmp_path: Path, sample_record: PrevengosTrainingRecord
 ) -> None:
@@ -188,3 +420,34 @@ def test_sync_service_requires_clients(
 
     with pytest.raises(PrevengosIntegrationError):
         service.fetch_contract_metadata("C-001")
+
+
+def test_sync_service_appends_new_records_without_rewrite(
+    tmp_path: Path, sample_record: PrevengosTrainingRecord
+) -> None:
+    csv_adapter = PrevengosCSVAdapter(tmp_path / "prevengos.csv")
+    csv_adapter.write_records([sample_record])
+
+    new_row = (
+        "87654321B",
+        sample_record.contract_code,
+        sample_record.course_code,
+        "pending",
+        0.0,
+        sample_record.last_update.strftime(ISO_FORMAT),
+    )
+    service = PrevengosSyncService(
+        csv_adapter=csv_adapter,
+        db_adapter=PrevengosDBAdapter(connection_factory=_sqlite_factory([new_row])),
+    )
+
+    def fail_rewrite(records):  # pragma: no cover - only runs on regression
+        raise AssertionError("CSV should be appended, not rewritten")
+
+    csv_adapter.write_records = fail_rewrite  # type: ignore[method-assign]
+    merged = service.reconcile_with_database()
+
+    assert len(merged) == 2
+    stored = csv_adapter.read_records()
+    assert [record.employee_nif for record in stored] == ["12345678A", "87654321B"]
+    assert (tmp_path / "prevengos.csv").read_bytes().count("\ufeff".encode()) == 1
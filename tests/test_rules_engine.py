@@ -22,3 +22,90 @@ def test_ruleset_evaluates_yaml_expressions(tmp_path: Path):
 
     assert ruleset.evaluate({"row": expired_row}) == {"vencido": True, "proximo": False}
     assert ruleset.evaluate({"row": upcoming_row}) == {"vencido": False, "proximo": True}
+
+
+def test_ruleset_lowers_rules_to_sql_filters():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.models import Base, Course, Enrollment, Student
+
+    ruleset = RuleSet.from_yaml(
+        Path(__file__).resolve().parents[1] / "app" / "rules" / "rulesets" / "enrollments.yaml"
+    )
+    columns = {
+        "certificate_expires_at": Student.certificate_expires_at,
+        "progress_hours": Enrollment.progress_hours,
+        "hours_required": Course.hours_required,
+    }
+    filters = ruleset.to_sql_filters(columns)
+    assert set(filters) == {"vencido", "vence_pronto", "horas_insuficientes"}
+    assert all(clause is not None for clause in filters.values())
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    today = date.today()
+    with Session(engine) as session:
+        course = Course(name="PRL", hours_required=10, deadline_date=today)
+        session.add(course)
+        session.flush()
+        for index, (offset, hours) in enumerate([(-3, 12.0), (5, 12.0), (40, 2.0), (40, 10.0)]):
+            student = Student(
+                full_name=f"Alumno {index}",
+                email=f"alumno{index}@example.com",
+                course="PRL",
+                certificate_expires_at=today + timedelta(days=offset),
+            )
+            session.add(student)
+            session.flush()
+            session.add(
+                Enrollment(course_id=course.id, student_id=student.id, progress_hours=hours)
+            )
+        session.commit()
+
+        rows = (
+            session.query(Enrollment, Student, Course)
+            .join(Student, Enrollment.student_id == Student.id)
+            .join(Course, Enrollment.course_id == Course.id)
+            .all()
+        )
+        for rule_id, clause in filters.items():
+            matched = {
+                enrollment.id
+                for enrollment in session.query(Enrollment)
+                .join(Student, Enrollment.student_id == Student.id)
+                .join(Course, Enrollment.course_id == Course.id)
+                .filter(clause)
+            }
+            expected = {
+                enrollment.id
+                for enrollment, student, course_obj in rows
+                if ruleset.evaluate(
+                    {
+                        "row": {
+                            "certificate_expires_at": student.certificate_expires_at.isoformat(),
+                            "progress_hours": enrollment.progress_hours,
+                            "hours_required": course_obj.hours_required,
+                        }
+                    }
+                )[rule_id]
+            }
+            assert matched == expected, rule_id
+
+
+def test_ruleset_leaves_unsupported_rules_to_python(tmp_path: Path):
+    from app.models import Enrollment
+
+    ruleset_file = tmp_path / "rules.yaml"
+    ruleset_file.write_text(
+        """
+    rules:
+      - id: estado
+        when: "row['status'] in ('pending', 'active')"
+    """,
+        encoding="utf-8",
+    )
+
+    filters = RuleSet.from_yaml(ruleset_file).to_sql_filters({"status": Enrollment.status})
+
+    assert filters == {"estado": None}
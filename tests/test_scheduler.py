@@ -1,6 +1,6 @@
 from datetime import datetime, time
 
-from app.jobs.scheduler import QuietHours
+from app.jobs.scheduler import QuietHours, Scheduler
 
 
 def test_quiet_hours_blocks_time_range():
@@ -9,3 +9,37 @@ def test_quiet_hours_blocks_time_range():
     assert quiet.allows(datetime(2024, 1, 1, 10, 0)) is True
     assert quiet.allows(datetime(2024, 1, 1, 22, 0)) is False
     assert quiet.allows(datetime(2024, 1, 2, 7, 30)) is False
+
+
+def test_quiet_hours_same_day_window_and_boundaries():
+    quiet = QuietHours(start=time(13, 0), end=time(15, 0))
+
+    assert quiet.allows(datetime(2024, 1, 1, 12, 59, 59)) is True
+    assert quiet.allows(datetime(2024, 1, 1, 13, 0)) is False
+    assert quiet.allows(datetime(2024, 1, 1, 15, 0)) is True
+    assert (
+        QuietHours(start=time(9, 0), end=time(9, 0)).allows(datetime(2024, 1, 1))
+        is False
+    )
+
+
+def test_scheduler_runs_jobs_on_thread_pool_without_overlap():
+    scheduler = Scheduler(max_workers=4)
+    scheduler.schedule_interval("sync", lambda: None, minutes=5)
+    scheduler.start()
+    try:
+        job = scheduler._scheduler.get_job("sync")
+        assert job.coalesce is True
+        assert job.max_instances == 1
+        assert job.executor == "default"
+    finally:
+        scheduler.shutdown()
+
+
+def test_quiet_hours_allows_now_caches_recent_verdict(monkeypatch):
+    quiet = QuietHours(start=time(0, 0), end=time(23, 59, 59))
+    verdict = quiet.allows_now()
+
+    monkeypatch.setattr(QuietHours, "allows", lambda self, now: not verdict)
+    assert quiet.allows_now() is verdict
+    assert quiet.allows_now(max_age=0) is (not verdict)
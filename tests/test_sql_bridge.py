@@ -5,7 +5,7 @@ from __future__ import annotations
 import pathlib
 
 import pytest
-from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event, select
 from sqlalchemy.orm import sessionmaker
 
 from app.integrations.sql_bridge import (
@@ -46,6 +46,28 @@ def test_external_sql_client_streams_results(tmp_path):
     assert streamed == [{"id": i, "value": f"item-{i}"} for i in range(5)]
 
 
+def test_batch_reuses_one_connection_and_rolls_back_together(tmp_path):
+    engine = _sqlite_engine(tmp_path / "external_batch.db")
+    client = ExternalSQLClient(engine)
+    client.execute("CREATE TABLE payload (id INTEGER, value TEXT)")
+    checkouts = []
+    event.listen(engine, "checkout", lambda *args: checkouts.append(args))
+
+    with client.batch():
+        client.execute("DELETE FROM payload")
+        client.execute_many(
+            "INSERT INTO payload (id, value) VALUES (:id, :value)",
+            [{"id": i, "value": f"item-{i}"} for i in range(3)],
+        )
+    assert len(checkouts) == 1
+
+    with pytest.raises(RuntimeError):
+        with client.batch():
+            client.execute("DELETE FROM payload")
+            raise RuntimeError("boom")
+    assert len(client.fetch_all("SELECT id FROM payload")) == 3
+
+
 def test_database_bridge_sync_query_to_external(tmp_path):
     local_engine = _sqlite_engine(tmp_path / "local.db")
     metadata = MetaData()
@@ -79,6 +101,60 @@ def test_database_bridge_sync_query_to_external(tmp_path):
     assert rows == [{"id": 1, "value": "uno"}, {"id": 2, "value": "dos"}]
 
 
+def test_database_bridge_sync_query_to_external_with_prefetch(tmp_path):
+    local_engine = _sqlite_engine(tmp_path / "local_prefetch.db")
+    metadata = MetaData()
+    source = Table("source", metadata, Column("id", Integer, primary_key=True))
+    metadata.create_all(local_engine)
+    SessionLocal = sessionmaker(bind=local_engine, future=True)
+    with SessionLocal() as session:
+        session.execute(source.insert(), [{"id": i} for i in range(1, 8)])
+        session.commit()
+
+    client = ExternalSQLClient(_sqlite_engine(tmp_path / "external_prefetch.db"))
+    client.execute("CREATE TABLE target (id INTEGER)")
+
+    bridge = DatabaseBridgeService(SessionLocal, client)
+    inserted = bridge.sync_query_to_external(
+        select(source.c.id), target_table="target", chunk_size=2, prefetch=1
+    )
+
+    assert inserted == 7
+    rows = client.fetch_all("SELECT id FROM target ORDER BY id")
+    assert [row["id"] for row in rows] == list(range(1, 8))
+
+
+def test_sync_query_uses_execute_many_for_postgresql_without_copy_driver(
+    tmp_path, monkeypatch
+):
+    local_engine = _sqlite_engine(tmp_path / "local_pg8000.db")
+    metadata = MetaData()
+    source = Table("source", metadata, Column("id", Integer, primary_key=True))
+    metadata.create_all(local_engine)
+    SessionLocal = sessionmaker(bind=local_engine, future=True)
+    with SessionLocal() as session:
+        session.execute(source.insert(), [{"id": 1}, {"id": 2}])
+        session.commit()
+
+    external_engine = _sqlite_engine(tmp_path / "external_pg8000.db")
+    client = ExternalSQLClient(external_engine)
+    client.execute("CREATE TABLE target (id INTEGER)")
+    # Present the engine as PostgreSQL reached through a driver without COPY.
+    monkeypatch.setattr(external_engine.dialect, "name", "postgresql")
+    monkeypatch.setattr(external_engine.dialect, "driver", "pg8000")
+    assert client.supports_copy is False
+
+    bridge = DatabaseBridgeService(SessionLocal, client)
+    inserted = bridge.sync_query_to_external(select(source.c.id), target_table="target")
+
+    assert inserted == 2
+    rows = client.fetch_all("SELECT id FROM target ORDER BY id")
+    assert [row["id"] for row in rows] == [1, 2]
+
+    monkeypatch.setattr(external_engine.dialect, "driver", "psycopg")
+    assert client.supports_copy is True
+
+
 def test_database_bridge_import_external(tmp_path):
     local_engine = _sqlite_engine(tmp_path / "local_import.db")
     metadata = MetaData()
@@ -117,6 +193,180 @@ def test_database_bridge_import_external(tmp_path):
         assert result.all() == [(10, "diez"), (11, "once")]
 
 
+def test_import_external_flushes_between_commits(tmp_path):
+    client = ExternalSQLClient(_sqlite_engine(tmp_path / "external_flush.db"))
+    client.execute("CREATE TABLE source (id INTEGER)")
+    client.execute_many(
+        "INSERT INTO source (id) VALUES (:id)", [{"id": i} for i in range(10)]
+    )
+    calls: list[str] = []
+
+    class RecordingSession:
+        def flush(self):
+            calls.append("flush")
+
+        def commit(self):
+            calls.append("commit")
+
+        def close(self):
+            calls.append("close")
+
+    bridge = DatabaseBridgeService(RecordingSession, client)
+    processed = bridge.import_external(
+        "SELECT id FROM source",
+        lambda session, row: None,
+        commit_interval=6,
+        flush_interval=2,
+    )
+
+    assert processed == 10
+    assert calls == ["flush", "flush", "commit", "flush", "flush", "commit", "close"]
+
+
 def test_validate_identifier_rejects_invalid_names():
     with pytest.raises(ExternalSQLBridgeError):
         ExternalSQLClient.validate_identifier("invalid name")
+
+
+@pytest.mark.parametrize("identifier", ["dbo.", "a..b", "users\n", "tabla_ñ", "1abc"])
+def test_validate_identifier_rejects_malformed_segments(identifier):
+    with pytest.raises(ExternalSQLBridgeError):
+        ExternalSQLClient.validate_identifier(identifier)
+
+
+def test_validate_identifier_accepts_schema_qualified_names():
+    assert ExternalSQLClient.validate_identifier("dbo.students_2") == "dbo.students_2"
+
+
+def test_execute_many_sends_parameters_in_chunks(tmp_path):
+    engine = _sqlite_engine(tmp_path / "external_chunks.db")
+    client = ExternalSQLClient(engine)
+    client.execute("CREATE TABLE payload (id INTEGER)")
+
+    affected = client.execute_many(
+        "INSERT INTO payload (id) VALUES (:id)",
+        ({"id": i} for i in range(7)),
+        chunk_size=3,
+    )
+
+    assert affected == 7
+    assert client.fetch_all("SELECT COUNT(*) AS total FROM payload") == [{"total": 7}]
+
+
+def test_execute_many_skips_connection_for_empty_parameters(tmp_path):
+    engine = _sqlite_engine(tmp_path / "external_empty.db")
+    client = ExternalSQLClient(engine)
+    checkouts = []
+    event.listen(engine, "checkout", lambda *args: checkouts.append(args))
+
+    assert client.execute_many("INSERT INTO missing (id) VALUES (:id)", iter(())) == 0
+    assert client.execute_many("INSERT INTO missing (id) VALUES (:id)", []) == 0
+    assert checkouts == []
+
+
+def test_fetch_all_returns_row_mappings_unless_factory_given(tmp_path):
+    engine = _sqlite_engine(tmp_path / "external_rows.db")
+    client = ExternalSQLClient(engine)
+    client.execute("CREATE TABLE data (id INTEGER, value TEXT)")
+    client.execute("INSERT INTO data (id, value) VALUES (1, 'uno')")
+
+    rows = client.fetch_all("SELECT id, value FROM data")
+    assert rows == [{"id": 1, "value": "uno"}]
+    assert not isinstance(rows[0], dict)
+
+    copies = list(client.stream("SELECT id, value FROM data", row_factory=dict))
+    assert copies == [{"id": 1, "value": "uno"}]
+    assert isinstance(copies[0], dict)
+
+
+def test_database_bridge_import_external_rows_in_batches(tmp_path):
+    local_engine = _sqlite_engine(tmp_path / "local_bulk.db")
+    metadata = MetaData()
+    destination = Table(
+        "destination",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("value", String(50)),
+    )
+    metadata.create_all(local_engine)
+    SessionLocal = sessionmaker(bind=local_engine, future=True)
+
+    client = ExternalSQLClient(_sqlite_engine(tmp_path / "external_bulk.db"))
+    client.execute("CREATE TABLE source (id INTEGER, value TEXT)")
+    client.execute_many(
+        "INSERT INTO source (id, value) VALUES (:id, :value)",
+        [{"id": i, "value": f"item-{i}"} for i in range(5)],
+    )
+
+    bridge = DatabaseBridgeService(SessionLocal, client)
+    inserted = bridge.import_external_rows(
+        "SELECT id, value FROM source ORDER BY id",
+        destination,
+        lambda row: None if row["id"] == 2 else {"id": row["id"], "value": row["value"].upper()},
+        commit_interval=2,
+    )
+
+    assert inserted == 4
+    with SessionLocal() as session:
+        result = session.execute(select(destination.c.id, destination.c.value).order_by(destination.c.id))
+        assert result.all() == [(0, "ITEM-0"), (1, "ITEM-1"), (3, "ITEM-3"), (4, "ITEM-4")]
+
+
+def test_external_sql_client_streams_with_prefetch(tmp_path):
+    client = ExternalSQLClient(_sqlite_engine(tmp_path / "external_prefetch.db"))
+    client.execute("CREATE TABLE payload (id INTEGER)")
+    client.execute_many(
+        "INSERT INTO payload (id) VALUES (:id)", [{"id": i} for i in range(7)]
+    )
+
+    streamed = client.stream(
+        "SELECT id FROM payload ORDER BY id", chunk_size=2, prefetch=2, row_factory=dict
+    )
+    assert list(streamed) == [{"id": i} for i in range(7)]
+
+    # Stopping early must release the producer thread.
+    partial = client.stream("SELECT id FROM payload ORDER BY id", chunk_size=1, prefetch=1)
+    assert next(partial)["id"] == 0
+    partial.close()
+
+    with pytest.raises(ExternalSQLBridgeError):
+        list(client.stream("SELECT missing FROM payload", prefetch=1))
+
+
+def test_copy_text_encoding_escapes_specials_and_nulls(tmp_path):
+    from app.integrations.sql_bridge import _copy_text_line
+
+    assert _copy_text_line([1, None, "a\tb\\c\n", True]) == "1\t\\N\ta\\tb\\\\c\\n\tTrue\n"
+    assert ExternalSQLClient(_sqlite_engine(tmp_path / "x.db")).supports_copy is False
+
+
+def test_copy_text_encoding_round_trips_structured_values():
+    import json
+    import re
+    from datetime import timedelta
+
+    from app.integrations.sql_bridge import _copy_text_line
+
+    row = [
+        b"\x00\x01\xff",
+        {"curso": "PRL", "horas": [1, 2]},
+        ["a", 'b"c', None, "d\\e"],
+        [[1, 2], [3, 4]],
+        timedelta(days=1, seconds=5, microseconds=7),
+    ]
+    line = _copy_text_line(row)
+    assert line.endswith("\n")
+
+    # Undo COPY's text escaping to recover what PostgreSQL's input functions see.
+    unescape = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+    fields = [
+        re.sub(r"\\(.)", lambda match: unescape[match.group(1)], field)
+        for field in line[:-1].split("\t")
+    ]
+    bytea, document, array, matrix, interval = fields
+
+    assert bytea.startswith("\\x") and bytes.fromhex(bytea[2:]) == row[0]
+    assert json.loads(document) == row[1]
+    assert array == '{"a","b\\"c",NULL,"d\\\\e"}'
+    assert matrix == '{{"1","2"},{"3","4"}}'
+    assert interval == "1 days 5 seconds 7 microseconds"
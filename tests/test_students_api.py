@@ -110,3 +110,48 @@ def test_list_students_non_compliance_filters(monkeypatch):
             deadline_before="2024-05-01", session=session
         )
         assert data["total"] == 0
+
+
+def test_list_students_paginates_in_sql_with_lowered_rules():
+    SessionFactory = _create_session_factory()
+
+    with SessionFactory() as session:
+        course = Course(
+            name="PRL Básico",
+            hours_required=8,
+            deadline_date=date(2024, 5, 20),
+            source="xlsx",
+        )
+        session.add(course)
+        session.flush()
+
+        for index, hours in enumerate([2.0, 3.0, 9.0, 1.0]):
+            student = Student(
+                full_name=f"Alumno {index}",
+                email=f"alumno{index}@example.com",
+                course="PRL Básico",
+                certificate_expires_at=date(2999, 1, 1),
+            )
+            session.add(student)
+            session.flush()
+            session.add(
+                Enrollment(
+                    course_id=course.id,
+                    student_id=student.id,
+                    progress_hours=hours,
+                    status="active",
+                )
+            )
+        session.commit()
+
+    with SessionFactory() as session:
+        data = students_module.list_non_compliant_students(
+            limit=2, offset=1, session=session
+        )
+
+    assert data["total"] == 3
+    assert [item["student"]["full_name"] for item in data["items"]] == [
+        "Alumno 1",
+        "Alumno 3",
+    ]
+    assert all(item["violations"] == ["horas_insuficientes"] for item in data["items"])
@@ -8,7 +8,7 @@ from tempfile import SpooledTemporaryFile
 
 import pandas as pd
 import pytest
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile
 from sqlalchemy import create_engine, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
@@ -94,6 +94,17 @@ def test_parse_xlsx_identifies_missing_columns(tmp_path):
     assert any("Columnas faltantes" in error for error in summary.errors)
 
 
+def test_parse_xlsx_matches_openpyxl_with_preferred_engine(monkeypatch, valid_workbook):
+    from app.modules.ingest import xlsx_importer
+
+    preferred = parse_xlsx(valid_workbook)
+    monkeypatch.setattr(xlsx_importer, "EXCEL_ENGINE", "openpyxl")
+    fallback = parse_xlsx(valid_workbook)
+
+    assert preferred == fallback
+    assert preferred.is_valid
+
+
 def test_upload_endpoint_creates_metadata_record(monkeypatch, tmp_path, db_session, valid_workbook):
     monkeypatch.setattr(uploads_module, "UPLOADS_DIR", tmp_path / "uploads")
 
@@ -188,3 +199,218 @@ def test_upload_endpoint_returns_summary_on_invalid_xlsx(monkeypatch, tmp_path,
     assert payload["ingest"]["enrollments_created"] == 0
     assert payload["summary"]["errors"]
     assert "No se pudo abrir el fichero XLSX" in payload["summary"]["errors"][0]
+
+
+def test_upload_endpoint_rejects_oversized_file_without_leaving_it_on_disk(
+    monkeypatch, tmp_path, db_session
+):
+    uploads_dir = tmp_path / "uploads"
+    monkeypatch.setattr(uploads_module, "UPLOADS_DIR", uploads_dir)
+    monkeypatch.setattr(uploads_module, "MAX_FILE_SIZE", 1024)
+    monkeypatch.setattr(uploads_module, "UPLOAD_CHUNK_SIZE", 256)
+
+    spooled = SpooledTemporaryFile()
+    spooled.write(b"x" * 2048)
+    spooled.seek(0)
+
+    headers = Headers({"content-type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"})
+    upload = UploadFile(file=spooled, filename="enorme.xlsx", headers=headers)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(uploads_module.upload_file(file=upload, db=db_session))
+
+    assert excinfo.value.status_code == 400
+    assert list(uploads_dir.iterdir()) == []
+
+
+def test_upload_endpoint_can_defer_ingestion_to_queue(
+    monkeypatch, tmp_path, db_session, valid_workbook
+):
+    monkeypatch.setattr(uploads_module, "UPLOADS_DIR", tmp_path / "uploads")
+
+    enqueued = []
+
+    class FakeQueue:
+        def enqueue(self, func, *args):
+            enqueued.append((func, args))
+            return types.SimpleNamespace(id="job-123")
+
+    monkeypatch.setattr(uploads_module, "ingest_queue", FakeQueue())
+
+    spooled = SpooledTemporaryFile()
+    spooled.write(valid_workbook.read_bytes())
+    spooled.seek(0)
+
+    headers = Headers({"content-type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"})
+    upload = UploadFile(file=spooled, filename="diferido.xlsx", headers=headers)
+
+    response = asyncio.run(
+        uploads_module.upload_file(file=upload, background=True, db=db_session)
+    )
+
+    assert response.status_code == 202
+    assert len(enqueued) == 1
+    func, args = enqueued[0]
+    assert func is uploads_module.ingest_upload
+    upload_id, stored_path, label = args
+    assert Path(stored_path).exists()
+    assert label == "diferido.xlsx"
+
+    status_payload = uploads_module.upload_status(upload_id=upload_id, db=db_session)
+    assert status_payload["status"] == "queued"
+    assert "summary" not in status_payload
+
+
+def test_upload_endpoint_marks_upload_failed_when_enqueue_fails(
+    monkeypatch, tmp_path, db_session, valid_workbook
+):
+    monkeypatch.setattr(uploads_module, "UPLOADS_DIR", tmp_path / "uploads")
+    statuses: list[str] = []
+
+    class BrokenQueue:
+        def enqueue(self, func, upload_id, *args):
+            statuses.append(db_session.get(UploadedFile, upload_id).status)
+            raise ConnectionError("redis no disponible")
+
+    monkeypatch.setattr(uploads_module, "ingest_queue", BrokenQueue())
+
+    spooled = SpooledTemporaryFile()
+    spooled.write(valid_workbook.read_bytes())
+    spooled.seek(0)
+    headers = Headers({"content-type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"})
+    upload = UploadFile(file=spooled, filename="sin_cola.xlsx", headers=headers)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(uploads_module.upload_file(file=upload, background=True, db=db_session))
+
+    stored = db_session.scalars(
+        select(UploadedFile).where(UploadedFile.original_name == "sin_cola.xlsx")
+    ).one()
+    assert statuses == ["queued"]
+    assert stored.status == "failed"
+    assert stored.error == "redis no disponible"
+
+
+def test_ingest_workbook_prefetches_existing_entities(valid_workbook):
+    from sqlalchemy import event
+
+    from app.modules.ingest import course_loader
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, future=True)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, future=True)
+
+    with Session() as session:
+        first = course_loader.ingest_workbook(valid_workbook, db=session)
+    assert first.stats.enrollments_created == 2
+
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    with Session() as session:
+        second = course_loader.ingest_workbook(valid_workbook, db=session)
+
+    assert second.stats.students_created == 0
+    assert second.stats.enrollments_created == 0
+    assert second.stats.enrollments_updated == 0
+    assert sum(statement.lstrip().upper().startswith("SELECT") for statement in statements) == 3
+
+
+def test_ingest_workbook_reads_only_mapped_columns_once(monkeypatch, tmp_path):
+    from app.modules.ingest import course_loader
+
+    dataframe = pd.DataFrame(
+        {
+            "Nombre": ["Ana"],
+            "Apellidos": ["García"],
+            "Correo": ["ana@example.com"],
+            "Tiempo total": ["02h 15m 00s"],
+            "Notas internas": ["no se importa"],
+        }
+    )
+    workbook_path = tmp_path / "extra.xlsx"
+    dataframe.to_excel(workbook_path, index=False, sheet_name="reporte")
+
+    reads: list[pd.DataFrame] = []
+    read_excel = pd.read_excel
+
+    def counting_read_excel(*args, **kwargs):
+        result = read_excel(*args, **kwargs)
+        reads.append(result)
+        return result
+
+    monkeypatch.setattr(pd, "read_excel", counting_read_excel)
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, future=True)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine, future=True)() as session:
+        result = course_loader.ingest_workbook(workbook_path, db=session)
+
+    assert result.stats.enrollments_created == 1
+    assert len(reads) == 1
+    assert "Notas internas" not in reads[0].columns
+
+
+def test_ingest_workbook_keeps_last_row_per_enrollment(tmp_path):
+    from app.modules.ingest import course_loader
+
+    dataframe = pd.DataFrame(
+        {
+            "Nombre": ["Ana", "Juan", "Ana", None],
+            "Apellidos": ["García", "Rodríguez", "García López", "Sin correo"],
+            "Correo": ["ana@example.com", "juan@example.com", "ana@example.com", None],
+            "Tiempo total": ["01h 00m 00s", "00h 30m 00s", "02h 00m 00s", "01h 00m 00s"],
+        }
+    )
+    workbook_path = tmp_path / "duplicados.xlsx"
+    dataframe.to_excel(workbook_path, index=False, sheet_name="reporte")
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, future=True)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine, future=True)() as session:
+        result = course_loader.ingest_workbook(workbook_path, db=session)
+        ana = session.scalars(select(Student).where(Student.email == "ana@example.com")).one()
+        progress = session.scalars(
+            select(Enrollment.progress_hours).where(Enrollment.student_id == ana.id)
+        ).all()
+
+    assert result.stats.students_created == 2
+    assert result.stats.students_updated == 0
+    assert result.stats.enrollments_created == 2
+    assert result.stats.enrollments_updated == 0
+    assert ana.full_name == "Ana García López"
+    assert progress == [2.0]
+
+
+def test_normalize_rows_resolves_fields_column_wise():
+    import numpy as np
+
+    from app.modules.ingest import course_loader, xlsx_importer
+
+    column_map = {
+        "email": xlsx_importer.ColumnConfig(sources=("Correo", "Email"), required=True),
+        "telefono": xlsx_importer.ColumnConfig(sources=("Móvil", "Teléfono"), required=False),
+        "total_time": xlsx_importer.ColumnConfig(sources=("Tiempo total",), required=True),
+    }
+    dataframe = pd.DataFrame(
+        {
+            "Correo": ["  ana@example.com ", "   ", None],
+            "Email": ["otra@example.com", "luis@example.com", np.nan],
+            "Móvil": [np.nan, np.nan, np.nan],
+            "Teléfono": [600111222, 600333444, 600555666],
+            "Tiempo total": ["1h 30m", "No visitado", 2],
+        }
+    )
+
+    rows = course_loader._normalize_rows(
+        dataframe, column_map, {"course_name": "Curso {workbook_label}"}, {"workbook_label": "PRL"}
+    )
+
+    assert [row["email"] for row in rows] == ["ana@example.com", "luis@example.com", None]
+    assert [row["telefono"] for row in rows] == ["600111222", "600333444", "600555666"]
+    assert [row["progress_hours"] for row in rows] == [1.5, 0.0, 2.0]
+    assert {row["course_name"] for row in rows} == {"Curso PRL"}
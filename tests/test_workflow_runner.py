@@ -111,3 +111,29 @@ def test_workflow_runner_execute(monkeypatch, tmp_path):
     job_name, options = queue.calls[0]
     assert job_name == "app.notify.worker.dispatch"
     assert options["kwargs"]["action"]["channel"] == "whatsapp"
+
+
+def test_workflow_runner_caches_parsed_files_until_modified(monkeypatch, tmp_path):
+    import os
+
+    playbook_path = create_playbook(tmp_path)
+    runner = WorkflowRunner(playbooks_dir=tmp_path, queue=StubQueue())
+    monkeypatch.setattr(WorkflowRunner, "_load_dataframe", lambda self, _pb: dataframe())
+
+    parsed: list[Path] = []
+    original_parse = WorkflowRunner._parse_playbook
+
+    def counting_parse(self, path):
+        parsed.append(path)
+        return original_parse(self, path)
+
+    monkeypatch.setattr(WorkflowRunner, "_parse_playbook", counting_parse)
+
+    runner.run("demo_playbook", dry_run=True)
+    runner.run("demo_playbook", dry_run=True)
+    assert len(parsed) == 1
+
+    stat = playbook_path.stat()
+    os.utime(playbook_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    runner.run("demo_playbook", dry_run=True)
+    assert len(parsed) == 2